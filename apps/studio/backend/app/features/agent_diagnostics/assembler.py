@@ -8,6 +8,7 @@ from typing import Any
 from app.features.agent_diagnostics.contract import (
     AgentDefinitionContext,
     AgentEvidenceError,
+    ModelRequestChain,
     cancellation_evidence,
     candidate_present,
     diagnostic,
@@ -19,6 +20,7 @@ from app.features.agent_diagnostics.contract import (
     operation_outcome,
     parse_agent_usage,
     parse_candidate,
+    parse_model_request,
     parse_model_usage,
     parse_time,
     payload_slot_present,
@@ -650,6 +652,7 @@ def _model_operation(
     owner_termination: str,
     next_tool_ordinal: int | None,
     definition_context: AgentDefinitionContext | None,
+    request_chain: ModelRequestChain,
     diagnostics: list[EvidenceDiagnostic],
 ) -> tuple[ModelOperation | None, int | None]:
     attributes = _attributes(span)
@@ -664,11 +667,10 @@ def _model_operation(
     if any(
         value is None for value in (sequence, ordinal, revision, driver, provider, model_name)
     ) or not isinstance(span_id, str):
+        request_chain.reset()
         return None, next_tool_ordinal
 
-    request, issues = parse_payload_slot(attributes, "junjo.agent.model.request", required=True)
-    diagnostics.extend(issues)
-    assert request is not None
+    request = parse_model_request(attributes, request_chain, diagnostics)
     validate_model_request(request, attributes, definition_context, diagnostics)
     candidate = parse_candidate(attributes, "junjo.agent.model.response_candidate", diagnostics)
     outcome = operation_outcome(span, attributes)
@@ -1903,6 +1905,7 @@ def assemble_agent_detail(
 
     operations: list[AgentOperation] = []
     next_tool_ordinal = 1
+    request_chain = ModelRequestChain()
     for span in sorted(eligible_operations, key=_operation_sort_key):
         operation_type = _attributes(span).get("junjo.agent.operation_type")
         if operation_type == "model_request":
@@ -1913,6 +1916,7 @@ def assemble_agent_detail(
                 summary.termination_reason,
                 next_tool_ordinal,
                 definition_context,
+                request_chain,
                 diagnostics,
             )
         elif operation_type == "tool":
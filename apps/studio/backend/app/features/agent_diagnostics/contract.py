@@ -23,6 +23,7 @@ from app.features.store_diagnostics.payloads import (
     NonPortableJsonValueError,
     PayloadNestingDepthError,
     decode_json_value,
+    missing_payload,
     parse_payload_slot,
 )
 from app.features.store_diagnostics.schemas import EvidenceDiagnostic, PayloadEvidence
@@ -30,6 +31,7 @@ from app.features.telemetry_contract.scalars import (
     ACTIVE_TELEMETRY_CONTRACT_VERSION,
     is_active_contract_version,
     is_contract_int,
+    is_lower_hex,
     is_portable_text,
     portable_diagnostic_text,
     span_evidence_path,
@@ -829,6 +831,161 @@ def _valid_message(value: Any) -> bool:
     return False
 
 
+MODEL_REQUEST_ROOT = "junjo.agent.model.request"
+
+
+@dataclass
+class ModelRequestChain:
+    """The previous resolved model request of one Agent run.
+
+    Delta-encoded requests carry only the messages appended since the previous
+    request, so assembly resolves model operations in ordinal order.
+    """
+
+    ordinal: int | None = None
+    value: dict[str, Any] | None = None
+    digest: str | None = None
+
+    def record(self, ordinal: Any, payload: PayloadEvidence, digest: str | None = None) -> None:
+        value = payload.value
+        if (
+            payload.mode == "full"
+            and isinstance(value, dict)
+            and isinstance(value.get("messages"), list)
+            and is_contract_int(ordinal, minimum=1)
+        ):
+            self.ordinal, self.value, self.digest = ordinal, value, digest
+        else:
+            self.reset()
+
+    def reset(self) -> None:
+        """Forget the previous request so a following delta cannot resolve."""
+        self.ordinal, self.value, self.digest = None, None, None
+
+    def transcript_digest(self) -> str | None:
+        """Return the chained digest of the previous request's messages."""
+        if self.value is None:
+            return None
+        if self.digest is None:
+            self.digest = transcript_digest("", self.value["messages"])
+        return self.digest
+
+
+def transcript_digest(previous: str, appended: list[Any]) -> str:
+    """Chain a request transcript digest over newly appended messages."""
+    return hashlib.sha256(previous.encode("ascii") + rfc8785.dumps(appended)).hexdigest()
+
+
+def parse_model_request(
+    attributes: dict[str, Any],
+    chain: ModelRequestChain,
+    diagnostics: list[EvidenceDiagnostic],
+) -> PayloadEvidence:
+    """Parse a model request slot, reassembling delta evidence from ``chain``.
+
+    A resolved delta is returned as full evidence under its delta policy.
+    """
+    ordinal = attributes.get("junjo.agent.model_request.ordinal")
+    if attributes.get(f"{MODEL_REQUEST_ROOT}.mode") != "delta":
+        request, issues = parse_payload_slot(attributes, MODEL_REQUEST_ROOT, required=True)
+        diagnostics.extend(issues)
+        assert request is not None
+        chain.record(ordinal, request)
+        return request
+
+    policy = attributes.get(f"{MODEL_REQUEST_ROOT}.policy")
+    delta = None
+    if (
+        is_portable_text(policy, nonempty=True)
+        and f"{MODEL_REQUEST_ROOT}.reference" not in attributes
+    ):
+        delta = parse_json_attribute(attributes, MODEL_REQUEST_ROOT, diagnostics)
+    valid = (
+        _exact_keys(
+            delta,
+            {
+                "v",
+                "agentKey",
+                "runId",
+                "ordinal",
+                "baseOrdinal",
+                "baseMessageCount",
+                "appendedMessages",
+                "messagesSha256",
+            },
+        )
+        and delta["v"] == 1
+        and type(delta["v"]) is int
+        and _is_nonempty_string(delta["agentKey"])
+        and _is_nonempty_string(delta["runId"])
+        and is_contract_int(delta["ordinal"], minimum=2)
+        and is_contract_int(delta["baseOrdinal"], minimum=1)
+        and is_contract_int(delta["baseMessageCount"])
+        and isinstance(delta["appendedMessages"], list)
+        and all(_valid_message(message) for message in delta["appendedMessages"])
+        and is_lower_hex(delta["messagesSha256"], length=64)
+    )
+    if not valid:
+        return _unresolved_model_request(
+            "invalid_model_request_delta", "Delta request shape is invalid.", chain, diagnostics
+        )
+    assert isinstance(delta, dict)
+    base = chain.value
+    if (
+        base is None
+        or delta["baseOrdinal"] != chain.ordinal
+        or delta["baseMessageCount"] != len(base["messages"])
+    ):
+        return _unresolved_model_request(
+            "model_request_delta_unresolved",
+            "Delta request does not extend the previous model request.",
+            chain,
+            diagnostics,
+        )
+    try:
+        base_digest = chain.transcript_digest()
+        assert base_digest is not None
+        digest = transcript_digest(base_digest, delta["appendedMessages"])
+    except rfc8785.CanonicalizationError:
+        digest = None
+    if digest != delta["messagesSha256"]:
+        return _unresolved_model_request(
+            "model_request_delta_digest_mismatch",
+            "Reassembled request messages do not match the delta digest.",
+            chain,
+            diagnostics,
+        )
+    request = PayloadEvidence(
+        mode="full",
+        policy=policy,
+        value={
+            "v": 1,
+            "agentKey": delta["agentKey"],
+            "runId": delta["runId"],
+            "ordinal": delta["ordinal"],
+            "instructions": base.get("instructions"),
+            "messages": [*base["messages"], *delta["appendedMessages"]],
+            "tools": base.get("tools"),
+            "outputSchema": base.get("outputSchema"),
+        },
+    )
+    chain.record(ordinal, request, digest)
+    return request
+
+
+def _unresolved_model_request(
+    code: str,
+    message: str,
+    chain: ModelRequestChain,
+    diagnostics: list[EvidenceDiagnostic],
+) -> PayloadEvidence:
+    payload, issues = missing_payload(MODEL_REQUEST_ROOT, message)
+    issues[0].code = code
+    diagnostics.extend(issues)
+    chain.reset()
+    return payload
+
+
 def validate_model_request(
     payload: PayloadEvidence,
     operation_attributes: dict[str, Any],
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import copy
+import hashlib
 import importlib.util
 import json
 from collections.abc import Callable
@@ -10,9 +11,14 @@ from pathlib import Path
 from typing import Any
 
 import pytest
+import rfc8785
 
 from app.features.agent_diagnostics.assembler import _requested_calls, assemble_agent_detail
-from app.features.agent_diagnostics.contract import AgentDefinitionContext, AgentEvidenceError
+from app.features.agent_diagnostics.contract import (
+    AgentDefinitionContext,
+    AgentEvidenceError,
+    transcript_digest,
+)
 
 GENERATOR_PATH = Path(__file__).parent / "generate_agent_semantic_projections.py"
 SPEC = importlib.util.spec_from_file_location("agent_projection_generator", GENERATOR_PATH)
@@ -275,6 +281,96 @@ def test_redacted_operation_payloads_do_not_create_false_integrity_failures() ->
     assert detail.operations[0].usage is not None
 
 
+def _delta_encoded_fixture() -> tuple[dict[str, Any], list[dict[str, Any]], dict[str, Any]]:
+    fixture_path = GENERATOR.FIXTURE_ROOT / "producer" / "ordered_multiple_tools.json"
+    fixture = copy.deepcopy(json.loads(fixture_path.read_text()))
+    owner = next(
+        span
+        for span in fixture["spans"]
+        if span["attributes_json"].get("junjo.span_type") == "agent"
+    )
+    first, second = sorted(
+        (
+            span["attributes_json"]
+            for span in fixture["spans"]
+            if span["attributes_json"].get("junjo.agent.operation_type") == "model_request"
+        ),
+        key=lambda attributes: attributes["junjo.agent.model_request.ordinal"],
+    )
+    base = json.loads(first["junjo.agent.model.request"])
+    full = json.loads(second["junjo.agent.model.request"])
+    appended = full["messages"][len(base["messages"]) :]
+    base_digest = hashlib.sha256(rfc8785.dumps(base["messages"])).hexdigest()
+    second["junjo.agent.model.request"] = json.dumps(
+        {
+            "v": 1,
+            "agentKey": full["agentKey"],
+            "runId": full["runId"],
+            "ordinal": full["ordinal"],
+            "baseOrdinal": base["ordinal"],
+            "baseMessageCount": len(base["messages"]),
+            "appendedMessages": appended,
+            "messagesSha256": hashlib.sha256(
+                base_digest.encode() + rfc8785.dumps(appended)
+            ).hexdigest(),
+        }
+    )
+    second["junjo.agent.model.request.mode"] = "delta"
+    second["junjo.agent.model.request.policy"] = "junjo.delta.v1"
+    return owner, fixture["spans"], full
+
+
+def test_delta_encoded_model_request_is_reassembled_from_the_previous_request() -> None:
+    owner, spans, full = _delta_encoded_fixture()
+
+    detail = assemble_agent_detail(owner, spans)
+
+    assert detail.integrity.status == "complete"
+    requests = [
+        operation.request
+        for operation in detail.operations
+        if operation.operation_type == "model_request"
+    ]
+    assert requests[1].mode == "full"
+    assert requests[1].policy == "junjo.delta.v1"
+    assert requests[1].value == full
+
+
+def test_delta_encoded_model_request_with_wrong_digest_is_partial() -> None:
+    owner, spans, _ = _delta_encoded_fixture()
+    for span in spans:
+        attributes = span["attributes_json"]
+        if attributes.get("junjo.agent.model.request.mode") == "delta":
+            payload = json.loads(attributes["junjo.agent.model.request"])
+            payload["appendedMessages"] = payload["appendedMessages"][:-1]
+            attributes["junjo.agent.model.request"] = json.dumps(payload)
+
+    detail = assemble_agent_detail(owner, spans)
+
+    assert detail.integrity.status != "complete"
+    assert "model_request_delta_digest_mismatch" in {
+        issue.code for issue in detail.integrity.diagnostics
+    }
+
+
+def test_every_shared_transcript_digest_vector_matches_the_consumer_chain() -> None:
+    fixture_path = (
+        GENERATOR.REPOSITORY_ROOT
+        / "contracts"
+        / "telemetry"
+        / "fixtures"
+        / "fingerprints"
+        / "transcript-digest-v1.json"
+    )
+    fixture = json.loads(fixture_path.read_text())
+
+    for vector in fixture["vectors"]:
+        digest = ""
+        for request in vector["requests"]:
+            digest = transcript_digest(digest, request["appendedMessages"])
+            assert digest == request["messagesSha256"], vector["name"]
+
+
 def test_schema_shaped_redacted_definition_is_not_treated_as_original_content() -> None:
     fixture_path = GENERATOR.FIXTURE_ROOT / "producer" / "direct_typed_completion.json"
     fixture = copy.deepcopy(json.loads(fixture_path.read_text()))
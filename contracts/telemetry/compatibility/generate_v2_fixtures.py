@@ -2591,6 +2591,78 @@ def _write_fingerprint_vectors() -> None:
     _write(FINGERPRINT_ROOT / "agent-structural-v1.json", {"v": 1, "vectors": vectors})
 
 
+def _transcript_digest_requests(*appended_batches: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    requests: list[dict[str, Any]] = []
+    digest = ""
+    for appended in appended_batches:
+        digest = hashlib.sha256(digest.encode("ascii") + canonical_json_dumps(appended)).hexdigest()
+        requests.append({"appendedMessages": appended, "messagesSha256": digest})
+    return requests
+
+
+def _write_transcript_digest_vectors() -> None:
+    call = {"id": "call-1", "name": "lookup", "arguments": {"query": "q1"}}
+    _write(
+        FINGERPRINT_ROOT / "transcript-digest-v1.json",
+        {
+            "v": 1,
+            "vectors": [
+                {
+                    "name": "tool_round_trip",
+                    "requests": _transcript_digest_requests(
+                        [{"type": "agent_input", "input": {"question": "fixture?"}}],
+                        [
+                            {"type": "assistant_tool_calls", "calls": [call], "assistantText": "Using tools"},
+                            {
+                                "type": "tool_result",
+                                "callId": "call-1",
+                                "toolName": "lookup",
+                                "result": {"value": "result-1"},
+                            },
+                        ],
+                        [
+                            {
+                                "type": "assistant_tool_calls",
+                                "calls": [{**call, "id": "call-2", "arguments": {"query": "q2"}}],
+                            },
+                            {
+                                "type": "tool_result",
+                                "callId": "call-2",
+                                "toolName": "lookup",
+                                "result": {"value": "result-2"},
+                            },
+                        ],
+                    ),
+                },
+                {
+                    "name": "empty_append",
+                    "requests": _transcript_digest_requests(
+                        [{"type": "agent_input", "input": {"question": "fixture?"}}],
+                        [],
+                    ),
+                },
+                {
+                    "name": "canonical_numbers_and_text",
+                    "requests": _transcript_digest_requests(
+                        [
+                            {
+                                "type": "agent_input",
+                                "input": {
+                                    "zeta": -0.0,
+                                    "alpha": [1e30, 1e-7, 9007199254740991],
+                                    "composed": "é",
+                                    "decomposed": "é",
+                                    "escaped": "line\nbreak \u2028",
+                                },
+                            }
+                        ],
+                    ),
+                },
+            ],
+        },
+    )
+
+
 def _write_store_patch_vectors() -> None:
     _write(
         STORE_FIXTURE_ROOT / "rfc6902-replay.json",
@@ -2665,6 +2737,7 @@ def generate_agent_fixtures() -> None:
         _write(AGENT_CONSUMER_ROOT / f"{scenario}.json", case)
     _make_invalid_derivatives(valid_cases)
     _write_fingerprint_vectors()
+    _write_transcript_digest_vectors()
     _write_store_patch_vectors()
 
 
@@ -2365,7 +2365,55 @@ def _validate_fingerprints() -> int:
         raise ContractValidationError(
             "fingerprint_invalid_ijson_accepted", repr(invalid)
         )
-    return len(vectors) + _validate_schema_normalization_vectors()
+    return (
+        len(vectors)
+        + _validate_schema_normalization_vectors()
+        + _validate_transcript_digest_vectors()
+    )
+
+
+def _validate_transcript_digest_vectors() -> int:
+    path = FIXTURE_ROOT / "fingerprints" / "transcript-digest-v1.json"
+    fixture = _load_json(path)
+    _require(fixture.get("v") == 1, "fingerprint_version_mismatch", path.name)
+    vectors = fixture.get("vectors")
+    _require(isinstance(vectors, list) and vectors, "missing_transcript_digest_vectors", path.name)
+
+    names: set[str] = set()
+    for vector in vectors:
+        _require(isinstance(vector, dict), "invalid_transcript_digest_vector", path.name)
+        name = vector.get("name")
+        requests = vector.get("requests")
+        _require(
+            isinstance(name, str) and name not in names,
+            "invalid_transcript_digest_vector",
+            path.name,
+        )
+        _require(
+            isinstance(requests, list) and requests,
+            "invalid_transcript_digest_vector",
+            str(name),
+        )
+        names.add(name)
+        digest = ""
+        for request in requests:
+            _require(isinstance(request, dict), "invalid_transcript_digest_vector", str(name))
+            appended = request.get("appendedMessages")
+            _require(isinstance(appended, list), "invalid_transcript_digest_vector", str(name))
+            digest = hashlib.sha256(
+                digest.encode("ascii") + canonical_json_dumps(appended)
+            ).hexdigest()
+            _require(
+                request.get("messagesSha256") == digest,
+                "transcript_digest_mismatch",
+                str(name),
+            )
+    _require(
+        {"tool_round_trip", "empty_append", "canonical_numbers_and_text"} <= names,
+        "missing_transcript_digest_vectors",
+        path.name,
+    )
+    return len(vectors)
 
 
 def _validate_schema_normalization_vectors() -> int:
@@ -7,6 +7,7 @@ results.
 """
 import logging
 
+from ._json import get_json_encoder, set_json_encoder
 from .agent import (
     Agent,
     AgentConfigurationError,
@@ -21,6 +22,7 @@ from .agent import (
     ModelDriverDescriptor,
     Tool,
 )
+from .cache import CachedNode, InMemoryNodeCache, NodeCache, SQLiteNodeCache
 from .condition import Condition
 from .correlation import ExecutionCorrelation
 from .edge import Edge
@@ -36,16 +38,19 @@ from .graph import (
     GraphValidationError,
 )
 from .hooks import Hooks
-from .node import Node
-from .run_concurrent import RunConcurrent
+from .node import CpuBoundNode, Node
+from .run_concurrent import MapNode, RunConcurrent, RunMap, current_map_item
 from .state import BaseState
-from .store import BaseStore
+from .store import BaseStore, store_action
 from .workflow import (
     ExecutionResult,
     GraphFactory,
     StoreFactory,
     Subflow,
     Workflow,
+    WorkflowBatch,
+    WorkflowBatchItem,
+    WorkflowBatchStats,
 )
 from .workflow_errors import WorkflowCancelledError, WorkflowExecutionError
 
@@ -79,14 +84,28 @@ __all__ = [
     "ExecutionCorrelation",
     "NodeEvaluationResult",
     "evaluate_node",
+    "get_json_encoder",
+    "set_json_encoder",
     "Workflow",
+    "WorkflowBatch",
+    "WorkflowBatchItem",
+    "WorkflowBatchStats",
     "WorkflowCancelledError",
     "WorkflowExecutionError",
     "Subflow",
     "Tool",
     "Node",
+    "CpuBoundNode",
+    "CachedNode",
+    "NodeCache",
+    "InMemoryNodeCache",
+    "SQLiteNodeCache",
     "RunConcurrent",
+    "RunMap",
+    "MapNode",
+    "current_map_item",
     "BaseState",
     "BaseStore",
+    "store_action",
     "Edge",
 ]
@@ -6,7 +6,12 @@ import json
 import math
 from collections.abc import Mapping
 from types import MappingProxyType
-from typing import TypeAlias, cast
+from typing import Literal, TypeAlias, cast
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when the optional extra is absent
+    orjson = None
 
 JsonScalar: TypeAlias = None | bool | int | float | str
 JsonValue: TypeAlias = JsonScalar | list["JsonValue"] | dict[str, "JsonValue"]
@@ -14,6 +19,7 @@ FrozenJsonValue: TypeAlias = JsonScalar | tuple["FrozenJsonValue", ...] | Mappin
 
 MAX_IJSON_INTEGER = 9_007_199_254_740_991
 MAX_JSON_NESTING_DEPTH = 128
+_SCALAR_TYPES = (bool, int, float, str)
 
 
 class JsonBoundaryError(ValueError):
@@ -27,32 +33,23 @@ class JsonNestingDepthError(JsonBoundaryError):
 def freeze_json(value: object) -> FrozenJsonValue:
     """Validate I-JSON portability and recursively freeze an owned value."""
 
-    validate_json_nesting(value)
-    return _freeze_json(value)
+    return _freeze_json(value, 0)
 
 
-def _freeze_json(value: object) -> FrozenJsonValue:
-    """Freeze one value after the iterative depth guard has succeeded."""
+def _freeze_json(value: object, depth: int) -> FrozenJsonValue:
+    """Freeze one value at ``depth``, enforcing the nesting bound on the way down."""
 
-    if value is None or isinstance(value, bool):
-        return value
-    if isinstance(value, str):
-        return require_ijson_text(value, "JSON string")
-    if isinstance(value, int):
-        return require_ijson_integer(value, "JSON integer")
-    if isinstance(value, float):
-        if not math.isfinite(value):
-            raise JsonBoundaryError("JSON numbers must be finite.")
-        return value
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return _require_json_scalar(value)
     if isinstance(value, list | tuple):
-        return tuple(_freeze_json(item) for item in value)
+        return tuple(_freeze_json(item, depth + 1) for item in value)
     if isinstance(value, Mapping):
         frozen: dict[str, FrozenJsonValue] = {}
         for key, item in value.items():
-            if not isinstance(key, str):
-                raise JsonBoundaryError("JSON object keys must be strings.")
-            require_ijson_text(key, "JSON object key")
-            frozen[key] = _freeze_json(item)
+            _require_object_key(key, depth + 1)
+            frozen[key] = _freeze_json(item, depth + 1)
         return MappingProxyType(frozen)
     raise JsonBoundaryError(f"Value of type {type(value).__name__} is not JSON-compatible.")
 
@@ -64,48 +61,131 @@ def validate_json_nesting(value: object) -> None:
     while pending:
         current, depth = pending.pop()
         if depth > MAX_JSON_NESTING_DEPTH:
-            raise JsonNestingDepthError(f"JSON nesting must not exceed {MAX_JSON_NESTING_DEPTH}.")
+            raise _nesting_depth_error()
+        if isinstance(current, list | tuple):
+            pending.extend((item, depth + 1) for item in current)
+        elif isinstance(current, Mapping):
+            for key, item in current.items():
+                pending.append((key, depth + 1))
+                pending.append((item, depth + 1))
+
+
+def json_nesting_depth(value: object) -> int:
+    """Return the deepest level reached by ``value``, counting object names as children.
+
+    A value embedded ``n`` levels below a root stays within the shared bound
+    while ``n`` plus this depth is at most ``MAX_JSON_NESTING_DEPTH``.
+    """
+
+    deepest = 0
+    pending: list[tuple[object, int]] = [(value, 0)]
+    while pending:
+        current, depth = pending.pop()
+        deepest = max(deepest, depth)
         if isinstance(current, list | tuple):
             pending.extend((item, depth + 1) for item in current)
         elif isinstance(current, Mapping):
             for key, item in current.items():
                 pending.append((key, depth + 1))
                 pending.append((item, depth + 1))
+    return deepest
+
+
+def require_json_nesting_depth(depth: int) -> None:
+    """Raise ``JsonNestingDepthError`` when ``depth`` exceeds the shared bound."""
+
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
 
 
 def thaw_json(value: FrozenJsonValue) -> JsonValue:
     """Return a detached mutable JSON representation of a frozen value."""
 
-    validate_json_nesting(value)
-    return _thaw_json(value)
+    return _thaw_json(value, 0)
 
 
-def _thaw_json(value: FrozenJsonValue) -> JsonValue:
-    """Thaw one value after the iterative depth guard has succeeded."""
+def _thaw_json(value: FrozenJsonValue, depth: int) -> JsonValue:
+    """Thaw one value at ``depth``, enforcing the nesting bound on the way down."""
 
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
     if isinstance(value, Mapping):
         result: dict[str, JsonValue] = {}
         for key, item in value.items():
             if not isinstance(key, str):
                 raise JsonBoundaryError("Frozen JSON object keys must be strings.")
-            result[key] = _thaw_json(cast(FrozenJsonValue, item))
+            if depth + 1 > MAX_JSON_NESTING_DEPTH:
+                raise _nesting_depth_error()
+            result[key] = _thaw_json(cast(FrozenJsonValue, item), depth + 1)
         return result
     if isinstance(value, tuple):
-        return [_thaw_json(item) for item in value]
+        return [_thaw_json(item, depth + 1) for item in value]
     return value
 
 
 def normalize_json(value: object) -> JsonValue:
-    """Validate and detach one mutable portable JSON projection."""
+    """Validate and detach one mutable portable JSON projection.
 
-    return thaw_json(freeze_json(value))
+    Validation, the nesting bound, and the detached copy are produced in a
+    single traversal; the result equals ``thaw_json(freeze_json(value))``.
+    """
 
+    return _normalize_json(value, 0)
 
-def json_dumps(value: object) -> str:
-    """Validate and serialize one portable JSON value deterministically."""
+
+def _normalize_json(value: object, depth: int) -> JsonValue:
+    """Validate and copy one value at ``depth``."""
+
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        return _require_json_scalar(value)
+    if isinstance(value, list | tuple):
+        return [_normalize_json(item, depth + 1) for item in value]
+    if isinstance(value, Mapping):
+        normalized: dict[str, JsonValue] = {}
+        for key, item in value.items():
+            _require_object_key(key, depth + 1)
+            normalized[key] = _normalize_json(item, depth + 1)
+        return normalized
+    raise JsonBoundaryError(f"Value of type {type(value).__name__} is not JSON-compatible.")
+
+
+# Flags reported by ``_scan_json``.
+_NEEDS_NORMALIZATION = 1  # a read-only or custom Mapping that encoders reject
+_EXPONENT_FLOAT = 2  # a float the stdlib writes with a zero-padded exponent
+
+
+def _scan_json(value: object, depth: int) -> int:
+    """Validate one value in place and report what encoding it as-is requires.
+
+    Invalid values raise exactly as :func:`normalize_json` would.
+    """
+
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
+    if value is None or isinstance(value, _SCALAR_TYPES):
+        _require_json_scalar(value)
+        return _EXPONENT_FLOAT if isinstance(value, float) and 0 < abs(value) < 1e-4 else 0
+    if isinstance(value, list | tuple):
+        flags = 0
+        for item in value:
+            flags |= _scan_json(item, depth + 1)
+        return flags
+    if isinstance(value, Mapping):
+        flags = 0 if isinstance(value, dict) else _NEEDS_NORMALIZATION
+        for key, item in value.items():
+            _require_object_key(key, depth + 1)
+            flags |= _scan_json(item, depth + 1)
+        return flags
+    raise JsonBoundaryError(f"Value of type {type(value).__name__} is not JSON-compatible.")
+
+
+def _encode_stdlib(value: object) -> str:
+    """Encode one validated value with the reference stdlib encoder."""
 
     return json.dumps(
-        normalize_json(value),
+        value,
         ensure_ascii=False,
         allow_nan=False,
         separators=(",", ":"),
@@ -113,6 +193,97 @@ def json_dumps(value: object) -> str:
     )
 
 
+def _encode_orjson(value: object) -> str:
+    """Encode one validated value with orjson, matching :func:`_encode_stdlib`."""
+
+    assert orjson is not None
+    return orjson.dumps(value, option=orjson.OPT_SORT_KEYS).decode()
+
+
+JsonEncoderName: TypeAlias = Literal["stdlib", "orjson"]
+"""A deterministic JSON text encoder backend.
+
+``"stdlib"`` is the reference encoder. ``"orjson"`` is an optional accelerator
+that produces byte-identical text; it is used by default when ``orjson`` is
+installed.
+"""
+
+_json_encoder: JsonEncoderName = "stdlib" if orjson is None else "orjson"
+
+
+def get_json_encoder() -> JsonEncoderName:
+    """Return the backend :func:`json_dumps` currently encodes with."""
+
+    return _json_encoder
+
+
+def set_json_encoder(name: JsonEncoderName) -> None:
+    """Select the backend :func:`json_dumps` encodes with.
+
+    :raises ValueError: If ``name`` is unknown or its package is not installed.
+    """
+
+    global _json_encoder
+    if name not in ("stdlib", "orjson"):
+        raise ValueError(f"Unknown JSON encoder: {name!r}.")
+    if name == "orjson" and orjson is None:
+        raise ValueError("The orjson JSON encoder requires the orjson package.")
+    _json_encoder = name
+
+
+def json_dumps(value: object) -> str:
+    """Validate and serialize one portable JSON value deterministically.
+
+    Values are validated in place and encoded directly; only values containing
+    read-only or custom mappings are first normalized into a detached copy.
+    The output is sorted, compact, non-ASCII-preserving JSON text and is
+    identical across encoder backends. Floats below ``1e-4`` in magnitude,
+    which orjson writes without the stdlib's padded exponent, always use the
+    stdlib encoder.
+    """
+
+    flags = _scan_json(value, 0)
+    if flags & _NEEDS_NORMALIZATION:
+        value = normalize_json(value)
+    if _json_encoder == "orjson" and not flags & _EXPONENT_FLOAT:
+        return _encode_orjson(value)
+    return _encode_stdlib(value)
+
+
+def _require_json_scalar(value: JsonScalar) -> JsonScalar:
+    """Return one portable scalar or raise ``JsonBoundaryError``."""
+
+    if isinstance(value, str):
+        return _require_portable_text(value, "JSON string")
+    if isinstance(value, int) and not isinstance(value, bool):
+        return require_ijson_integer(value, "JSON integer")
+    if isinstance(value, float) and not math.isfinite(value):
+        raise JsonBoundaryError("JSON numbers must be finite.")
+    return value
+
+
+def _nesting_depth_error() -> JsonNestingDepthError:
+    return JsonNestingDepthError(f"JSON nesting must not exceed {MAX_JSON_NESTING_DEPTH}.")
+
+
+def _require_object_key(key: object, depth: int) -> None:
+    """Validate one object name, which counts as a child for the nesting bound."""
+
+    if depth > MAX_JSON_NESTING_DEPTH:
+        raise _nesting_depth_error()
+    if not isinstance(key, str):
+        raise JsonBoundaryError("JSON object keys must be strings.")
+    _require_portable_text(key, "JSON object key")
+
+
+def _require_portable_text(value: str, name: str) -> str:
+    """Reject lone surrogates, skipping the UTF-8 round trip for ASCII text."""
+
+    if value.isascii():
+        return value
+    return require_ijson_text(value, name)
+
+
 def require_ijson_text(value: object, name: str, *, nonempty: bool = False) -> str:
     """Return a portable Unicode string or raise ``JsonBoundaryError``."""
 
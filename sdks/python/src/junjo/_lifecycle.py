@@ -4,9 +4,10 @@ import asyncio
 import inspect
 from collections.abc import Mapping
 from dataclasses import dataclass
-from typing import TYPE_CHECKING, TypeVar
+from typing import TYPE_CHECKING, Any, TypeVar
 
 from opentelemetry import trace
+from opentelemetry.trace import Span
 
 from . import hooks as hook_events
 from ._identity import ExecutableType
@@ -23,7 +24,7 @@ if TYPE_CHECKING:
     from .agent.errors import AgentExecutionError
     from .agent.result import AgentExecutionResult
     from .agent.state import AgentStateSnapshot
-    from .hooks import Hooks
+    from .hooks import HookBackpressure, HookCallback, Hooks
     from .state import BaseState
     from .workflow import ExecutionResult
 
@@ -37,6 +38,12 @@ class PreparedHookEvent:
     event: hook_events.LifecycleEvent
 
 
+@dataclass(frozen=True, slots=True)
+class _QueuedHookEvent:
+    prepared: PreparedHookEvent
+    span: Span
+
+
 @dataclass(frozen=True, slots=True)
 class AgentLifecycleIdentity:
     """Run-local identity required by every public Agent lifecycle event."""
@@ -69,8 +76,38 @@ class GraphStoreLifecycleContext:
 
 
 class LifecycleDispatcher:
-    def __init__(self, hooks: Hooks | None) -> None:
-        self._callbacks = hooks._snapshot() if hooks is not None else {}
+    def __init__(
+        self,
+        hooks: Hooks | None,
+        *,
+        snapshot: Mapping[str, tuple[HookCallback[Any], ...]] | None = None,
+    ) -> None:
+        # Batch execution takes one callback snapshot up front and shares it
+        # across every run instead of re-reading the registry per run.
+        if snapshot is None:
+            snapshot = hooks._snapshot() if hooks is not None else {}
+        # Only events with at least one callback stay in the snapshot, so key
+        # membership doubles as the per-event subscription flag.
+        self._callbacks = {event_name: callbacks for event_name, callbacks in snapshot.items() if callbacks}
+        self._concurrent_callbacks = hooks is not None and hooks._callback_concurrency == "concurrent"
+        self._queue: asyncio.Queue[_QueuedHookEvent | None] | None = None
+        self._backpressure: HookBackpressure = "block"
+        self._delivery_task: asyncio.Task[None] | None = None
+        self._closed = False
+        self._deferred_span_events: list[tuple[str, dict[str, str]]] = []
+        self.dropped_event_count = 0
+        if hooks is not None and hooks._delivery == "queued":
+            self._queue = asyncio.Queue(maxsize=hooks._max_queued_events)
+            self._backpressure = hooks._backpressure
+
+    def subscribes(self, event_name: str) -> bool:
+        """Return whether any callback was registered for ``event_name``.
+
+        Callers check this before building payloads that only hooks consume,
+        such as detached state copies, so unsubscribed events cost nothing.
+        """
+
+        return event_name in self._callbacks
 
     async def dispatch(
         self,
@@ -80,10 +117,84 @@ class LifecycleDispatcher:
     ) -> None:
         if prepared is None:
             return
+        if self._queue is not None and not self._closed and asyncio.current_task() is not self._delivery_task:
+            await self._enqueue(prepared)
+            return
+        await self._deliver(prepared, terminal=terminal)
+
+    async def close(self) -> None:
+        """Deliver every queued event and stop the background delivery task.
+
+        The run owner awaits this before its own terminal event, which is then
+        delivered inline. Hook errors whose emitting span already ended, and
+        the dropped-event count, are recorded on the current span.
+        """
+
+        if self._queue is None or self._closed:
+            return
+        self._closed = True
+        delivery_task = self._delivery_task
+        try:
+            if delivery_task is not None:
+                await self._queue.put(None)
+                await delivery_task
+        except asyncio.CancelledError:
+            if delivery_task is not None:
+                delivery_task.cancel()
+            while not self._queue.empty():
+                if self._queue.get_nowait() is not None:
+                    self.dropped_event_count += 1
+            raise
+        finally:
+            span = trace.get_current_span()
+            if span.is_recording():
+                for name, attributes in self._deferred_span_events:
+                    span.add_event(name, attributes)
+                span.set_attribute("junjo.hook.queue.dropped_count", self.dropped_event_count)
+            self._deferred_span_events.clear()
+
+    async def _enqueue(self, prepared: PreparedHookEvent) -> None:
+        queue = self._queue
+        assert queue is not None
+        if self._delivery_task is None:
+            self._delivery_task = asyncio.get_running_loop().create_task(self._deliver_queued())
+        if queue.full():
+            if self._backpressure == "drop_new":
+                self.dropped_event_count += 1
+                return
+            if self._backpressure == "drop_oldest":
+                queue.get_nowait()
+                queue.task_done()
+                self.dropped_event_count += 1
+        await queue.put(_QueuedHookEvent(prepared, trace.get_current_span()))
+
+    async def _deliver_queued(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        while True:
+            queued = await queue.get()
+            try:
+                if queued is None:
+                    return
+                await self._deliver(queued.prepared, span=queued.span)
+            finally:
+                queue.task_done()
+
+    async def _deliver(
+        self,
+        prepared: PreparedHookEvent,
+        *,
+        terminal: bool = False,
+        span: Span | None = None,
+    ) -> None:
+        callbacks = self._callbacks.get(prepared.event_name, ())
+        if self._concurrent_callbacks and len(callbacks) > 1:
+            await self._deliver_concurrently(prepared, callbacks, terminal=terminal, span=span)
+            return
 
         task = asyncio.current_task()
         cancellation_count_at_start = task.cancelling() if task is not None else 0
-        for callback in self._callbacks.get(prepared.event_name, ()):
+        for callback in callbacks:
             try:
                 result = callback(prepared.event)
                 if inspect.isawaitable(result):
@@ -94,9 +205,65 @@ class LifecycleDispatcher:
                     if terminal:
                         self._record_hook_delivery_cancelled(prepared.event_name, callback, exc)
                     raise
-                self._record_hook_error(prepared.event_name, callback, exc)
+                self._record_hook_error(prepared.event_name, callback, exc, span)
+            except Exception as exc:
+                self._record_hook_error(prepared.event_name, callback, exc, span)
+
+    async def _deliver_concurrently(
+        self,
+        prepared: PreparedHookEvent,
+        callbacks: tuple[HookCallback[Any], ...],
+        *,
+        terminal: bool,
+        span: Span | None,
+    ) -> None:
+        """Start every callback in registration order, then await the async ones together.
+
+        Each awaitable runs as its own task, so a callback that raises or
+        cancels itself is recorded without affecting its siblings. Cancelling
+        the delivering task cancels every callback still running.
+        """
+
+        pending: dict[asyncio.Future[Any], HookCallback[Any]] = {}
+        for callback in callbacks:
+            try:
+                result = callback(prepared.event)
             except Exception as exc:
-                self._record_hook_error(prepared.event_name, callback, exc)
+                self._record_hook_error(prepared.event_name, callback, exc, span)
+                continue
+            if inspect.isawaitable(result):
+                pending[asyncio.ensure_future(result)] = callback
+        if not pending:
+            return
+
+        try:
+            await asyncio.wait(pending)
+        except asyncio.CancelledError as exc:
+            await self._cancel_deliveries(prepared.event_name, pending, exc, terminal=terminal)
+            raise
+
+        for delivery, callback in pending.items():
+            try:
+                delivery.result()
+            except (asyncio.CancelledError, Exception) as exc:
+                self._record_hook_error(prepared.event_name, callback, exc, span)
+
+    async def _cancel_deliveries(
+        self,
+        event_name: str,
+        pending: dict[asyncio.Future[Any], HookCallback[Any]],
+        cancellation: asyncio.CancelledError,
+        *,
+        terminal: bool,
+    ) -> None:
+        for delivery in pending:
+            delivery.cancel()
+        await asyncio.wait(pending)
+        if not terminal:
+            return
+        for delivery, callback in pending.items():
+            if delivery.cancelled():
+                self._record_hook_delivery_cancelled(event_name, callback, cancellation)
 
     async def workflow_started(
         self,
@@ -118,6 +285,8 @@ class LifecycleDispatcher:
         parent_executable_type: ExecutableType | None,
     ) -> None:
         event_name = "subflow_started" if span_type is ExecutableType.SUBFLOW else "workflow_started"
+        if event_name not in self._callbacks:
+            return
         event_kwargs = {
             "run_id": run_id,
             "executable_definition_id": executable_definition_id,
@@ -161,9 +330,9 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
-            return None
         event_name = "subflow_completed" if span_type is ExecutableType.SUBFLOW else "workflow_completed"
+        if event_name not in self._callbacks:
+            return None
         event_kwargs = {
             "run_id": run_id,
             "executable_definition_id": executable_definition_id,
@@ -208,9 +377,9 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
-            return None
         event_name = "subflow_failed" if span_type is ExecutableType.SUBFLOW else "workflow_failed"
+        if event_name not in self._callbacks:
+            return None
         event_kwargs = {
             "run_id": run_id,
             "executable_definition_id": executable_definition_id,
@@ -256,9 +425,9 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
-            return None
         event_name = "subflow_cancelled" if span_type is ExecutableType.SUBFLOW else "workflow_cancelled"
+        if event_name not in self._callbacks:
+            return None
         event_kwargs = {
             "run_id": run_id,
             "executable_definition_id": executable_definition_id,
@@ -301,6 +470,8 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> None:
+        if "node_started" not in self._callbacks:
+            return
         await self.dispatch(
             PreparedHookEvent(
                 "node_started",
@@ -340,7 +511,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "node_completed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "node_completed",
@@ -380,7 +551,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "node_failed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "node_failed",
@@ -421,7 +592,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "node_cancelled" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "node_cancelled",
@@ -461,6 +632,8 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> None:
+        if "run_concurrent_started" not in self._callbacks:
+            return
         await self.dispatch(
             PreparedHookEvent(
                 "run_concurrent_started",
@@ -500,7 +673,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "run_concurrent_completed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "run_concurrent_completed",
@@ -540,7 +713,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "run_concurrent_failed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "run_concurrent_failed",
@@ -581,7 +754,7 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "run_concurrent_cancelled" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "run_concurrent_cancelled",
@@ -626,6 +799,8 @@ class LifecycleDispatcher:
         parent_executable_structural_id: str | None,
         parent_executable_type: ExecutableType | None,
     ) -> None:
+        if "state_changed" not in self._callbacks:
+            return
         await self.dispatch(
             PreparedHookEvent(
                 "state_changed",
@@ -655,6 +830,8 @@ class LifecycleDispatcher:
     async def agent_started(self, identity: AgentLifecycleIdentity) -> None:
         """Dispatch the admitted Agent start event from common identity fields."""
 
+        if "agent_started" not in self._callbacks:
+            return
         await self.dispatch(
             PreparedHookEvent(
                 "agent_started",
@@ -683,7 +860,7 @@ class LifecycleDispatcher:
         identity: AgentLifecycleIdentity,
         result: AgentExecutionResult,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "agent_completed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "agent_completed",
@@ -713,7 +890,7 @@ class LifecycleDispatcher:
         error: AgentExecutionError,
         state: AgentStateSnapshot,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "agent_failed" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "agent_failed",
@@ -744,7 +921,7 @@ class LifecycleDispatcher:
         reason: str,
         state: AgentStateSnapshot,
     ) -> PreparedHookEvent | None:
-        if not self._callbacks:
+        if "agent_cancelled" not in self._callbacks:
             return None
         return PreparedHookEvent(
             "agent_cancelled",
@@ -773,9 +950,14 @@ class LifecycleDispatcher:
         event_name: str,
         callback,
         exc: BaseException,
+        span: Span | None = None,
     ) -> None:
-        span = trace.get_current_span()
-        if not span.is_recording():
+        # Queued deliveries pass the span that emitted the event; once it has
+        # ended, the error is deferred to the run span when the queue closes.
+        deferred = span is not None
+        if span is None:
+            span = trace.get_current_span()
+        if not span.is_recording() and not deferred:
             return
 
         portable_event_name = portable_diagnostic_text(
@@ -793,7 +975,10 @@ class LifecycleDispatcher:
             "exception.message": message,
             "exception.stacktrace": exception_stacktrace(exc),
         }
-        span.add_event("junjo.hook_error", error_attributes)
+        if span.is_recording():
+            span.add_event("junjo.hook_error", error_attributes)
+        else:
+            self._deferred_span_events.append(("junjo.hook_error", error_attributes))
 
     def _record_hook_delivery_cancelled(
         self,
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import weakref
 from collections.abc import Iterable, Iterator, Mapping, Sequence
 from dataclasses import fields, is_dataclass
 from typing import cast
@@ -63,8 +64,27 @@ def _projection_children(value: object) -> Iterable[object]:
     return ()
 
 
-def validate_and_detach(adapter: TypeAdapter, value: object) -> tuple[object, FrozenJsonValue]:
-    """Validate a declared boundary and return typed and normalized detached values."""
+# Boundary adapters whose full stability proof has passed, and for which
+# value kinds: ``False`` for concrete JSON candidates, ``True`` for typed values.
+_PROVEN_ADAPTERS: weakref.WeakKeyDictionary[TypeAdapter, set[bool]] = weakref.WeakKeyDictionary()
+
+
+def validate_and_detach(
+    adapter: TypeAdapter,
+    value: object,
+    *,
+    strict: bool = False,
+) -> tuple[object, FrozenJsonValue]:
+    """Validate a declared boundary and return typed and normalized detached values.
+
+    The first value of each kind (concrete JSON or typed) an adapter accepts
+    takes the full stability proof: a second strict JSON round trip whose
+    dump must match, and for typed values exact type and equality. Once an
+    adapter has passed it, later values of that kind skip the proof and
+    cost one strict validation and one dump, plus the JSON validation that
+    detaches a typed value. Supplied JSON members are still checked on every
+    call. Pass ``strict=True`` to run the full proof every time.
+    """
 
     _reject_one_shot_iterators(value)
     try:
@@ -88,9 +108,14 @@ def validate_and_detach(adapter: TypeAdapter, value: object) -> tuple[object, Fr
             by_alias=True,
             by_name=False,
         )
+    typed = candidate is None
     normalized = freeze_json(adapter.dump_python(validated, mode="json", by_alias=True))
     if candidate is not None:
         _require_candidate_preserved(candidate, normalized)
+    proven = not strict and typed in _PROVEN_ADAPTERS.get(adapter, ())
+    if proven and not typed:
+        # Validated from JSON text, so it shares nothing with the caller's value.
+        return validated, normalized
     detached = adapter.validate_json(
         json_dumps(normalized),
         strict=True,
@@ -98,11 +123,14 @@ def validate_and_detach(adapter: TypeAdapter, value: object) -> tuple[object, Fr
         by_alias=True,
         by_name=False,
     )
-    if candidate is None:
+    if proven:
+        return detached, normalized
+    if typed:
         _require_typed_value_preserved(validated, detached)
     round_tripped = freeze_json(adapter.dump_python(detached, mode="json", by_alias=True))
     if json_dumps(round_tripped) != json_dumps(normalized):
         raise JsonBoundaryError("Declared boundary serialization must be stable after one strict JSON round trip.")
+    _PROVEN_ADAPTERS.setdefault(adapter, set()).add(typed)
     return detached, normalized
 
 
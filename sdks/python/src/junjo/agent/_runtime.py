@@ -44,6 +44,7 @@ from ..util import generate_safe_id
 from ._boundary import validate_and_detach
 from ._state import AgentState, AgentStore, initial_agent_state, snapshot_agent_state
 from ._telemetry import (
+    ModelRequestRecorder,
     diagnostic_candidate,
     finalize_agent_counts,
     initialize_agent_span,
@@ -80,7 +81,6 @@ from .messages import (
     ModelResponse,
     ToolCall,
     ToolCallsResponse,
-    ToolDefinition,
     ToolResultMessage,
     message_to_json,
     normalize_model_response,
@@ -114,6 +114,45 @@ class _PreparedToolCall:
     normalized_arguments: JsonValue
 
 
+class _ToolBatchSchedule:
+    """Ordering for one concurrently executed Tool batch.
+
+    Calls start in call order, at most ``limit`` run their services at once,
+    and results commit in call order, so operation sequences, the transcript,
+    and the final Store state match sequential execution. Store revisions do
+    not: each call commits its start bookkeeping as soon as it is admitted,
+    so later starts interleave with earlier result commits, and the revisions
+    recorded on Tool spans depend on how the services overlap.
+    """
+
+    def __init__(self, size: int, limit: int) -> None:
+        self._slots = asyncio.Semaphore(limit)
+        self._holding: set[int] = set()
+        self._started = [asyncio.Event() for _ in range(size)]
+        self._committed = [asyncio.Event() for _ in range(size)]
+
+    async def wait_to_start(self, index: int) -> None:
+        if index > 0:
+            await self._started[index - 1].wait()
+        await self._slots.acquire()
+        self._holding.add(index)
+
+    def mark_started(self, index: int) -> None:
+        self._started[index].set()
+
+    def release(self, index: int) -> None:
+        if index in self._holding:
+            self._holding.remove(index)
+            self._slots.release()
+
+    async def wait_to_commit(self, index: int) -> None:
+        if index > 0:
+            await self._committed[index - 1].wait()
+
+    def mark_committed(self, index: int) -> None:
+        self._committed[index].set()
+
+
 @dataclass(frozen=True, slots=True)
 class _PreparedCompletion(Generic[OutputT]):
     typed_output: OutputT
@@ -146,6 +185,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
         self._driver: ModelDriver | None = None
         self._tool_services: dict[str, ToolService] = {}
         self._tools_by_name = {tool.name: tool for tool in agent.tools}
+        self._request_recorder = ModelRequestRecorder(agent.request_telemetry)
         self._seen_call_ids = {
             call.id
             for message in transcript
@@ -154,10 +194,15 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
         }
 
     async def _get_state(self) -> AgentState:
-        """Read and remember detached evidence without making it recursive."""
+        """Read and remember the live revision without copying it.
 
-        state = await self.store.get_state()
-        self._last_known_state = state.model_copy(deep=True)
+        Committed revisions are never mutated in place and the runtime only
+        reads them, so a shared snapshot is enough. Diagnostic snapshots
+        detach what they keep, and emergency evidence is deep-copied on use.
+        """
+
+        state = await self.store.get_state(detached=False)
+        self._last_known_state = state
         return state
 
     def _get_last_known_state(self) -> AgentState:
@@ -208,15 +253,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                 ordinal=ordinal,
                 instructions=self.agent.instructions,
                 messages=self.transcript,
-                tools=[
-                    ToolDefinition(
-                        name=tool.name,
-                        description=tool.description,
-                        input_schema=tool.input_schema,
-                        output_schema=tool.output_schema,
-                    )
-                    for tool in self.agent.tools
-                ],
+                tools=self.agent.tool_definitions,
                 output_schema=self.agent.output_schema,
             )
             sequence = self.operation_count + 1
@@ -228,7 +265,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                 ordinal=ordinal,
             )
             span.set_attribute("junjo.agent.model_request.state_revision", revision)
-            set_full_payload(span, "junjo.agent.model.request", request.to_json())
+            self._request_recorder.record(span, request)
             self.operation_count = sequence
 
             with _operation_cancellation(
@@ -363,6 +400,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                 typed, normalized = validate_and_detach(
                     tool.input_adapter,
                     thaw_json(call.arguments),
+                    strict=self.agent.boundary_validation == "strict",
                 )
             except Exception as exc:
                 error = await self._record_invalid_tool_arguments(
@@ -382,8 +420,39 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
             )
 
         await self.store.admit_tool_batch([item.call.id for item in prepared])
-        for item in prepared:
-            await self._execute_tool(item)
+        if self.agent.tool_concurrency == 1 or len(prepared) == 1:
+            for item in prepared:
+                await self._execute_tool(item)
+            return
+        await self._execute_tools_concurrently(prepared)
+
+    async def _execute_tools_concurrently(self, prepared: Sequence[_PreparedToolCall]) -> None:
+        """Run one admitted batch with overlapping services and ordered commits.
+
+        Outcomes are observed in call order, so the failure raised is the one
+        sequential execution would have raised first. Calls after a failed call
+        are cancelled, including any whose services already started.
+        """
+
+        schedule = _ToolBatchSchedule(len(prepared), self.agent.tool_concurrency)
+
+        async def run_call(index: int, item: _PreparedToolCall) -> None:
+            try:
+                await self._execute_tool(item, schedule=schedule, index=index)
+            finally:
+                schedule.release(index)
+
+        tasks = [asyncio.create_task(run_call(index, item)) for index, item in enumerate(prepared)]
+        try:
+            for task in tasks:
+                await asyncio.shield(task)
+        except BaseException as exc:
+            reason = "cancelled" if isinstance(exc, asyncio.CancelledError) else "sibling_failed"
+            for task in tasks:
+                if not task.done():
+                    task.cancel(reason)
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def _record_invalid_tool_arguments(
         self,
@@ -445,7 +514,15 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                 record_span_exception(span, error)
                 return error
 
-    async def _execute_tool(self, item: _PreparedToolCall) -> None:
+    async def _execute_tool(  # noqa: C901
+        self,
+        item: _PreparedToolCall,
+        *,
+        schedule: _ToolBatchSchedule | None = None,
+        index: int = 0,
+    ) -> None:
+        if schedule is not None:
+            await schedule.wait_to_start(index)
         tracer = trace.get_tracer(JUNJO_OTEL_MODULE_NAME)
         candidate_evidence_recorded = [False]
         with tracer.start_as_current_span(
@@ -498,6 +575,8 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                 item=item,
                 revision_before=revision_before,
             )
+            if schedule is not None:
+                schedule.mark_started(index)
 
             with _operation_cancellation(
                 span,
@@ -539,6 +618,9 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                     record_span_exception(span, error)
                     raise error from exc
 
+                if schedule is not None:
+                    schedule.release(index)
+                    await schedule.wait_to_commit(index)
                 normalized_candidate = diagnostic_candidate(candidate)
                 if normalized_candidate is not None:
                     record_candidate(
@@ -552,6 +634,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                     _typed_result, normalized = validate_and_detach(
                         item.tool.output_adapter,
                         normalized_candidate if normalized_candidate is not None else candidate,
+                        strict=self.agent.boundary_validation == "strict",
                     )
                     normalized_result = thaw_json(normalized)
                     _require_agent_state_message_capacity(
@@ -608,6 +691,8 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
                         result=normalized_result,
                     )
                 )
+                if schedule is not None:
+                    schedule.mark_committed(index)
 
     def _publish_tool_operation(
         self,
@@ -662,6 +747,7 @@ class _AgentRun(Generic[InputT, OutputT, DependenciesT]):
             typed_output, normalized = validate_and_detach(
                 self.agent.output_adapter,
                 thaw_json(response.output),
+                strict=self.agent.boundary_validation == "strict",
             )
             normalized_output = thaw_json(normalized)
             _require_agent_state_message_capacity(AssistantOutputMessage(normalized_output))
@@ -786,7 +872,11 @@ def _validate_invocation(
     history: Sequence[AgentMessage],
 ) -> tuple[JsonValue, tuple[AgentMessage, ...]]:
     try:
-        _typed_input, frozen_input = validate_and_detach(agent.input_adapter, input)
+        _typed_input, frozen_input = validate_and_detach(
+            agent.input_adapter,
+            input,
+            strict=agent.boundary_validation == "strict",
+        )
         normalized_input = thaw_json(frozen_input)
         _require_agent_state_message_capacity(AgentInputMessage(normalized_input))
     except Exception as exc:
@@ -968,13 +1058,15 @@ async def _finish_success(
         )
     )
     try:
-        await _dispatch_terminal(
-            runtime.dispatcher,
-            runtime.dispatcher.agent_completed(
-                identity=admitted.lifecycle_identity,
-                result=_clone_result(agent, result),
-            ),
-        )
+        await runtime.dispatcher.close()
+        if runtime.dispatcher.subscribes("agent_completed"):
+            await _dispatch_terminal(
+                runtime.dispatcher,
+                runtime.dispatcher.agent_completed(
+                    identity=admitted.lifecycle_identity,
+                    result=_clone_result(agent, result),
+                ),
+            )
     except asyncio.CancelledError as cancellation:
         return _ExecutionOutcome(
             result=result,
@@ -998,14 +1090,16 @@ async def _finish_failure(
         _commit_failure_terminal(runtime=runtime, span=span, error=error)
     )
     try:
-        await _dispatch_terminal(
-            runtime.dispatcher,
-            runtime.dispatcher.agent_failed(
-                identity=admitted.lifecycle_identity,
-                error=_clone_execution_error(error),
-                state=snapshot_agent_state(state),
-            ),
-        )
+        await runtime.dispatcher.close()
+        if runtime.dispatcher.subscribes("agent_failed"):
+            await _dispatch_terminal(
+                runtime.dispatcher,
+                runtime.dispatcher.agent_failed(
+                    identity=admitted.lifecycle_identity,
+                    error=_clone_execution_error(error),
+                    state=snapshot_agent_state(state),
+                ),
+            )
     except asyncio.CancelledError as cancellation:
         return _ExecutionOutcome(
             error=error,
@@ -1033,14 +1127,16 @@ async def _finish_cancellation(
         )
     )
     try:
-        await _dispatch_terminal(
-            runtime.dispatcher,
-            runtime.dispatcher.agent_cancelled(
-                identity=admitted.lifecycle_identity,
-                reason=_cancellation_reason(cancellation),
-                state=snapshot_agent_state(state),
-            ),
-        )
+        await runtime.dispatcher.close()
+        if runtime.dispatcher.subscribes("agent_cancelled"):
+            await _dispatch_terminal(
+                runtime.dispatcher,
+                runtime.dispatcher.agent_cancelled(
+                    identity=admitted.lifecycle_identity,
+                    reason=_cancellation_reason(cancellation),
+                    state=snapshot_agent_state(state),
+                ),
+            )
     except asyncio.CancelledError as delivery_cancellation:
         return _ExecutionOutcome(
             cancellation=cancellation,
@@ -1097,14 +1193,16 @@ async def _finish_terminal_commit_failure(
 
     delivery_cancellation: asyncio.CancelledError | None = None
     try:
-        await _dispatch_terminal(
-            runtime.dispatcher,
-            runtime.dispatcher.agent_failed(
-                identity=admitted.lifecycle_identity,
-                error=_clone_execution_error(error),
-                state=snapshot_agent_state(state),
-            ),
-        )
+        await runtime.dispatcher.close()
+        if runtime.dispatcher.subscribes("agent_failed"):
+            await _dispatch_terminal(
+                runtime.dispatcher,
+                runtime.dispatcher.agent_failed(
+                    identity=admitted.lifecycle_identity,
+                    error=_clone_execution_error(error),
+                    state=snapshot_agent_state(state),
+                ),
+            )
     except asyncio.CancelledError as cancellation:
         delivery_cancellation = cancellation
     except Exception as observer_failure:
@@ -1380,7 +1478,11 @@ def _clone_result(
     agent: Agent[InputT, OutputT, DependenciesT],
     result: AgentExecutionResult[OutputT],
 ) -> AgentExecutionResult[OutputT]:
-    cloned_output, _normalized = validate_and_detach(agent.output_adapter, result.output)
+    cloned_output, _normalized = validate_and_detach(
+        agent.output_adapter,
+        result.output,
+        strict=agent.boundary_validation == "strict",
+    )
     return AgentExecutionResult(
         agent_key=result.agent_key,
         name=result.name,
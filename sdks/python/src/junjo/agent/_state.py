@@ -9,7 +9,7 @@ from pydantic import JsonValue
 
 from .._json import freeze_json, thaw_json
 from ..state import BaseState
-from ..store import BaseStore
+from ..store import BaseStore, store_action
 from .messages import (
     AssistantToolCallsMessage,
     ModelResponse,
@@ -21,7 +21,12 @@ from .state import AgentStateSnapshot
 
 
 class AgentState(BaseState):
-    """Private JSON projection of one admitted Agent execution."""
+    """Private JSON projection of one admitted Agent execution.
+
+    ``transcript`` is append-only: actions extend it through
+    :meth:`BaseStore._append_state`, which validates and records only the
+    new messages.
+    """
 
     input: JsonValue
     history: list[JsonValue]
@@ -54,6 +59,7 @@ class AgentStore(BaseStore[AgentState]):
 
         return self._state.model_copy(deep=True)
 
+    @store_action
     async def record_model_start(self, ordinal: int) -> int:
         """Commit model-start bookkeeping and return its revision.
 
@@ -71,13 +77,14 @@ class AgentStore(BaseStore[AgentState]):
         )
         return self._telemetry_evidence.revision
 
+    @store_action
     async def record_model_response(
         self,
         response: ModelResponse,
         usage: AgentUsage,
     ) -> None:
-        snapshot = await self.get_state()
-        await self.set_state(self._model_response_update(snapshot, response, usage))
+        snapshot = await self.get_state(detached=False)
+        await self._append_state(*self._model_response_update(snapshot, response, usage))
 
     async def validate_model_response(
         self,
@@ -86,18 +93,19 @@ class AgentStore(BaseStore[AgentState]):
     ) -> None:
         """Preflight the exact response state and RFC 6902 patch envelopes."""
 
-        snapshot = await self.get_state()
-        await self._validate_state_update(self._model_response_update(snapshot, response, usage))
+        snapshot = await self.get_state(detached=False)
+        appends, update = self._model_response_update(snapshot, response, usage)
+        await self._validate_state_update(update, appends)
 
     @staticmethod
     def _model_response_update(
         snapshot: AgentState,
         response: ModelResponse,
         usage: AgentUsage,
-    ) -> dict[str, object]:
-        transcript = list(snapshot.transcript)
+    ) -> tuple[dict[str, list[JsonValue]], dict[str, object]]:
+        messages: list[JsonValue] = []
         if isinstance(response, ToolCallsResponse):
-            transcript.append(
+            messages.append(
                 thaw_json(
                     freeze_json(
                         message_to_json(
@@ -112,14 +120,14 @@ class AgentStore(BaseStore[AgentState]):
             requested_count = snapshot.tool_call_requested_count + len(response.tool_calls)
         else:
             requested_count = snapshot.tool_call_requested_count
-        return {
-            "transcript": transcript,
+        return {"transcript": messages}, {
             "tool_call_requested_count": requested_count,
             "usage": usage.to_json(),
         }
 
+    @store_action
     async def admit_tool_batch(self, call_ids: Sequence[str]) -> None:
-        snapshot = await self.get_state()
+        snapshot = await self.get_state(detached=False)
         await self.set_state(
             {
                 "tool_call_admitted_count": (snapshot.tool_call_admitted_count + len(call_ids)),
@@ -131,14 +139,16 @@ class AgentStore(BaseStore[AgentState]):
             }
         )
 
+    @store_action
     async def record_tool_started(self) -> int:
         """Commit Tool-start bookkeeping and return the pre-start revision."""
 
-        snapshot = await self.get_state()
+        snapshot = await self.get_state(detached=False)
         revision_before = self._telemetry_evidence.revision
         await self.set_state({"tool_call_started_count": snapshot.tool_call_started_count + 1})
         return revision_before
 
+    @store_action
     async def record_tool_result(
         self,
         *,
@@ -148,9 +158,9 @@ class AgentStore(BaseStore[AgentState]):
     ) -> int:
         """Commit one Tool result and return its committed Store revision."""
 
-        snapshot = await self.get_state()
-        await self.set_state(
-            self._tool_result_update(
+        snapshot = await self.get_state(detached=False)
+        await self._append_state(
+            *self._tool_result_update(
                 snapshot,
                 call_id=call_id,
                 tool_name=tool_name,
@@ -168,15 +178,14 @@ class AgentStore(BaseStore[AgentState]):
     ) -> None:
         """Preflight the exact Tool-result state and patch envelopes."""
 
-        snapshot = await self.get_state()
-        await self._validate_state_update(
-            self._tool_result_update(
-                snapshot,
-                call_id=call_id,
-                tool_name=tool_name,
-                result=result,
-            )
+        snapshot = await self.get_state(detached=False)
+        appends, update = self._tool_result_update(
+            snapshot,
+            call_id=call_id,
+            tool_name=tool_name,
+            result=result,
         )
+        await self._validate_state_update(update, appends)
 
     @staticmethod
     def _tool_result_update(
@@ -185,24 +194,20 @@ class AgentStore(BaseStore[AgentState]):
         call_id: str,
         tool_name: str,
         result: JsonValue,
-    ) -> dict[str, object]:
+    ) -> tuple[dict[str, list[JsonValue]], dict[str, object]]:
         pending = list(snapshot.pending_tool_call_ids)
         pending.remove(call_id)
-        transcript = [
-            *snapshot.transcript,
-            thaw_json(
-                freeze_json(
-                    {
-                        "type": "tool_result",
-                        "callId": call_id,
-                        "toolName": tool_name,
-                        "result": result,
-                    }
-                )
-            ),
-        ]
-        return {
-            "transcript": transcript,
+        message = thaw_json(
+            freeze_json(
+                {
+                    "type": "tool_result",
+                    "callId": call_id,
+                    "toolName": tool_name,
+                    "result": result,
+                }
+            )
+        )
+        return {"transcript": [message]}, {
             "pending_tool_call_ids": pending,
             "completed_tool_call_ids": [
                 *snapshot.completed_tool_call_ids,
@@ -211,30 +216,27 @@ class AgentStore(BaseStore[AgentState]):
             "tool_call_completed_count": snapshot.tool_call_completed_count + 1,
         }
 
+    @store_action
     async def commit_success(self, output: JsonValue) -> None:
         """Atomically commit validated output and the successful terminal reason."""
 
-        snapshot = await self.get_state()
-        await self.set_state(self._success_update(snapshot, output))
+        await self._append_state(*self._success_update(output))
 
     async def validate_success(self, output: JsonValue) -> None:
         """Preflight the exact success state and RFC 6902 patch envelopes."""
 
-        snapshot = await self.get_state()
-        await self._validate_state_update(self._success_update(snapshot, output))
+        appends, update = self._success_update(output)
+        await self._validate_state_update(update, appends)
 
     @staticmethod
-    def _success_update(snapshot: AgentState, output: JsonValue) -> dict[str, object]:
-        return {
-            "transcript": [
-                *snapshot.transcript,
-                thaw_json(freeze_json({"type": "assistant_output", "output": output})),
-            ],
+    def _success_update(output: JsonValue) -> tuple[dict[str, list[JsonValue]], dict[str, object]]:
+        return {"transcript": [thaw_json(freeze_json({"type": "assistant_output", "output": output}))]}, {
             "final_output_available": True,
             "final_output": output,
             "terminal_reason": "final_output",
         }
 
+    @store_action
     async def set_terminal_reason(self, reason: str) -> None:
         await self.set_state({"terminal_reason": reason})
 
@@ -2,18 +2,25 @@
 
 from __future__ import annotations
 
+import hashlib
 from collections.abc import Mapping
 from typing import TYPE_CHECKING
 
+import rfc8785
 from opentelemetry.trace import Span
 
 from .._identity import ParentExecutableIdentity
-from .._json import thaw_json
+from .._json import normalize_json, thaw_json
 from ..telemetry.otel_schema import JUNJO_TELEMETRY_CONTRACT_VERSION
-from ..telemetry.payload import encode_json, set_full_payload
+from ..telemetry.payload import (
+    delta_payload_attributes,
+    encode_json,
+    full_payload_attributes,
+    set_full_payload,
+)
 from ._boundary import json_candidate
 from .json import JsonValue
-from .messages import ModelResponse, response_to_json
+from .messages import ModelRequest, ModelResponse, message_to_json, response_to_json
 from .result import AgentUsage
 
 if TYPE_CHECKING:
@@ -109,6 +116,83 @@ def initialize_tool_span(
     )
 
 
+class ModelRequestRecorder:
+    """Publish each model request of one run as full or delta evidence.
+
+    In ``"delta"`` mode the first request is recorded in full and each later
+    request records only the messages appended since the previous request,
+    plus a digest chained over the complete transcript. Instructions, Tools,
+    and the output schema are inherited from the previous request.
+
+    A delta only resolves against a base the consumer received in full, so
+    when a request's slot is not stored verbatim, because its span is not
+    recording or span limits truncated or dropped it, the next request is
+    recorded in full again.
+    """
+
+    def __init__(self, mode: str) -> None:
+        self._mode = mode
+        self._ordinal: int | None = None
+        self._message_count = 0
+        self._digest = ""
+
+    def record(self, span: Span, request: ModelRequest) -> None:
+        if self._mode == "full":
+            set_full_payload(span, "junjo.agent.model.request", request.to_json())
+            return
+
+        appended = [message_to_json(message) for message in request.messages[self._message_count :]]
+        digest = transcript_digest(self._digest, appended)
+        if self._ordinal is None:
+            attributes = full_payload_attributes("junjo.agent.model.request", request.to_json())
+        else:
+            attributes = delta_payload_attributes(
+                "junjo.agent.model.request",
+                {
+                    "v": 1,
+                    "agentKey": request.agent_key,
+                    "runId": request.run_id,
+                    "ordinal": request.ordinal,
+                    "baseOrdinal": self._ordinal,
+                    "baseMessageCount": self._message_count,
+                    "appendedMessages": appended,
+                    "messagesSha256": digest,
+                },
+            )
+        span.set_attributes(attributes)
+        if not _recorded_verbatim(span, attributes):
+            self._ordinal = None
+            self._message_count = 0
+            self._digest = ""
+            return
+        self._ordinal = request.ordinal
+        self._message_count = len(request.messages)
+        self._digest = digest
+
+
+def _recorded_verbatim(span: Span, attributes: Mapping[str, str]) -> bool:
+    """Return whether ``span`` stored every attribute exactly as given.
+
+    Spans that do not expose their attributes are trusted once recording.
+    """
+
+    if not span.is_recording():
+        return False
+    recorded = getattr(span, "attributes", None)
+    if recorded is None:
+        return True
+    return all(recorded.get(name) == value for name, value in attributes.items())
+
+
+def transcript_digest(previous: str, appended: list[dict[str, object]]) -> str:
+    """Chain the digest of a request transcript over newly appended messages.
+
+    The first request's digest uses an empty ``previous`` value.
+    """
+
+    return hashlib.sha256(previous.encode("ascii") + rfc8785.dumps(normalize_json(appended))).hexdigest()
+
+
 def record_candidate(
     span: Span,
     *,
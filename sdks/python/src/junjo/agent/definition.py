@@ -5,7 +5,7 @@ from __future__ import annotations
 import hashlib
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import Any, Generic, TypeVar
+from typing import Any, Generic, Literal, TypeVar
 
 import rfc8785
 from pydantic import TypeAdapter
@@ -24,7 +24,7 @@ from ..util import generate_safe_id
 from ._schema import schema_for
 from .errors import AgentConfigurationError
 from .json import FrozenJsonValue
-from .messages import AgentMessage
+from .messages import AgentMessage, ToolDefinition
 from .model_driver import ModelDriverBinding
 from .result import AgentExecutionResult
 from .tool import Tool
@@ -73,8 +73,12 @@ class Agent(Generic[InputT, OutputT, DependenciesT]):
     output_adapter: TypeAdapter[OutputT]
     model: ModelDriverBinding
     tools: tuple[Tool[Any, Any, DependenciesT], ...]
+    tool_definitions: tuple[ToolDefinition, ...]
     limits: AgentLimits
     hooks: Hooks | None
+    tool_concurrency: int
+    request_telemetry: Literal["full", "delta"]
+    boundary_validation: Literal["fast", "strict"]
 
     def __init__(
         self,
@@ -88,6 +92,9 @@ class Agent(Generic[InputT, OutputT, DependenciesT]):
         output_type: TypeForm[OutputT],  # ty: ignore[invalid-type-form]
         limits: AgentLimits | None = None,
         hooks: Hooks | None = None,
+        tool_concurrency: int = 1,
+        request_telemetry: Literal["full", "delta"] = "full",
+        boundary_validation: Literal["fast", "strict"] = "fast",
     ) -> None:
         """Declare one immutable, reusable Agent definition.
 
@@ -104,12 +111,29 @@ class Agent(Generic[InputT, OutputT, DependenciesT]):
         :param output_type: Pydantic-compatible successful output type.
         :param limits: Positive per-execution limits; defaults are explicit.
         :param hooks: Optional lifecycle observers. Hooks do not own execution.
+        :param tool_concurrency: Maximum Tool calls of one model batch that run
+            at once. Results still commit in call order. Defaults to ``1``,
+            which runs calls one after another.
+        :param request_telemetry: How model-request spans record the request.
+            ``"full"`` records every request completely. ``"delta"`` records
+            the first request completely and each later one as the messages
+            appended since the previous request, which Junjo AI Studio
+            reassembles. Defaults to ``"full"``.
+        :param boundary_validation: How typed boundary values are proven
+            portable. ``"fast"`` runs the full round-trip stability proof
+            until a boundary type has passed it once, then validates and
+            serializes each later value once. ``"strict"`` runs the full
+            proof for every value. Defaults to ``"fast"``.
         :raises AgentConfigurationError: If any declaration is invalid.
         """
         _validate_identity(key=key, name=name, instructions=instructions)
         _validate_model_and_hooks(model=model, hooks=hooks)
+        _validate_tool_concurrency(tool_concurrency)
+        _validate_request_telemetry(request_telemetry)
+        _validate_boundary_validation(boundary_validation)
         effective_limits = _effective_limits(limits)
         declared_tools = _validated_tools(tools)
+        tool_definitions = _tool_definitions(declared_tools)
         input_adapter, output_adapter, input_schema, output_schema = _boundary_contracts(
             input_type=input_type,
             output_type=output_type,
@@ -141,8 +165,12 @@ class Agent(Generic[InputT, OutputT, DependenciesT]):
         object.__setattr__(self, "output_adapter", output_adapter)
         object.__setattr__(self, "model", model)
         object.__setattr__(self, "tools", declared_tools)
+        object.__setattr__(self, "tool_definitions", tool_definitions)
         object.__setattr__(self, "limits", effective_limits)
         object.__setattr__(self, "hooks", hooks)
+        object.__setattr__(self, "tool_concurrency", tool_concurrency)
+        object.__setattr__(self, "request_telemetry", request_telemetry)
+        object.__setattr__(self, "boundary_validation", boundary_validation)
 
     def structural_material(self) -> dict[str, object]:
         """Return the exact pre-policy material used for this fingerprint."""
@@ -254,6 +282,43 @@ def _validate_model_and_hooks(*, model: object, hooks: object) -> None:
         raise AgentConfigurationError("hooks must be Hooks or None.")
 
 
+def _validate_tool_concurrency(tool_concurrency: object) -> None:
+    # Scheduling policy only: results commit in call order either way, so it
+    # stays out of the structural material and the structural id.
+    try:
+        require_ijson_integer(tool_concurrency, "tool_concurrency", minimum=1)
+    except JsonBoundaryError as exc:
+        raise AgentConfigurationError("tool_concurrency must be a portable positive integer.") from exc
+
+
+def _tool_definitions(tools: tuple[Tool[Any, Any, Any], ...]) -> tuple[ToolDefinition, ...]:
+    # Frozen once so every ModelRequest of every run shares the same catalog.
+    try:
+        return tuple(
+            ToolDefinition(
+                name=tool.name,
+                description=tool.description,
+                input_schema=tool.input_schema,
+                output_schema=tool.output_schema,
+            )
+            for tool in tools
+        )
+    except ValueError as exc:
+        raise AgentConfigurationError("Tool definitions must be bounded portable JSON.") from exc
+
+
+def _validate_request_telemetry(request_telemetry: object) -> None:
+    # Evidence encoding only; it stays out of the structural material.
+    if request_telemetry not in ("full", "delta") or not isinstance(request_telemetry, str):
+        raise AgentConfigurationError("request_telemetry must be 'full' or 'delta'.")
+
+
+def _validate_boundary_validation(boundary_validation: object) -> None:
+    # Verification policy only; accepted values are identical in both modes.
+    if boundary_validation not in ("fast", "strict") or not isinstance(boundary_validation, str):
+        raise AgentConfigurationError("boundary_validation must be 'fast' or 'strict'.")
+
+
 def _effective_limits(limits: AgentLimits | None) -> AgentLimits:
     effective = limits if limits is not None else AgentLimits()
     if not isinstance(effective, AgentLimits):
@@ -2,14 +2,17 @@
 
 from __future__ import annotations
 
+import dataclasses
 from collections.abc import Mapping, Sequence
 from dataclasses import dataclass
-from typing import ClassVar, Literal, TypeAlias
+from typing import ClassVar, Literal, TypeAlias, cast
 
 from .._json import (
     freeze_json,
+    json_nesting_depth,
     require_ijson_integer,
     require_ijson_text,
+    require_json_nesting_depth,
     thaw_json,
 )
 from .json import FrozenJsonValue
@@ -281,6 +284,10 @@ class ToolDefinition:
     description: str
     input_schema: Mapping[str, FrozenJsonValue]
     output_schema: Mapping[str, FrozenJsonValue]
+    # The frozen wire form and its nesting depth, computed once so requests
+    # can embed this definition without walking its schemas again.
+    _json: Mapping[str, FrozenJsonValue] = dataclasses.field(repr=False, compare=False)
+    _nesting_depth: int = dataclasses.field(repr=False, compare=False)
 
     def __init__(
         self,
@@ -298,24 +305,22 @@ class ToolDefinition:
         frozen_output = freeze_json(output_schema)
         if not isinstance(frozen_input, Mapping) or not isinstance(frozen_output, Mapping):
             raise ValueError("Tool schemas must be JSON objects.")
-        freeze_json(
+        frozen = freeze_json(
             {
                 "name": self.name,
                 "description": description,
-                "inputSchema": thaw_json(frozen_input),
-                "outputSchema": thaw_json(frozen_output),
+                "inputSchema": frozen_input,
+                "outputSchema": frozen_output,
             }
         )
-        object.__setattr__(self, "input_schema", frozen_input)
-        object.__setattr__(self, "output_schema", frozen_output)
+        assert isinstance(frozen, Mapping)
+        object.__setattr__(self, "input_schema", frozen["inputSchema"])
+        object.__setattr__(self, "output_schema", frozen["outputSchema"])
+        object.__setattr__(self, "_json", frozen)
+        object.__setattr__(self, "_nesting_depth", json_nesting_depth(frozen))
 
     def to_json(self) -> dict[str, object]:
-        return {
-            "name": self.name,
-            "description": self.description,
-            "inputSchema": thaw_json(self.input_schema),
-            "outputSchema": thaw_json(self.output_schema),
-        }
+        return cast(dict[str, object], thaw_json(self._json))
 
 
 @dataclass(frozen=True, slots=True, init=False)
@@ -383,11 +388,15 @@ class ModelRequest:
             "messages",
             tuple(detach_message(message) for message in declared_messages),
         )
+        # Exact ToolDefinition values are immutable, so an Agent's precomputed
+        # catalog is shared by every request instead of being copied.
         object.__setattr__(
             self,
             "tools",
             tuple(
-                ToolDefinition(
+                tool
+                if type(tool) is ToolDefinition
+                else ToolDefinition(
                     name=tool.name,
                     description=tool.description,
                     input_schema=tool.input_schema,
@@ -397,9 +406,14 @@ class ModelRequest:
             ),
         )
         object.__setattr__(self, "output_schema", frozen_schema)
-        freeze_json(self.to_json())
+        freeze_json(self._to_json(tools=[]))
+        # Each definition sits two levels below the request root.
+        require_json_nesting_depth(2 + max((tool._nesting_depth for tool in self.tools), default=0))
 
     def to_json(self) -> dict[str, object]:
+        return self._to_json(tools=[tool.to_json() for tool in self.tools])
+
+    def _to_json(self, *, tools: list[dict[str, object]]) -> dict[str, object]:
         return {
             "v": 1,
             "agentKey": self.agent_key,
@@ -407,7 +421,7 @@ class ModelRequest:
             "ordinal": self.ordinal,
             "instructions": self.instructions,
             "messages": [message_to_json(message) for message in self.messages],
-            "tools": [tool.to_json() for tool in self.tools],
+            "tools": tools,
             "outputSchema": thaw_json(self.output_schema),
         }
 
@@ -0,0 +1,259 @@
+"""Opt-in memoization of node store updates keyed on declared state fields."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import ClassVar
+
+from opentelemetry import trace
+from pydantic_core import to_json
+
+from .node import Node
+from .state import BaseState
+from .store import BaseStore, StoreT
+
+
+class NodeCache(ABC):
+    """
+    Storage backend for :class:`CachedNode` results.
+
+    A backend maps a key derived from a node's declared state fields to the
+    JSON text of the store update that node produced. Implement :meth:`get`
+    and :meth:`set` to plug in another store, such as Redis.
+    """
+
+    @abstractmethod
+    async def get(self, key: str) -> str | None:
+        """
+        Return the cached update for ``key``, or ``None`` on a miss.
+
+        :param key: The cache key.
+        :type key: str
+        :returns: The JSON text stored by :meth:`set`, if present and fresh.
+        :rtype: str | None
+        """
+        raise NotImplementedError
+
+    @abstractmethod
+    async def set(self, key: str, value: str) -> None:
+        """
+        Store the update for ``key``.
+
+        :param key: The cache key.
+        :type key: str
+        :param value: The JSON text of the store update.
+        :type value: str
+        """
+        raise NotImplementedError
+
+
+class InMemoryNodeCache(NodeCache):
+    """
+    A process-local LRU cache with an optional time to live.
+
+    Entries are shared by every workflow run in the process that uses this
+    cache instance.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float | None = None):
+        """
+        :param max_entries: The number of entries kept before the least
+            recently used entry is evicted. Defaults to 1024.
+        :type max_entries: int, optional
+        :param ttl_seconds: How long an entry stays valid, or ``None`` to keep
+            entries until they are evicted.
+        :type ttl_seconds: float | None, optional
+        :raises ValueError: If ``max_entries`` is less than 1 or
+            ``ttl_seconds`` is not positive.
+        """
+        if max_entries < 1:
+            raise ValueError("InMemoryNodeCache max_entries must be at least 1.")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("InMemoryNodeCache ttl_seconds must be positive.")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self._ttl_seconds is not None and time.monotonic() - stored_at > self._ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    async def set(self, key: str, value: str) -> None:
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+
+class SQLiteNodeCache(NodeCache):
+    """
+    A persistent cache stored in a SQLite database file.
+
+    Entries survive process restarts, so bump :attr:`CachedNode.cache_version`
+    when a node's logic changes. Expired entries are deleted when they are
+    read and whenever an entry is stored. Database calls run in a worker
+    thread so they never block the event loop.
+    """
+
+    def __init__(self, path: str | Path, ttl_seconds: float | None = None):
+        """
+        :param path: The database file, created if it does not exist. Use
+            ``":memory:"`` for a private in-memory database.
+        :type path: str | Path
+        :param ttl_seconds: How long an entry stays valid, or ``None`` to keep
+            entries forever.
+        :type ttl_seconds: float | None, optional
+        :raises ValueError: If ``ttl_seconds`` is not positive.
+        """
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("SQLiteNodeCache ttl_seconds must be positive.")
+        self._ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS junjo_node_cache "
+                "(key TEXT PRIMARY KEY, stored_at REAL NOT NULL, value TEXT NOT NULL)"
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT stored_at, value FROM junjo_node_cache WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            stored_at, value = row
+            if self._ttl_seconds is not None and time.time() - stored_at > self._ttl_seconds:
+                with self._connection:
+                    self._connection.execute(
+                        "DELETE FROM junjo_node_cache WHERE key = ? AND stored_at = ?",
+                        (key, stored_at),
+                    )
+                return None
+        return value
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            if self._ttl_seconds is not None:
+                self._connection.execute(
+                    "DELETE FROM junjo_node_cache WHERE stored_at < ?",
+                    (now - self._ttl_seconds,),
+                )
+            self._connection.execute(
+                "INSERT OR REPLACE INTO junjo_node_cache (key, stored_at, value) VALUES (?, ?, ?)",
+                (key, now, value),
+            )
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+
+class CachedNode(Node[StoreT]):
+    """
+    A node whose store update is memoized on a projection of the state.
+
+    Use this for nodes that are pure functions of a few state fields, such as
+    prompt building or classification. Declare those fields in
+    :attr:`cache_key_fields` and implement :meth:`~junjo.Node.service` as
+    usual. On a miss the node runs, and the updates it passes to
+    :meth:`~junjo.BaseStore.set_state` are shallow-merged into one top-level
+    update and cached. On a hit :meth:`~junjo.Node.service` is skipped and the
+    cached update is replayed through :meth:`~junjo.BaseStore.set_state`, so
+    the store records a fresh RFC 6902 patch against the current state.
+    Either way the node span records ``junjo.node.cache_hit``, and lifecycle
+    hooks fire as for any other node.
+
+    Updates are cached as JSON and re-validated against the state model on
+    replay. A node that fails is not cached, and neither is one that
+    completes after one of its updates was rejected or discarded.
+
+    .. rubric:: Example implementation
+
+    .. code-block:: python
+
+        class ClassifyMessageNode(CachedNode[MessageStore]):
+            cache_key_fields = ("message",)
+
+            async def service(self, store: MessageStore) -> None:
+                state = await store.get_state()
+                await store.set_category(await classify(state.message))
+
+        classify_message = ClassifyMessageNode(cache=InMemoryNodeCache(ttl_seconds=3600))
+    """
+
+    cache_key_fields: ClassVar[tuple[str, ...]] = ()
+    """The state fields whose values determine the node's update."""
+
+    cache_version: ClassVar[int] = 0
+    """Part of every key; increase it to invalidate entries after a logic change."""
+
+    def __init__(self, *, cache: NodeCache):
+        """
+        :param cache: The backend that stores this node's updates.
+        :type cache: NodeCache
+        :raises TypeError: If the subclass declares no ``cache_key_fields``.
+        """
+        super().__init__()
+        if not self.cache_key_fields:
+            raise TypeError(f"{type(self).__name__} must declare cache_key_fields.")
+        self._cache = cache
+
+    @property
+    def cache(self) -> NodeCache:
+        """Returns the backend that stores this node's updates."""
+        return self._cache
+
+    def _cache_key(self, state: BaseState) -> str:
+        state_type = type(state)
+        missing = [name for name in self.cache_key_fields if name not in state_type.model_fields]
+        if missing:
+            raise ValueError(f"{self.name} cache_key_fields are not fields of {state_type.__name__}: {missing}.")
+        projection = {name: getattr(state, name) for name in self.cache_key_fields}
+        node_type = type(self)
+        payload = to_json(
+            [f"{node_type.__module__}.{node_type.__qualname__}", self.cache_version, projection],
+        )
+        return hashlib.sha256(payload).hexdigest()
+
+    async def _run_service(self, store: StoreT) -> None:
+        base_store: BaseStore = store
+        key = self._cache_key(await base_store.get_state(detached=False))
+        span = trace.get_current_span()
+        cached_update = await self._cache.get(key)
+        span.set_attribute("junjo.node.cache_hit", cached_update is not None)
+        if cached_update is not None:
+            async with base_store.transaction(self.name):
+                await base_store.set_state(json.loads(cached_update))
+            return
+
+        with base_store._record_updates() as recorded:
+            await self.service(store)
+        if not recorded.failed:
+            await self._cache.set(key, to_json(recorded.update).decode())
@@ -4,18 +4,31 @@ import hashlib
 import html
 import re
 import subprocess
-from collections.abc import Mapping
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass
 from pathlib import Path
 from types import MappingProxyType
 
 from ._json import JsonBoundaryError, json_dumps
+from .condition import Condition
 from .edge import Edge
 from .node import Node
 from .run_concurrent import RunConcurrent
 from .store import BaseStore
 from .workflow import _NestableWorkflow
 
+# Serialized graph snapshots are cached per graph structural id as templates
+# with runtime-id slots, so structurally identical graphs built by a
+# ``graph_factory`` on every run reuse one serialization. Each template keeps
+# the slot layout it was built from, because node instances shared across
+# subflows collapse into one slot without changing the structural id.
+_GRAPH_SNAPSHOT_CACHE_MAXSIZE = 256
+_GRAPH_SNAPSHOT_SLOT = re.compile("\ue000(\\d+)\ue001")
+_graph_snapshot_templates: OrderedDict[str, tuple[tuple[int, ...], tuple[str | int, ...]]] = OrderedDict()
+_graph_snapshot_templates_lock = threading.Lock()
+
 
 class GraphError(Exception):
     """Base class for graph-specific errors raised by Junjo."""
@@ -153,6 +166,11 @@ class _CompiledEdgeSeed:
     edge_runtime_ref: Edge
 
 
+# One outgoing transition of a traversal plan: the edge condition, or
+# ``None`` for an unconditional edge, and the head executable it leads to.
+_Transition = tuple[Condition | None, Node | _NestableWorkflow]
+
+
 class Graph:
     """
     Represents a directed graph of nodes and edges, defining the structure and
@@ -258,6 +276,7 @@ class Graph:
         self._sinks = tuple(sinks)
         self._edges = tuple(edges)
         self._compiled_graph: CompiledGraph | None = None
+        self._traversal_plan: Mapping[str, tuple[_Transition, ...]] = MappingProxyType({})
 
     @property
     def source(self) -> Node | _NestableWorkflow:
@@ -308,7 +327,7 @@ class Graph:
 
         active_subflows.add(subflow.id)
         try:
-            child_graph = subflow._graph_factory()
+            child_graph = subflow._get_graph()
             compiled_graph = child_graph._compile(compiled_subflows, active_subflows)
             compiled_subflows[subflow.id] = compiled_graph
             return compiled_graph
@@ -651,8 +670,25 @@ class Graph:
             reachable_node_runtime_ids=reachable_node_runtime_ids,
         )
         self._compiled_graph = compiled_graph
+        self._traversal_plan = self._build_traversal_plan(compiled_graph)
         return compiled_graph
 
+    @staticmethod
+    def _build_traversal_plan(
+        compiled: CompiledGraph,
+    ) -> Mapping[str, tuple[_Transition, ...]]:
+        # Traversal resolves each step from this precomputed plan instead of
+        # walking compiled edges and awaiting ``Edge.next_node`` per edge.
+        return MappingProxyType(
+            {
+                tail_id: tuple(
+                    (edge.edge_runtime_ref.condition, edge.edge_runtime_ref.head)
+                    for edge in edges
+                )
+                for tail_id, edges in compiled.outgoing_compiled_edges_by_tail_runtime_id.items()
+            }
+        )
+
     def compile(self) -> CompiledGraph:
         """
         Compile this graph into one canonical structural snapshot.
@@ -764,6 +800,11 @@ class Graph:
         - the first edge whose condition resolves to a next executable wins
         - later edges are not evaluated once a match is found
 
+        Traversal uses a plan precompiled with the graph. An unconditional
+        edge resolves without reading the store, and all conditions evaluated
+        for one step share a single detached state snapshot, so a condition
+        can never mutate the live store.
+
         Workflow execution checks declared sinks before calling this method.
         Direct callers should do the same. If this method is called for an
         executable with no resolving outgoing edge, including a declared sink,
@@ -777,11 +818,16 @@ class Graph:
         :returns: The next node or subflow in the graph.
         :rtype: Node | _NestableWorkflow
         """
-        compiled = self.compile()
-        for edge in compiled.outgoing_compiled_edges_by_tail_runtime_id.get(current_node.id, ()):
-            resolved_edge = await edge.edge_runtime_ref.next_node(store)
-            if resolved_edge is not None:
-                return resolved_edge
+        if self._compiled_graph is None:
+            self.compile()
+        state = None
+        for condition, head in self._traversal_plan.get(current_node.id, ()):
+            if condition is None:
+                return head
+            if state is None:
+                state = await store.get_state()
+            if condition.evaluate(state):
+                return head
 
         raise GraphValidationError(
             "Check your Graph. No resolved edges. "
@@ -789,7 +835,7 @@ class Graph:
         )
 
 
-    def serialize_to_json_string(self) -> str:  # noqa: C901
+    def serialize_to_json_string(self) -> str:
         """
         Convert the graph to a neutral serialized JSON string.
 
@@ -806,7 +852,94 @@ class Graph:
         :raises GraphSerializationError: If the graph payload cannot be
             converted into JSON.
         """
+        return self._serialize_compiled_graph(self.compile(), lambda runtime_id: runtime_id)
+
+    def _snapshot_json(self) -> str:
+        """
+        Return :meth:`serialize_to_json_string` output through the snapshot cache.
+
+        The first graph of each structural id is serialized with placeholder
+        runtime ids, and the resulting template is kept in a process-wide LRU
+        cache. Later graphs with the same structural id, such as the graph a
+        ``graph_factory`` builds on every run, only substitute their own
+        runtime ids. A structural id fixes node order, labels, edges, and
+        nested subflow structure, so the substituted text is identical to a
+        fresh serialization.
+
+        A structural id does not fix which node instances are shared across
+        subflows, and shared instances are serialized once. When a graph's
+        slot layout differs from the cached template's, it is serialized in
+        full instead.
+        """
         compiled = self.compile()
+        runtime_ids, slot_layout = self._snapshot_runtime_ids(compiled)
+        with _graph_snapshot_templates_lock:
+            cached = _graph_snapshot_templates.get(compiled.graph_structural_id)
+            if cached is not None:
+                _graph_snapshot_templates.move_to_end(compiled.graph_structural_id)
+
+        if cached is not None:
+            cached_layout, template = cached
+            if cached_layout != slot_layout:
+                return self.serialize_to_json_string()
+        else:
+            slots = {runtime_id: f"\ue000{index}\ue001" for index, runtime_id in enumerate(runtime_ids)}
+            emitted_slot_count = 0
+
+            def emit_slot(runtime_id: str) -> str:
+                nonlocal emitted_slot_count
+                emitted_slot_count += 1
+                return slots[runtime_id]
+
+            parts = _GRAPH_SNAPSHOT_SLOT.split(self._serialize_compiled_graph(compiled, emit_slot))
+            if len(parts) // 2 != emitted_slot_count or any(
+                "\ue000" in part or "\ue001" in part for part in parts[::2]
+            ):
+                # Labels that contain the slot markers cannot be templated.
+                return self.serialize_to_json_string()
+            template = tuple(part if index % 2 == 0 else int(part) for index, part in enumerate(parts))
+            with _graph_snapshot_templates_lock:
+                _graph_snapshot_templates[compiled.graph_structural_id] = (slot_layout, template)
+                _graph_snapshot_templates.move_to_end(compiled.graph_structural_id)
+                while len(_graph_snapshot_templates) > _GRAPH_SNAPSHOT_CACHE_MAXSIZE:
+                    _graph_snapshot_templates.popitem(last=False)
+
+        encoded_ids = [json_dumps(runtime_id)[1:-1] for runtime_id in runtime_ids]
+        return "".join(part if isinstance(part, str) else encoded_ids[part] for part in template)
+
+    @staticmethod
+    def _snapshot_runtime_ids(compiled: CompiledGraph) -> tuple[list[str], tuple[int, ...]]:
+        """
+        Return every runtime id a snapshot contains, in structural order.
+
+        The slot layout maps each node visit, in the same order, to the index
+        of its runtime id, so it records which visits share one instance.
+        """
+
+        runtime_ids: list[str] = []
+        slots: dict[str, int] = {}
+        slot_layout: list[int] = []
+
+        def collect(graph: CompiledGraph) -> None:
+            for node in graph.compiled_nodes:
+                slot = slots.get(node.node_runtime_id)
+                if slot is None:
+                    slot = slots[node.node_runtime_id] = len(runtime_ids)
+                    runtime_ids.append(node.node_runtime_id)
+                slot_layout.append(slot)
+                if node.is_subflow and node.compiled_subflow_graph is not None:
+                    collect(node.compiled_subflow_graph)
+
+        collect(compiled)
+        return runtime_ids, tuple(slot_layout)
+
+    def _serialize_compiled_graph(  # noqa: C901
+        self,
+        compiled: CompiledGraph,
+        emit_runtime_id: Callable[[str], str],
+    ) -> str:
+        """Serialize one compiled graph, writing each runtime id as ``emit_runtime_id`` maps it."""
+
         nodes_json: list[dict] = []
         edges_json: list[dict] = []
         seen_node_runtime_ids: set[str] = set()
@@ -819,25 +952,31 @@ class Graph:
             for node in graph.compiled_nodes:
                 if node.node_runtime_id not in seen_node_runtime_ids:
                     node_info: dict[str, object] = {
-                        "nodeRuntimeId": node.node_runtime_id,
+                        "nodeRuntimeId": emit_runtime_id(node.node_runtime_id),
                         "nodeStructuralId": node.node_structural_id,
                         "nodeType": node.node_type_name,
                         "nodeLabel": node.node_label,
                     }
                     if node.is_concurrent_subgraph:
                         node_info["isConcurrentSubgraph"] = True
-                        node_info["childNodeRuntimeIds"] = list(node.child_node_runtime_ids)
+                        node_info["childNodeRuntimeIds"] = [
+                            emit_runtime_id(child_runtime_id) for child_runtime_id in node.child_node_runtime_ids
+                        ]
                     elif node.is_subflow and node.compiled_subflow_graph is not None:
                         subflow_graph = node.compiled_subflow_graph
                         node_info["isSubflow"] = True
                         node_info["subflowGraphStructuralId"] = subflow_graph.graph_structural_id
-                        node_info["subflowSourceNodeRuntimeId"] = subflow_graph.source_node_runtime_id
+                        node_info["subflowSourceNodeRuntimeId"] = emit_runtime_id(
+                            subflow_graph.source_node_runtime_id
+                        )
                         node_info["subflowSourceNodeStructuralId"] = (
                             subflow_graph.compiled_nodes_by_runtime_id[
                                 subflow_graph.source_node_runtime_id
                             ].node_structural_id
                         )
-                        node_info["subflowSinkNodeRuntimeIds"] = list(subflow_graph.sink_node_runtime_ids)
+                        node_info["subflowSinkNodeRuntimeIds"] = [
+                            emit_runtime_id(sink_runtime_id) for sink_runtime_id in subflow_graph.sink_node_runtime_ids
+                        ]
                         node_info["subflowSinkNodeStructuralIds"] = [
                             subflow_graph.compiled_nodes_by_runtime_id[sink_runtime_id].node_structural_id
                             for sink_runtime_id in subflow_graph.sink_node_runtime_ids
@@ -855,15 +994,19 @@ class Graph:
                 edges_json.append(
                     {
                         "edgeStructuralId": edge.edge_structural_id,
-                        "tailNodeRuntimeId": edge.tail_node_runtime_id,
+                        "tailNodeRuntimeId": emit_runtime_id(edge.tail_node_runtime_id),
                         "tailNodeStructuralId": edge.tail_node_structural_id,
-                        "headNodeRuntimeId": edge.head_node_runtime_id,
+                        "headNodeRuntimeId": emit_runtime_id(edge.head_node_runtime_id),
                         "headNodeStructuralId": edge.head_node_structural_id,
                         "edgeConditionLabel": edge.edge_condition_label,
                         "edgeScope": (
                             "subflow" if parent_subflow_runtime_id is not None else "explicit"
                         ),
-                        "parentSubflowRuntimeId": parent_subflow_runtime_id,
+                        "parentSubflowRuntimeId": (
+                            emit_runtime_id(parent_subflow_runtime_id)
+                            if parent_subflow_runtime_id is not None
+                            else None
+                        ),
                     }
                 )
 
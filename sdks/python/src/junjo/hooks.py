@@ -4,7 +4,7 @@ from collections import defaultdict
 from collections.abc import Awaitable, Callable
 from dataclasses import dataclass
 from threading import RLock
-from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeAlias, TypeVar, cast
 
 from ._identity import ExecutableType
 from .state import BaseState
@@ -19,6 +19,9 @@ if TYPE_CHECKING:
 StateT = TypeVar("StateT", bound=BaseState)
 HookEventT = TypeVar("HookEventT")
 HookCallback = Callable[[HookEventT], None | Awaitable[None]]
+HookDelivery: TypeAlias = Literal["inline", "queued"]
+HookBackpressure: TypeAlias = Literal["block", "drop_oldest", "drop_new"]
+HookCallbackConcurrency: TypeAlias = Literal["sequential", "concurrent"]
 
 
 @dataclass(frozen=True, slots=True, kw_only=True)
@@ -278,11 +281,62 @@ class Hooks:
 
         # Later, if this callback should no longer run:
         unsubscribe()
+
+    By default every callback is awaited inline, so a slow callback adds to
+    the latency of the executable that emitted the event. Pass
+    ``delivery="queued"`` to hand non-terminal events to a bounded queue per
+    run that a background task drains in order. Workflow, Subflow, and Agent
+    terminal events are still awaited inline, after every queued event has
+    been delivered.
+
+    Callbacks registered for the same event run one after another by default.
+    Pass ``callback_concurrency="concurrent"`` to start them in registration
+    order and await the async ones together, so one event costs the slowest
+    callback rather than the sum of all of them.
     """
 
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        *,
+        delivery: HookDelivery = "inline",
+        max_queued_events: int = 1024,
+        backpressure: HookBackpressure = "block",
+        callback_concurrency: HookCallbackConcurrency = "sequential",
+    ) -> None:
+        """
+        :param delivery: ``"inline"`` awaits every callback where the event
+            is emitted. ``"queued"`` delivers non-terminal events from a
+            background task per run.
+        :type delivery: Literal["inline", "queued"], optional
+        :param max_queued_events: Queue capacity per run in ``"queued"``
+            delivery mode.
+        :type max_queued_events: int, optional
+        :param backpressure: What happens when the queue is full:
+            ``"block"`` waits for space, ``"drop_oldest"`` discards the
+            oldest queued event, and ``"drop_new"`` discards the new event.
+            Dropped events are counted in the
+            ``junjo.hook.queue.dropped_count`` attribute of the run span.
+        :type backpressure: Literal["block", "drop_oldest", "drop_new"], optional
+        :param callback_concurrency: ``"sequential"`` awaits the callbacks of
+            one event in registration order. ``"concurrent"`` awaits the async
+            callbacks of one event together; failures stay isolated per
+            callback.
+        :type callback_concurrency: Literal["sequential", "concurrent"], optional
+        """
+        if delivery not in ("inline", "queued"):
+            raise ValueError(f"Unknown hook delivery mode: {delivery!r}.")
+        if backpressure not in ("block", "drop_oldest", "drop_new"):
+            raise ValueError(f"Unknown hook backpressure policy: {backpressure!r}.")
+        if callback_concurrency not in ("sequential", "concurrent"):
+            raise ValueError(f"Unknown hook callback concurrency: {callback_concurrency!r}.")
+        if max_queued_events < 1:
+            raise ValueError("max_queued_events must be at least 1.")
         self._callbacks: dict[str, list[HookCallback[Any]]] = defaultdict(list)
         self._lock = RLock()
+        self._delivery = delivery
+        self._max_queued_events = max_queued_events
+        self._backpressure = backpressure
+        self._callback_concurrency = callback_concurrency
 
     def _register(
         self,
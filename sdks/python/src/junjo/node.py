@@ -1,7 +1,8 @@
 import asyncio
 import logging
 from abc import ABC, abstractmethod
-from typing import Generic
+from concurrent.futures import Executor
+from typing import Any, Generic
 
 from opentelemetry import trace
 
@@ -15,7 +16,7 @@ from .correlation import (
     _get_active_execution_correlation,
     _set_correlation_span_attributes,
 )
-from .store import StoreT
+from .store import StateT, StoreT
 from .telemetry.diagnostics import cancellation_reason
 from .telemetry.otel_schema import (
     JUNJO_OTEL_MODULE_NAME,
@@ -25,6 +26,7 @@ from .telemetry.span_lifecycle import (
     get_span_identifiers,
     mark_span_cancelled,
     mark_span_failed,
+    record_child_span_attributes,
     record_span_exception,
 )
 from .util import generate_safe_id
@@ -108,6 +110,10 @@ class Node(Generic[StoreT], ABC):
         """
         raise NotImplementedError
 
+    async def _run_service(self, store: StoreT) -> None:
+        """Run :meth:`service` inside the node span; subclasses may wrap it."""
+        await self.service(store)
+
     async def execute(self, store: StoreT, parent_id: str) -> None:
         """
         Execute the node's :meth:`service` method with tracing and lifecycle
@@ -163,6 +169,7 @@ class Node(Generic[StoreT], ABC):
                     span,
                     _get_active_execution_correlation(),
                 )
+                record_child_span_attributes(span)
                 if node_structural_id is not None:
                     span.set_attribute(
                         "junjo.executable_structural_id",
@@ -183,7 +190,7 @@ class Node(Generic[StoreT], ABC):
                         parent_active_identity.executable_structural_id,
                     )
 
-                if lifecycle_context is not None:
+                if lifecycle_context is not None and lifecycle_context.dispatcher.subscribes("node_started"):
                     assert node_structural_id is not None
                     trace_id, span_id = get_span_identifiers(span)
                     await lifecycle_context.dispatcher.node_started(
@@ -221,7 +228,7 @@ class Node(Generic[StoreT], ABC):
                     )
 
                 if node_structural_id is None:
-                    await self.service(store)
+                    await self._run_service(store)
                 else:
                     with active_executable_identity(
                         ActiveExecutableIdentity(
@@ -232,9 +239,9 @@ class Node(Generic[StoreT], ABC):
                             executable_structural_id=node_structural_id,
                         )
                     ):
-                        await self.service(store)
+                        await self._run_service(store)
 
-                        if lifecycle_context is not None:
+                        if lifecycle_context is not None and lifecycle_context.dispatcher.subscribes("node_completed"):
                             trace_id, span_id = get_span_identifiers(span)
                             prepared_terminal_event = lifecycle_context.dispatcher.node_completed(
                                 run_id=lifecycle_context.run_id,
@@ -280,7 +287,7 @@ class Node(Generic[StoreT], ABC):
             except asyncio.CancelledError as exc:
                 mark_span_cancelled(span, exc)
                 cancellation = exc
-                if lifecycle_context is not None:
+                if lifecycle_context is not None and lifecycle_context.dispatcher.subscribes("node_cancelled"):
                     assert node_structural_id is not None
                     trace_id, span_id = get_span_identifiers(span)
                     prepared_terminal_event = lifecycle_context.dispatcher.node_cancelled(
@@ -329,7 +336,7 @@ class Node(Generic[StoreT], ABC):
                 mark_span_failed(span, exc)
                 record_span_exception(span, exc)
                 failure = exc
-                if lifecycle_context is not None:
+                if lifecycle_context is not None and lifecycle_context.dispatcher.subscribes("node_failed"):
                     assert node_structural_id is not None
                     trace_id, span_id = get_span_identifiers(span)
                     prepared_terminal_event = lifecycle_context.dispatcher.node_failed(
@@ -367,7 +374,7 @@ class Node(Generic[StoreT], ABC):
                         ),
                     )
 
-            if lifecycle_context is not None:
+            if lifecycle_context is not None and prepared_terminal_event is not None:
                 try:
                     await lifecycle_context.dispatcher.dispatch(
                         prepared_terminal_event,
@@ -382,3 +389,77 @@ class Node(Generic[StoreT], ABC):
             raise cancellation
         if failure is not None:
             raise failure
+
+
+class CpuBoundNode(Node[StoreT], Generic[StoreT, StateT]):
+    """
+    A node whose work runs in an executor instead of on the event loop.
+
+    CPU-heavy work such as parsing large documents or scoring candidates
+    blocks the event loop, and with it every concurrent run in the process.
+    Implement the synchronous :meth:`compute` instead of :meth:`service`.
+    Junjo passes it a detached state snapshot, runs it in ``executor``, and
+    commits the returned update through :meth:`~junjo.BaseStore.set_state`,
+    so node spans, lifecycle events, and state telemetry are unchanged.
+
+    Pass a :class:`~concurrent.futures.ProcessPoolExecutor` for pure Python
+    work that holds the GIL. In that case the node, the state, and the
+    returned update are pickled, so define them at module level. Omit
+    ``executor`` to use the event loop's default thread pool, which suits
+    code that releases the GIL, such as NumPy.
+
+    Cancelling the node stops waiting for :meth:`compute` immediately. A
+    computation that has already started runs to completion in its worker
+    and its update is discarded.
+
+    .. rubric:: Example implementation
+
+    .. code-block:: python
+
+        class ScoreCandidatesNode(CpuBoundNode[RankingStore, RankingState]):
+            def compute(self, state: RankingState) -> dict:
+                return {"scores": [score(candidate) for candidate in state.candidates]}
+
+        score_candidates = ScoreCandidatesNode(executor=process_pool)
+    """
+
+    def __init__(self, *, executor: Executor | None = None):
+        """
+        :param executor: The executor that runs :meth:`compute`, or ``None``
+            for the event loop's default thread pool.
+        :type executor: Executor | None, optional
+        """
+        super().__init__()
+        self._executor = executor
+
+    def __getstate__(self) -> dict[str, Any]:
+        # Executors cannot be pickled; process workers never need it.
+        state = self.__dict__.copy()
+        state["_executor"] = None
+        return state
+
+    @property
+    def executor(self) -> Executor | None:
+        """Returns the executor that runs :meth:`compute`."""
+        return self._executor
+
+    @abstractmethod
+    def compute(self, state: StateT) -> dict[str, Any]:
+        """
+        Compute this node's state update away from the event loop.
+
+        :param state: A detached snapshot of the current state.
+        :type state: StateT
+        :returns: The update to commit with :meth:`~junjo.BaseStore.set_state`.
+        :rtype: dict[str, Any]
+        """
+        raise NotImplementedError
+
+    async def service(self, store: StoreT) -> None:
+        """Run :meth:`compute` in the executor and commit its update."""
+        executor_name = type(self._executor).__name__ if self._executor is not None else "default"
+        trace.get_current_span().set_attribute("junjo.node.executor", executor_name)
+        state = await store.get_state()
+        update = await asyncio.get_running_loop().run_in_executor(self._executor, self.compute, state)
+        async with store.transaction(self.name):
+            await store.set_state(update)
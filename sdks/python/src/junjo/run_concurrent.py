@@ -2,10 +2,16 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Sequence
-from typing import TYPE_CHECKING
+import time
+from abc import abstractmethod
+from collections import deque
+from collections.abc import Awaitable, Callable, Sequence
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Generic, TypeVar, cast
 
 from opentelemetry import trace
+from opentelemetry.util.types import AttributeValue
 
 from ._identity import (
     ActiveExecutableIdentity,
@@ -19,7 +25,7 @@ from .correlation import (
     _set_correlation_span_attributes,
 )
 from .node import Node
-from .store import BaseStore
+from .store import BaseStore, StoreT
 from .telemetry.diagnostics import cancellation_reason
 from .telemetry.otel_schema import (
     JUNJO_OTEL_MODULE_NAME,
@@ -29,7 +35,9 @@ from .telemetry.span_lifecycle import (
     get_span_identifiers,
     mark_span_cancelled,
     mark_span_failed,
+    record_child_span_attributes,
     record_span_exception,
+    set_child_span_attributes,
 )
 from .util import generate_safe_id
 
@@ -39,6 +47,9 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger("junjo.run_concurrent")
 
+ItemT = TypeVar("ItemT")
+ResultT = TypeVar("ResultT")
+
 
 class RunConcurrent(Node):
     """
@@ -56,9 +67,21 @@ class RunConcurrent(Node):
     The child membership is immutable after construction. Junjo stores
     ``items`` as a tuple so compiled graph snapshots, traversal, telemetry, and
     visualization stay aligned with the same graph shape.
+
+    Pass ``max_concurrency`` to bound how many children run at once. Children
+    are admitted in ``items`` order as running siblings finish, and each
+    admitted child span records how long it waited as
+    ``junjo.run_concurrent.queue_wait_ms``. Children that were never admitted
+    before a failure or cancellation do not run at all.
     """
 
-    def __init__(self, name: str, items: Sequence[Node | Subflow]):
+    def __init__(
+        self,
+        name: str,
+        items: Sequence[Node | Subflow],
+        *,
+        max_concurrency: int | None = None,
+    ):
         """
         :param name: The name of this collection of concurrently executed
             nodes.
@@ -67,6 +90,9 @@ class RunConcurrent(Node):
             It must contain at least one child. Junjo copies this sequence into
             an immutable tuple during construction.
         :type items: Sequence[Node | Subflow]
+        :param max_concurrency: The maximum number of children running at
+            once, or ``None`` to start every child immediately.
+        :type max_concurrency: int | None, optional
 
         .. code-block:: python
 
@@ -84,6 +110,9 @@ class RunConcurrent(Node):
         self._items = tuple(items)
         if not self._items:
             raise ValueError("RunConcurrent requires at least one child executable.")
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("RunConcurrent max_concurrency must be at least 1.")
+        self._max_concurrency = max_concurrency
         self._id = generate_safe_id()
         self._name = name
 
@@ -106,6 +135,11 @@ class RunConcurrent(Node):
         """Return the immutable child executables for this concurrent group."""
         return self._items
 
+    @property
+    def max_concurrency(self) -> int | None:
+        """Return the child concurrency bound, or ``None`` when unbounded."""
+        return self._max_concurrency
+
     async def _cancel_pending_tasks(
         self,
         pending: set[asyncio.Task[None]],
@@ -129,16 +163,73 @@ class RunConcurrent(Node):
                 return exc
         return None
 
-    async def service(self, store: BaseStore) -> None:
-        """
-        Execute the provided nodes and subflows concurrently.
+    def _child_span_attributes(self, index: int) -> dict[str, AttributeValue]:
+        """Return extra attributes for the span of the child at ``index``."""
+        return {}
 
-        Child items receive the same run-local store. If one item fails, all
-        still-pending siblings are cancelled and the original failure is
-        re-raised once the cancellations have been drained.
-        """
+    async def _admit_child(
+        self,
+        index: int,
+        run_child: Callable[[int], Awaitable[Any]],
+        results: list[Any],
+        queue_wait_ms: float | None,
+    ) -> None:
+        attributes = self._child_span_attributes(index)
+        if queue_wait_ms is not None:
+            attributes["junjo.run_concurrent.queue_wait_ms"] = queue_wait_ms
+        if attributes:
+            set_child_span_attributes(attributes)
+        results[index] = await run_child(index)
+
+    async def _run_children(
+        self,
+        count: int,
+        run_child: Callable[[int], Awaitable[Any]],
+    ) -> list[Any]:
+        """Run ``count`` children with bounded admission and return their results in order."""
+        results: list[Any] = [None] * count
+        waiting = deque(range(count))
+        limit = self._max_concurrency if self._max_concurrency is not None else count
+        admission_started = time.perf_counter()
+        pending: set[asyncio.Task[None]] = set()
+
+        try:
+            while waiting or pending:
+                while waiting and len(pending) < limit:
+                    queue_wait_ms = (
+                        (time.perf_counter() - admission_started) * 1000
+                        if self._max_concurrency is not None
+                        else None
+                    )
+                    pending.add(
+                        asyncio.create_task(
+                            self._admit_child(waiting.popleft(), run_child, results, queue_wait_ms)
+                        )
+                    )
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=(
+                        asyncio.FIRST_COMPLETED if waiting else asyncio.FIRST_EXCEPTION
+                    ),
+                )
+                failure = self._get_first_failure(done)
+                if failure is not None:
+                    await self._cancel_pending_tasks(pending, "sibling_failed")
+                    pending.clear()
+                    raise failure
+
+                for task in done:
+                    task.result()
+
+        except asyncio.CancelledError:
+            await self._cancel_pending_tasks(pending, "cancelled")
+            raise
+
+        return results
+
+    def _log_extra(self, store: BaseStore) -> dict[str, str | None]:
         lifecycle_context = store._lifecycle_context
-        run_concurrent_log_extra = {
+        return {
             "run_id": (
                 lifecycle_context.run_id
                 if lifecycle_context is not None
@@ -148,35 +239,27 @@ class RunConcurrent(Node):
             "executable_runtime_id": self.id,
             "span_type": "run_concurrent",
         }
+
+    async def service(self, store: BaseStore) -> None:
+        """
+        Execute the provided nodes and subflows concurrently.
+
+        Child items receive the same run-local store. If one item fails, all
+        still-pending siblings are cancelled, children that were not admitted
+        yet are skipped, and the original failure is re-raised once the
+        cancellations have been drained.
+        """
+        run_concurrent_log_extra = self._log_extra(store)
         logger.debug(
             "Executing concurrent items within %s (%s)",
             self.name,
             self.id,
             extra=run_concurrent_log_extra,
         )
-        pending = {
-            asyncio.create_task(item.execute(store, self.id))
-            for item in self.items
-        }
-
-        try:
-            done, pending = await asyncio.wait(
-                pending,
-                return_when=asyncio.FIRST_EXCEPTION,
-            )
-            failure = self._get_first_failure(done)
-            if failure is not None:
-                await self._cancel_pending_tasks(pending, "sibling_failed")
-                pending.clear()
-                raise failure
-
-            for task in done:
-                task.result()
-
-        except asyncio.CancelledError:
-            await self._cancel_pending_tasks(pending, "cancelled")
-            raise
-
+        await self._run_children(
+            len(self.items),
+            lambda index: self.items[index].execute(store, self.id),
+        )
         logger.debug(
             "Finished concurrent items within %s (%s)",
             self.name,
@@ -230,6 +313,9 @@ class RunConcurrent(Node):
                     span,
                     _get_active_execution_correlation(),
                 )
+                record_child_span_attributes(span)
+                if self._max_concurrency is not None:
+                    span.set_attribute("junjo.run_concurrent.max_concurrency", self._max_concurrency)
                 if run_concurrent_structural_id is not None:
                     span.set_attribute(
                         "junjo.executable_structural_id",
@@ -250,7 +336,7 @@ class RunConcurrent(Node):
                         parent_active_identity.executable_structural_id,
                     )
 
-                if lifecycle_context is not None:
+                if lifecycle_context is not None and lifecycle_context.dispatcher.subscribes("run_concurrent_started"):
                     assert run_concurrent_structural_id is not None
                     trace_id, span_id = get_span_identifiers(span)
                     await lifecycle_context.dispatcher.run_concurrent_started(
@@ -427,7 +513,7 @@ class RunConcurrent(Node):
                         ),
                     )
 
-            if lifecycle_context is not None:
+            if lifecycle_context is not None and prepared_terminal_event is not None:
                 try:
                     await lifecycle_context.dispatcher.dispatch(
                         prepared_terminal_event,
@@ -442,3 +528,186 @@ class RunConcurrent(Node):
             raise cancellation
         if failure is not None:
             raise failure
+
+
+@dataclass(slots=True)
+class _MapSlot:
+    template_id: str
+    item: object
+    result: object = None
+
+
+_ACTIVE_MAP_SLOT: ContextVar[_MapSlot | None] = ContextVar("junjo_active_map_slot", default=None)
+
+
+def current_map_item() -> object:
+    """
+    Return the element the enclosing :class:`RunMap` is currently executing.
+
+    :class:`MapNode` templates receive their element directly. Use this
+    function from a :class:`~junjo.Subflow` template, for example in
+    ``pre_run_actions``, to seed the subflow store from the element.
+
+    :raises RuntimeError: If called outside a ``RunMap`` element execution.
+    """
+    slot = _ACTIVE_MAP_SLOT.get()
+    if slot is None:
+        raise RuntimeError("current_map_item() can only be called while a RunMap element executes.")
+    return slot.item
+
+
+class MapNode(Node[StoreT], Generic[StoreT, ItemT, ResultT]):
+    """
+    A node template that :class:`RunMap` executes once per element.
+
+    Implement :meth:`map_item` instead of :meth:`service`. Each execution gets
+    its own node span and lifecycle events, and the returned value is handed
+    to the ``RunMap`` merge callback together with the results of the other
+    elements.
+
+    .. rubric:: Example implementation
+
+    .. code-block:: python
+
+        class SummarizeDocumentNode(MapNode[DocumentStore, Document, str]):
+            async def map_item(self, item: Document, store: DocumentStore) -> str:
+                return await summarize(item.text)
+    """
+
+    @abstractmethod
+    async def map_item(self, item: ItemT, store: StoreT) -> ResultT:
+        """
+        Process one element selected by the enclosing :class:`RunMap`.
+
+        :param item: The element being processed.
+        :type item: ItemT
+        :param store: The run-local store shared by every element.
+        :type store: StoreT
+        :returns: The result passed to the ``RunMap`` merge callback.
+        :rtype: ResultT
+        """
+        raise NotImplementedError
+
+    async def service(self, store: StoreT) -> None:
+        """Run :meth:`map_item` for the element assigned by the enclosing ``RunMap``."""
+        slot = _ACTIVE_MAP_SLOT.get()
+        if slot is None or slot.template_id != self.id:
+            raise RuntimeError(f"{self.name} is a MapNode and can only run as a RunMap item.")
+        slot.result = await self.map_item(cast("ItemT", slot.item), store)
+
+
+class RunMap(RunConcurrent, Generic[StoreT, ItemT, ResultT]):
+    """
+    Execute one templated node or subflow per element of a state collection.
+
+    At execution time ``RunMap`` reads a sequence from the store with
+    ``select``, runs ``item`` once per element with the same first-failure
+    and ``max_concurrency`` semantics as :class:`RunConcurrent`, and passes
+    the results, in element order, to ``merge``. ``merge`` runs inside
+    :meth:`~junjo.BaseStore.transaction`, so every store action it calls is
+    committed as one batched update recorded under this ``RunMap``'s name.
+
+    A :class:`MapNode` template returns its result from
+    :meth:`MapNode.map_item`. A :class:`~junjo.Subflow` template reads its
+    element with :func:`current_map_item` and contributes its
+    :class:`~junjo.ExecutionResult`.
+
+    Each element execution opens its own span, tagged with
+    ``junjo.run_map.item_index``. In the compiled graph a ``RunMap`` is a
+    concurrent group with the template as its only child.
+
+    Like a :class:`RunConcurrent` item, the template is counted once per
+    ``RunMap`` execution in ``node_execution_counts``, not once per element.
+    Those counts bound graph loops with ``max_iterations``, which the number
+    of elements says nothing about; the element count is recorded on the
+    span as ``junjo.run_map.item_count``.
+
+    .. code-block:: python
+
+        summarize_documents = RunMap(
+            name="Summarize Documents",
+            item=SummarizeDocumentNode(),
+            select=lambda state: state.documents,
+            merge=lambda store, summaries: store.set_summaries(summaries),
+            max_concurrency=8,
+        )
+    """
+
+    def __init__(
+        self,
+        name: str,
+        item: MapNode[StoreT, ItemT, ResultT] | Subflow,
+        *,
+        select: Callable[[Any], Sequence[ItemT]],
+        merge: Callable[[StoreT, list[ResultT]], Awaitable[None]],
+        max_concurrency: int | None = None,
+    ):
+        """
+        :param name: The name of this map execution.
+        :type name: str
+        :param item: The template executed once per element.
+        :type item: MapNode | Subflow
+        :param select: Returns the elements to process from a detached state
+            snapshot.
+        :type select: Callable[[StateT], Sequence[ItemT]]
+        :param merge: Receives the store and the results in element order,
+            inside one store transaction.
+        :type merge: Callable[[StoreT, list[ResultT]], Awaitable[None]]
+        :param max_concurrency: The maximum number of elements processed at
+            once, or ``None`` to start every element immediately.
+        :type max_concurrency: int | None, optional
+        """
+        if isinstance(item, Node) and not isinstance(item, MapNode):
+            raise TypeError("RunMap item must be a MapNode or a Subflow.")
+        super().__init__(name, [item], max_concurrency=max_concurrency)
+        self._template = item
+        self._select = select
+        self._merge = merge
+
+    @property
+    def item(self) -> MapNode[StoreT, ItemT, ResultT] | Subflow:
+        """Return the template executed once per element."""
+        return self._template
+
+    def _child_span_attributes(self, index: int) -> dict[str, AttributeValue]:
+        return {"junjo.run_map.item_index": index}
+
+    async def _execute_element(self, store: BaseStore, item: object) -> object:
+        template = self.item
+        slot = _MapSlot(template.id, item)
+        _ACTIVE_MAP_SLOT.set(slot)
+        if isinstance(template, MapNode):
+            await template.execute(cast("StoreT", store), self.id)
+            return slot.result
+        return await template.execute(store, self.id)
+
+    async def service(self, store: BaseStore) -> None:
+        """
+        Run the template for every selected element, then merge the results.
+
+        If one element fails, the remaining elements are cancelled or skipped,
+        the original failure is re-raised, and ``merge`` is not called.
+        """
+        run_map_log_extra = self._log_extra(store)
+        elements = tuple(self._select(await store.get_state()))
+        trace.get_current_span().set_attribute("junjo.run_map.item_count", len(elements))
+        logger.debug(
+            "Mapping %d elements within %s (%s)",
+            len(elements),
+            self.name,
+            self.id,
+            extra=run_map_log_extra,
+        )
+        results = await self._run_children(
+            len(elements),
+            lambda index: self._execute_element(store, elements[index]),
+        )
+        async with store.transaction(self.name):
+            await self._merge(cast("StoreT", store), results)
+        logger.debug(
+            "Merged %d results within %s (%s)",
+            len(results),
+            self.name,
+            self.id,
+            extra=run_map_log_extra,
+        )
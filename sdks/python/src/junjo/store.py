@@ -1,21 +1,33 @@
 import abc
 import asyncio
+import contextlib
+import functools
 import inspect
+from collections.abc import AsyncGenerator, Awaitable, Callable, Collection, Generator, Mapping, Sequence
+from contextlib import AbstractAsyncContextManager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from types import NoneType
-from typing import Generic, TypeVar
+from typing import Any, Concatenate, Generic, Literal, ParamSpec, TypeAlias, TypeVar, cast, get_origin, overload
 
 from opentelemetry import trace
-from pydantic import ValidationError
+from pydantic import BaseModel, TypeAdapter, ValidationError
 
 from ._identity import (
     get_active_executable_identity,
     get_parent_active_executable_identity,
 )
-from ._json import JsonNestingDepthError, normalize_json, validate_json_nesting
+from ._json import (
+    JsonNestingDepthError,
+    JsonValue,
+    normalize_json,
+    require_ijson_text,
+    validate_json_nesting,
+)
 from ._lifecycle import GraphStoreLifecycleContext
 from .state import BaseState
 from .telemetry.span_lifecycle import get_current_span_identifiers
-from .telemetry.store_evidence import StoreEvidenceTracker, StoreOwnerEvidence
+from .telemetry.store_evidence import StoreEvidenceTracker, StoreEvidenceVerification, StoreOwnerEvidence
 from .util import generate_safe_id
 
 # State / Store
@@ -26,6 +38,221 @@ StoreT = TypeVar("StoreT", bound="BaseStore")
 ParentStateT = TypeVar("ParentStateT", bound="BaseState | NoneType")
 ParentStoreT = TypeVar("ParentStoreT", bound="BaseStore | NoneType")
 
+StateValidation: TypeAlias = Literal["partial", "full"]
+"""How :meth:`BaseStore.set_state` validates the state an update produces.
+
+``"partial"`` validates only the updated fields against the live, already
+validated state whenever the state model allows it. ``"full"`` re-validates
+every field of the merged state on every commit.
+"""
+
+# Store actions
+ActionStoreT = TypeVar("ActionStoreT", bound="BaseStore")
+ActionP = ParamSpec("ActionP")
+ActionR = TypeVar("ActionR")
+StoreAction = Callable[Concatenate[ActionStoreT, ActionP], Awaitable[ActionR]]
+
+# (store id, action name) bound by the innermost running ``@store_action``.
+_ACTIVE_STORE_ACTION: ContextVar[tuple[str, str] | None] = ContextVar(
+    "junjo_active_store_action",
+    default=None,
+)
+
+
+# Open transactions in the current context, keyed by store id.
+_ACTIVE_STORE_TRANSACTIONS: ContextVar[dict[str, "_StoreTransaction"] | None] = ContextVar(
+    "junjo_active_store_transactions",
+    default=None,
+)
+
+
+# (store id, recorded updates) collecting every ``set_state`` update made on
+# one store in the current context, used to capture the update a node produces.
+_ACTIVE_UPDATE_RECORDER: ContextVar[tuple[str, "_RecordedUpdates"] | None] = ContextVar(
+    "junjo_active_update_recorder",
+    default=None,
+)
+
+
+@dataclass(slots=True)
+class _StoreTransaction:
+    """Updates staged by one open :meth:`BaseStore.transaction` block."""
+
+    action_name: str
+    staged_update: dict = field(default_factory=dict)
+    open: bool = True
+
+
+@dataclass(slots=True)
+class _RecordedUpdates:
+    """Updates recorded by one :meth:`BaseStore._record_updates` block."""
+
+    update: dict = field(default_factory=dict)
+    # Set when an update was rejected or a transaction holding one was
+    # discarded, even if the caller swallowed the error.
+    failed: bool = False
+
+
+@overload
+def store_action(
+    action: StoreAction[ActionStoreT, ActionP, ActionR],
+    /,
+) -> StoreAction[ActionStoreT, ActionP, ActionR]: ...
+
+
+@overload
+def store_action(
+    *,
+    name: str | None = None,
+) -> Callable[
+    [StoreAction[ActionStoreT, ActionP, ActionR]],
+    StoreAction[ActionStoreT, ActionP, ActionR],
+]: ...
+
+
+def store_action(
+    action: StoreAction[ActionStoreT, ActionP, ActionR] | None = None,
+    /,
+    *,
+    name: str | None = None,
+) -> (
+    StoreAction[ActionStoreT, ActionP, ActionR]
+    | Callable[
+        [StoreAction[ActionStoreT, ActionP, ActionR]],
+        StoreAction[ActionStoreT, ActionP, ActionR],
+    ]
+):
+    """
+    Declare an async store method as a named store action.
+
+    :meth:`BaseStore.set_state` records the calling method's name as
+    ``junjo.store.action``. Undecorated actions are named by inspecting the
+    caller's frame on every commit; a decorated action binds its name once,
+    when the class is defined, and every ``set_state`` call it makes on its
+    own store uses that name directly.
+
+    The action name defaults to the method name, so decorating an existing
+    action does not change its telemetry. Pass ``name`` to record a different
+    label.
+
+    .. code-block:: python
+
+        class MessageWorkflowStore(BaseStore[MessageWorkflowState]):
+            @store_action
+            async def set_received_message(self, payload: Message) -> None:
+                await self.set_state({"received_message": payload})
+
+            @store_action(name="clear_message")
+            async def reset(self) -> None:
+                await self.set_state({"received_message": None})
+
+    :param name: The action name to record. Defaults to the method name.
+    :type name: str | None, optional
+    """
+
+    if name is not None:
+        require_ijson_text(name, "Store action name", nonempty=True)
+
+    def decorate(
+        method: StoreAction[ActionStoreT, ActionP, ActionR],
+    ) -> StoreAction[ActionStoreT, ActionP, ActionR]:
+        if not inspect.iscoroutinefunction(method):
+            raise TypeError("store_action can only decorate async store methods.")
+        action_name = getattr(method, "__name__", "unknown action") if name is None else name
+
+        @functools.wraps(method)
+        async def bound_action(self: ActionStoreT, *args: ActionP.args, **kwargs: ActionP.kwargs) -> ActionR:
+            token = _ACTIVE_STORE_ACTION.set((self._id, action_name))
+            try:
+                return await method(self, *args, **kwargs)
+            finally:
+                _ACTIVE_STORE_ACTION.reset(token)
+
+        return bound_action
+
+    if action is not None:
+        return decorate(action)
+    return decorate
+
+
+def _supports_field_scoped_projection(state_type: type[BaseModel]) -> bool:
+    """Return whether each top-level field projects independently of the others.
+
+    Model serializers, field serializers (which receive the whole model
+    instance), computed fields, and extra fields can couple one field's JSON
+    projection to other fields, so those state models always take the
+    complete-projection path.
+    """
+    decorators = state_type.__pydantic_decorators__
+    return not (
+        decorators.model_serializers
+        or decorators.field_serializers
+        or decorators.computed_fields
+        or state_type.model_config.get("extra") == "allow"
+    )
+
+
+@functools.cache
+def _supports_partial_validation(state_type: type[BaseModel]) -> bool:
+    """Return whether validating only updated fields matches full validation.
+
+    Field-by-field assignment validation reuses the live state's validated
+    values for untouched fields. Before, wrap, and plain model validators see
+    different input under assignment, ``model_post_init`` and private
+    attribute defaults only run for a fresh instance, frozen fields reject
+    assignment, and extra fields are stored differently, so those models
+    always re-validate the complete state. ``after`` model validators still
+    run on the assigned result.
+    """
+
+    return (
+        all(
+            decorator.info.mode == "after" for decorator in state_type.__pydantic_decorators__.model_validators.values()
+        )
+        and not state_type.model_config.get("frozen")
+        and not any(field.frozen for field in state_type.model_fields.values())
+        and state_type.__pydantic_post_init__ is None
+        and not state_type.__private_attributes__
+        and state_type.model_config.get("extra") != "allow"
+    )
+
+
+@functools.cache
+def _append_adapter(state_type: type[BaseModel], field_name: str) -> TypeAdapter[Any] | None:
+    """Return an adapter that validates only the items appended to a list field.
+
+    Validating the new items on their own matches validating the whole list
+    only when nothing inspects the list as a whole. Field constraints and
+    validators, model validators, serialization controls, and models that
+    need full validation make ``None`` the answer, and appends to such
+    fields replace the complete list instead.
+    """
+
+    field = state_type.model_fields.get(field_name)
+    decorators = state_type.__pydantic_decorators__
+    if (
+        field is None
+        or get_origin(field.annotation) is not list
+        or field.metadata
+        or field.exclude
+        or decorators.model_validators
+        or any(
+            field_name in decorator.info.fields or "*" in decorator.info.fields
+            for decorator in decorators.field_validators.values()
+        )
+        or not _supports_partial_validation(state_type)
+        or not _supports_field_scoped_projection(state_type)
+        or state_type.model_config.get("serialize_by_alias")
+    ):
+        return None
+    return TypeAdapter(cast(Any, field.annotation), config=state_type.model_config)
+
+
+def _runtime_value_changed(before: object, after: object) -> bool:
+    """Return whether an untouched field may project differently after validation."""
+
+    return type(before) is not type(after) or before != after
+
 
 class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
     """
@@ -61,11 +288,38 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
                 await self.set_state({"processed_data": data})
     """
 
-    def __init__(self, initial_state: StateT) -> None:
+    def __init__(
+        self,
+        initial_state: StateT,
+        *,
+        evidence_verification: StoreEvidenceVerification = "incremental",
+        max_retained_transitions: int | None = None,
+        state_validation: StateValidation = "partial",
+    ) -> None:
         """
         :param initial_state: The initial state of the store.
         :type initial_state: StateT
+        :param evidence_verification: How terminal Store evidence proves that
+            the recorded patches reconstruct the end state. ``"incremental"``
+            (the default) applies each patch to a running replica as it is
+            committed; ``"replay"`` replays every retained patch in one pass
+            when the run finishes.
+        :type evidence_verification: Literal["incremental", "replay"], optional
+        :param max_retained_transitions: Keep only this many recent transition
+            records in memory. Transition counts, revisions, and
+            reconstruction evidence still cover every commit. Requires
+            incremental verification. Defaults to retaining all transitions.
+        :type max_retained_transitions: int | None, optional
+        :param state_validation: How updates are validated. ``"partial"``
+            (the default) validates only the fields an update names and
+            reuses the live state's validated values for the rest, falling
+            back to full validation for state models whose validators need
+            the complete input. ``"full"`` re-validates every field on every
+            commit.
+        :type state_validation: Literal["partial", "full"], optional
         """
+        if state_validation not in ("partial", "full"):
+            raise ValueError(f"Unknown state validation mode: {state_validation!r}.")
         raw_initial_state = {
             field_name: getattr(initial_state, field_name) for field_name in type(initial_state).model_fields
         }
@@ -77,26 +331,57 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
             raise JsonNestingDepthError("Store state serialization exceeded the JSON nesting bound.") from exc
         self._lock = asyncio.Lock()
         self._id = generate_safe_id()
+        self._event_attributes = {
+            "junjo.store.name": type(self).__name__,
+            "junjo.store.id": self._id,
+        }
         self._state: StateT = owned_initial_state
+        self._state_validation = state_validation
         self._lifecycle_context: GraphStoreLifecycleContext | None = None
-        self._telemetry_evidence = StoreEvidenceTracker(initial_projection)
+        self._telemetry_evidence = StoreEvidenceTracker(
+            initial_projection,
+            verification=evidence_verification,
+            max_retained_transitions=max_retained_transitions,
+        )
 
     @property
     def id(self) -> str:
         """Returns the unique identifier of this store instance."""
         return self._id
 
-    async def get_state(self) -> StateT:
+    async def get_state(self, *, detached: bool = True) -> StateT:
         """
-        Return a detached deep copy of the current state.
-
-        This method follows the immutability principle for read access: callers
-        receive a deep snapshot that can be inspected freely without mutating
-        the live store. Store updates must still flow through store actions and
-        :meth:`set_state`.
+        Return a snapshot of the current state.
+
+        By default this method follows the immutability principle for read
+        access: callers receive a detached deep snapshot that can be inspected
+        and mutated freely without affecting the live store. Store updates must
+        still flow through store actions and :meth:`set_state`.
+
+        Pass ``detached=False`` for a cheap read-only snapshot. Committed
+        revisions are never mutated in place, because :meth:`set_state`
+        validates a new revision and swaps it in. A shared snapshot therefore
+        costs a shallow copy of the top-level fields instead of a deep copy of
+        the whole state, and it remains a consistent view of the revision it
+        was read from after later commits. Callers must treat it as
+        read-only: mutating nested values of a shared snapshot would corrupt
+        the live store.
+
+        Inside an open :meth:`transaction` on this store, the snapshot also
+        shows the updates staged so far, as passed and not yet validated.
+
+        :param detached: Whether to return a mutable deep copy. Defaults to
+            ``True``.
+        :type detached: bool
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            staged_state = self._state.model_copy(update=transaction.staged_update)
+            return staged_state.model_copy(deep=True) if detached else staged_state
         async with self._lock:
-            return self._state.model_copy(deep=True)
+            if detached:
+                return self._state.model_copy(deep=True)
+            return self._state.model_copy()
 
     def _get_last_known_state(self) -> StateT:
         """Return a detached emergency snapshot without awaiting Store machinery.
@@ -115,6 +400,9 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
         This is useful for logging, tracing, or serializing the current state
         without manually calling ``model_dump_json`` on a snapshot.
         """
+        transaction = self._active_transaction()
+        if transaction is not None:
+            return self._state.model_copy(update=transaction.staged_update).model_dump_json()
         async with self._lock:
             return self._state.model_dump_json()
 
@@ -130,9 +418,76 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
         serialization controls such as ``Field(exclude=True)`` and
         ``field_serializer`` are telemetry-facing concerns, not live state
         transition mechanics.
+
+        Values are shared with the live revision rather than deep-copied.
+        Committed revisions are never mutated in place, so validation of the
+        next revision can read them directly.
+        """
+        return {field_name: getattr(self._state, field_name) for field_name in type(self._state).model_fields}
+
+    def _validated_state(self, update: dict) -> StateT:
+        """Return the validated state that merging ``update`` into the live state produces.
+
+        On the partial path each updated field is validated by assignment on
+        a shallow copy of the live revision, so untouched fields keep their
+        already validated values. Updates that name several fields of a model
+        with ``after`` model validators take the full path, because those
+        validators would otherwise also run on intermediate states.
+
+        :raises ValidationError: If the merged state is invalid.
+        """
+
+        state_type = type(self._state)
+        if (
+            self._state_validation == "partial"
+            and _supports_partial_validation(state_type)
+            and (len(update) <= 1 or not state_type.__pydantic_decorators__.model_validators)
+        ):
+            new_state = self._state.model_copy()
+            for field_name, value in update.items():
+                state_type.__pydantic_validator__.validate_assignment(new_state, field_name, value)
+            return new_state
+        return state_type.model_validate({**self._current_runtime_state_data(), **update})
+
+    def _transition_projections(
+        self,
+        new_state: StateT,
+        update: dict,
+        appended_fields: Collection[str] = (),
+    ) -> tuple[JsonValue, JsonValue]:
+        """Return the before and after projections one exact transition patch needs.
+
+        Top-level fields that were not named in ``update`` and whose validated
+        runtime value is unchanged contribute no RFC 6902 operations, so both
+        projections are restricted to the remaining fields. Diffing those
+        restricted objects yields exactly the patch that diffing complete
+        projections would, while serialization cost scales with the changed
+        fields instead of the whole state. The before-image is always the
+        tracker's cached projection of the live state, never a fresh dump.
+        ``appended_fields`` are left out entirely; the tracker records their
+        new items as ``add`` operations.
         """
-        state_snapshot = self._state.model_copy(deep=True)
-        return {field_name: getattr(state_snapshot, field_name) for field_name in type(state_snapshot).model_fields}
+
+        state_type = type(new_state)
+        if not _supports_field_scoped_projection(state_type):
+            return (
+                self._telemetry_evidence.current_projection(),
+                normalize_json(new_state.model_dump(mode="json")),
+            )
+
+        changed_fields = {
+            field_name
+            for field_name in state_type.model_fields
+            if field_name not in appended_fields
+            and (
+                field_name in update
+                or _runtime_value_changed(getattr(self._state, field_name), getattr(new_state, field_name))
+            )
+        }
+        return (
+            self._telemetry_evidence.current_projection(changed_fields),
+            normalize_json(new_state.model_dump(mode="json", include=changed_fields)),
+        )
 
     async def _get_store_owner_evidence(self) -> StoreOwnerEvidence:
         """Return verified terminal evidence under the Store lock."""
@@ -151,6 +506,142 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
         async with self._lock:
             return self._telemetry_evidence.revision
 
+    def _action_name(self) -> str:
+        """Return the action name for a Store call made by the caller's caller.
+
+        A :func:`store_action` bound to this store names the action without
+        inspecting frames; otherwise the function that called the public
+        Store method is used.
+        """
+
+        active_action = _ACTIVE_STORE_ACTION.get()
+        if active_action is not None and active_action[0] == self._id:
+            return active_action[1]
+        caller_frame = inspect.currentframe()
+        # Skip this helper and the public Store method that called it.
+        for _ in range(2):
+            caller_frame = caller_frame.f_back if caller_frame is not None else None
+        return caller_frame.f_code.co_name if caller_frame is not None else "unknown action"
+
+    def _active_transaction(self) -> "_StoreTransaction | None":
+        """Return this store's open transaction in the current context, if any."""
+
+        transactions = _ACTIVE_STORE_TRANSACTIONS.get()
+        if transactions is None:
+            return None
+        transaction = transactions.get(self._id)
+        if transaction is None or not transaction.open:
+            return None
+        return transaction
+
+    def transaction(self, name: str | None = None) -> AbstractAsyncContextManager[None]:
+        """
+        Batch several store updates into one committed revision.
+
+        Inside the ``async with`` block, every :meth:`set_state` call on this
+        store, including calls made by store actions, stages its update
+        instead of committing it. When the block exits normally the staged
+        updates are shallow-merged in call order and committed once: one
+        validation, one revision, one RFC 6902 patch, one ``set_state`` span
+        event, and one lifecycle state-changed hook. If the block raises,
+        every staged update is discarded and the store is left untouched.
+
+        The store lock is held for the whole block, so the batch is atomic
+        with respect to other tasks. :meth:`get_state` inside the block
+        returns the committed state with the staged updates applied.
+
+        .. code-block:: python
+
+            class ChatWorkflowStore(BaseStore[ChatWorkflowState]):
+                @store_action
+                async def finish_turn(self, reply: str) -> None:
+                    async with self.transaction():
+                        await self.append_message(reply)
+                        await self.set_is_typing(False)
+                        await self.set_error(None)
+
+        .. note::
+
+            Staged updates are validated together when the block exits, so
+            model validators see only the combined result. A validation
+            failure raises ``ValueError`` from the ``async with`` statement
+            and commits nothing.
+
+        .. note::
+
+            Avoid long awaits on unrelated I/O inside the block: other tasks
+            cannot read or update the store until it exits. Opening a
+            transaction on a store that already has one open in the current
+            task joins the outer transaction.
+
+        The combined commit is recorded as ``junjo.store.action`` under
+        ``name`` when it is given, and under the name of the action that
+        opened the transaction otherwise. Nodes that commit on behalf of
+        several actions pass their own name.
+
+        :param name: The action name to record for the combined commit.
+        :type name: str | None
+        """
+
+        return self._transaction(self._action_name() if name is None else name)
+
+    @contextlib.contextmanager
+    def _record_updates(self) -> Generator[_RecordedUpdates]:
+        """Collect the updates passed to :meth:`set_state` in this context.
+
+        The yielded record holds every update committed or staged on this
+        store inside the block, shallow-merged in call order, and is marked
+        failed if any update was rejected or discarded. Updates still commit
+        normally.
+        """
+
+        recorded = _RecordedUpdates()
+        token = _ACTIVE_UPDATE_RECORDER.set((self._id, recorded))
+        try:
+            yield recorded
+        finally:
+            _ACTIVE_UPDATE_RECORDER.reset(token)
+
+    def _update_recorder(self) -> _RecordedUpdates | None:
+        """Return the active :meth:`_record_updates` record for this store, if any."""
+
+        recorder = _ACTIVE_UPDATE_RECORDER.get()
+        if recorder is None or recorder[0] != self._id:
+            return None
+        return recorder[1]
+
+    @contextlib.asynccontextmanager
+    async def _transaction(self, action_name: str) -> AsyncGenerator[None, None]:
+        """Hold the Store lock, stage updates, and commit them once on success."""
+
+        if self._active_transaction() is not None:
+            yield
+            return
+
+        transaction = _StoreTransaction(action_name)
+        state_changed_payload: dict | None = None
+        recorder = self._update_recorder()
+        async with self._lock:
+            token = _ACTIVE_STORE_TRANSACTIONS.set({**(_ACTIVE_STORE_TRANSACTIONS.get() or {}), self._id: transaction})
+            try:
+                yield
+            except BaseException:
+                if recorder is not None:
+                    recorder.failed = True
+                raise
+            finally:
+                transaction.open = False
+                _ACTIVE_STORE_TRANSACTIONS.reset(token)
+            if transaction.staged_update:
+                try:
+                    state_changed_payload = self._commit_locked(transaction.staged_update, action_name)
+                except BaseException:
+                    if recorder is not None:
+                        recorder.failed = True
+                    raise
+        if state_changed_payload is not None and self._lifecycle_context is not None:
+            await self._lifecycle_context.dispatcher.state_changed(**state_changed_payload)
+
     async def set_state(self, update: dict) -> None:
         """
         Update the store's state with a dictionary of changes.
@@ -201,122 +692,248 @@ class BaseStore(Generic[StateT], metaclass=abc.ABCMeta):
 
             If the resulting state is unchanged, the store remains untouched
             and an empty patch is recorded in telemetry.
+
+        .. note::
+
+            Inside an open :meth:`transaction` on this store, the update is
+            staged and committed together with the rest of the transaction
+            when its block exits.
+
+        .. note::
+
+            The ``junjo.store.action`` recorded for the commit is the name
+            bound by the enclosing :func:`store_action` on this store, or the
+            calling function's name otherwise. Each event's ``id`` is the
+            store id joined with the transition sequence, so it is unique
+            across stores and runs.
         """
-        caller_frame = inspect.currentframe()
-        if caller_frame:
-            caller_frame = caller_frame.f_back
-        caller_function_name = caller_frame.f_code.co_name if caller_frame else "unknown action"
-        store_name = type(self).__name__
+        caller_function_name = self._action_name()
+        recorder = self._update_recorder()
+        transaction = self._active_transaction()
+        try:
+            if transaction is not None:
+                validate_json_nesting(update)
+                transaction.staged_update.update(update)
+            else:
+                async with self._lock:
+                    state_changed_payload = self._commit_locked(update, caller_function_name)
+        except BaseException:
+            if recorder is not None:
+                recorder.failed = True
+            raise
+        if recorder is not None:
+            recorder.update.update(update)
+        if transaction is not None:
+            return
+        if state_changed_payload is not None and self._lifecycle_context is not None:
+            await self._lifecycle_context.dispatcher.state_changed(**state_changed_payload)
 
-        state_changed_payload: dict | None = None
-        async with self._lock:
-            validate_json_nesting(update)
-            try:
-                new_state = type(self._state).model_validate({**self._current_runtime_state_data(), **update})
-            except ValidationError as e:
-                raise ValueError(
-                    f"Invalid state update from caller {store_name} -> {caller_function_name}.\n"
-                    f"Check that you are updating a valid state property and type: {e}"
-                ) from e
-
-            state_json_before = normalize_json(self._state.model_dump(mode="json"))
-            state_json_after = normalize_json(new_state.model_dump(mode="json"))
-            live_state_changed = new_state != self._state
-            transition = self._telemetry_evidence.record(
-                projection_before=state_json_before,
-                projection_after=state_json_after,
-                live_state_changed=live_state_changed,
-            )
+    async def _append_state(self, appends: Mapping[str, Sequence[object]], update: dict | None = None) -> None:
+        """Append items to list fields and apply ``update`` in one commit.
+
+        This protected boundary commits exactly what :meth:`set_state` would
+        for ``update`` plus each named list extended by its new items, and
+        records the same RFC 6902 patch. When :func:`_append_adapter` accepts
+        a field, only its new items are validated and serialized and the
+        existing list is never validated, dumped, or diffed.
+
+        The new revision still holds a new list object: committed revisions
+        are never mutated in place, so shared snapshots from
+        :meth:`get_state` keep the length they were read with. That copy
+        moves item references only and is a small fraction of the per-item
+        validation, serialization, and diffing it replaces.
+        """
 
-            if live_state_changed:
-                self._state = new_state
-
-            current_span = trace.get_current_span()
-            if current_span.is_recording():
-                current_span.add_event(
-                    name="set_state",
-                    attributes={
-                        "id": generate_safe_id(),
-                        "junjo.store.name": store_name,
-                        "junjo.store.id": self.id,
-                        "junjo.store.action": caller_function_name,
-                        **self._telemetry_evidence.transition_attributes(transition),
-                    },
-                )
-
-            if live_state_changed and self._lifecycle_context is not None:
-                trace_id, span_id = get_current_span_identifiers()
-                active_identity = get_active_executable_identity()
-                parent_active_identity = get_parent_active_executable_identity()
-                state_changed_payload = {
-                    "run_id": self._lifecycle_context.run_id,
-                    "executable_definition_id": (
-                        active_identity.executable_definition_id
-                        if active_identity is not None
-                        else self._lifecycle_context.executable_definition_id
-                    ),
-                    "name": (
-                        active_identity.executable_name if active_identity is not None else self._lifecycle_context.name
-                    ),
-                    "span_type": (
-                        active_identity.executable_type
-                        if active_identity is not None
-                        else self._lifecycle_context.executable_type
-                    ),
-                    "store_id": self.id,
-                    "store_name": store_name,
-                    "action_name": caller_function_name,
-                    "patch": transition.patch_json,
-                    "state": new_state.model_copy(deep=True),
-                    "parent_executable_definition_id": (
-                        parent_active_identity.executable_definition_id
-                        if parent_active_identity is not None
-                        else self._lifecycle_context.executable_definition_id
-                    ),
-                    "trace_id": trace_id,
-                    "span_id": span_id,
-                    "executable_runtime_id": (
-                        active_identity.executable_runtime_id
-                        if active_identity is not None
-                        else self._lifecycle_context.executable_runtime_id
-                    ),
-                    "executable_structural_id": (
-                        active_identity.executable_structural_id
-                        if active_identity is not None
-                        else self._lifecycle_context.executable_structural_id
-                    ),
-                    "enclosing_graph_structural_id": (self._lifecycle_context.enclosing_graph_structural_id),
-                    "parent_executable_runtime_id": (
-                        parent_active_identity.executable_runtime_id if parent_active_identity is not None else None
-                    ),
-                    "parent_executable_structural_id": (
-                        parent_active_identity.executable_structural_id if parent_active_identity is not None else None
-                    ),
-                    "parent_executable_type": (
-                        parent_active_identity.executable_type if parent_active_identity is not None else None
-                    ),
-                }
+        caller_function_name = self._action_name()
+        update = dict(update or {})
+        if self._active_transaction() is not None:
+            # Staged updates are merged as field replacements.
+            state = await self.get_state(detached=False)
+            await self.set_state(
+                {**update, **{name: [*getattr(state, name), *items] for name, items in appends.items()}}
+            )
+            return
 
+        recorder = self._update_recorder()
+        try:
+            async with self._lock:
+                state_changed_payload = self._commit_locked(update, caller_function_name, appends)
+                if recorder is not None:
+                    recorder.update.update({**update, **{name: getattr(self._state, name) for name in appends}})
+        except BaseException:
+            if recorder is not None:
+                recorder.failed = True
+            raise
         if state_changed_payload is not None and self._lifecycle_context is not None:
             await self._lifecycle_context.dispatcher.state_changed(**state_changed_payload)
 
-    async def _validate_state_update(self, update: dict) -> None:
+    def _validated_transition(
+        self,
+        update: dict,
+        appends: Mapping[str, Sequence[object]] | None,
+    ) -> tuple[StateT, dict, dict[str, list[JsonValue]]]:
+        """Return the new state, its effective update, and appended item projections.
+
+        Appends to fields :func:`_append_adapter` rejects become replacements
+        of the complete list in the effective update.
+
+        :raises ValidationError: If the new state or an appended item is invalid.
+        """
+
+        state_type = type(self._state)
+        validate_json_nesting(update)
+        appended: dict[str, tuple[TypeAdapter[Any], list[Any]]] = {}
+        for field_name, items in (appends or {}).items():
+            if not items:
+                continue
+            validate_json_nesting({field_name: list(items)})
+            adapter = _append_adapter(state_type, field_name) if self._state_validation == "partial" else None
+            if adapter is None:
+                update = {**update, field_name: [*getattr(self._state, field_name, ()), *items]}
+            else:
+                appended[field_name] = (adapter, adapter.validate_python(list(items)))
+
+        new_state = self._validated_state(update)
+        if not appended:
+            return new_state, update, {}
+        new_state = new_state.model_copy(
+            update={name: [*getattr(self._state, name), *items] for name, (_, items) in appended.items()}
+        )
+        return (
+            new_state,
+            update,
+            {
+                name: cast(list[JsonValue], normalize_json(adapter.dump_python(items, mode="json")))
+                for name, (adapter, items) in appended.items()
+            },
+        )
+
+    def _commit_locked(
+        self,
+        update: dict,
+        caller_function_name: str,
+        appends: Mapping[str, Sequence[object]] | None = None,
+    ) -> dict | None:
+        """Validate and commit one update while the caller holds the Store lock.
+
+        Records the transition evidence and ``set_state`` span event, and
+        returns the lifecycle state-changed payload the caller must dispatch
+        after releasing the lock, or ``None`` when no ``state_changed`` hook
+        is subscribed or the state did not change.
+        """
+
+        store_name = type(self).__name__
+        try:
+            new_state, update, appended = self._validated_transition(update, appends)
+        except ValidationError as e:
+            raise ValueError(
+                f"Invalid state update from caller {store_name} -> {caller_function_name}.\n"
+                f"Check that you are updating a valid state property and type: {e}"
+            ) from e
+
+        state_json_before, state_json_after = self._transition_projections(new_state, update, appended)
+        live_state_changed = bool(appended) or new_state != self._state
+        transition = self._telemetry_evidence.record(
+            projection_before=state_json_before,
+            projection_after=state_json_after,
+            live_state_changed=live_state_changed,
+            appended=appended,
+        )
+
+        if live_state_changed:
+            self._state = new_state
+
+        current_span = trace.get_current_span()
+        if current_span.is_recording():
+            current_span.add_event(
+                name="set_state",
+                attributes={
+                    **self._event_attributes,
+                    "id": f"{self._id}:{transition.sequence}",
+                    "junjo.store.action": caller_function_name,
+                    **self._telemetry_evidence.transition_attributes(transition),
+                },
+            )
+
+        if (
+            live_state_changed
+            and self._lifecycle_context is not None
+            and self._lifecycle_context.dispatcher.subscribes("state_changed")
+        ):
+            trace_id, span_id = get_current_span_identifiers()
+            active_identity = get_active_executable_identity()
+            parent_active_identity = get_parent_active_executable_identity()
+            return {
+                "run_id": self._lifecycle_context.run_id,
+                "executable_definition_id": (
+                    active_identity.executable_definition_id
+                    if active_identity is not None
+                    else self._lifecycle_context.executable_definition_id
+                ),
+                "name": (
+                    active_identity.executable_name if active_identity is not None else self._lifecycle_context.name
+                ),
+                "span_type": (
+                    active_identity.executable_type
+                    if active_identity is not None
+                    else self._lifecycle_context.executable_type
+                ),
+                "store_id": self.id,
+                "store_name": store_name,
+                "action_name": caller_function_name,
+                "patch": transition.patch_json,
+                "state": new_state.model_copy(deep=True),
+                "parent_executable_definition_id": (
+                    parent_active_identity.executable_definition_id
+                    if parent_active_identity is not None
+                    else self._lifecycle_context.executable_definition_id
+                ),
+                "trace_id": trace_id,
+                "span_id": span_id,
+                "executable_runtime_id": (
+                    active_identity.executable_runtime_id
+                    if active_identity is not None
+                    else self._lifecycle_context.executable_runtime_id
+                ),
+                "executable_structural_id": (
+                    active_identity.executable_structural_id
+                    if active_identity is not None
+                    else self._lifecycle_context.executable_structural_id
+                ),
+                "enclosing_graph_structural_id": (self._lifecycle_context.enclosing_graph_structural_id),
+                "parent_executable_runtime_id": (
+                    parent_active_identity.executable_runtime_id if parent_active_identity is not None else None
+                ),
+                "parent_executable_structural_id": (
+                    parent_active_identity.executable_structural_id if parent_active_identity is not None else None
+                ),
+                "parent_executable_type": (
+                    parent_active_identity.executable_type if parent_active_identity is not None else None
+                ),
+            }
+        return None
+
+    async def _validate_state_update(
+        self,
+        update: dict,
+        appends: Mapping[str, Sequence[object]] | None = None,
+    ) -> None:
         """Validate one prospective state and exact patch without committing it.
 
         Execution kernels use this protected boundary when an application
         value must be classified before entering a later terminal transaction.
         Public Store mutations still flow only through :meth:`set_state`.
+        ``appends`` preflights the same commit :meth:`_append_state` makes.
         """
 
         async with self._lock:
-            validate_json_nesting(update)
             try:
-                new_state = type(self._state).model_validate({**self._current_runtime_state_data(), **update})
+                new_state, update, appended = self._validated_transition(update, appends)
             except ValidationError as exc:
                 raise ValueError("Invalid prospective state update.") from exc
-            state_json_before = normalize_json(self._state.model_dump(mode="json"))
-            state_json_after = normalize_json(new_state.model_dump(mode="json"))
+            state_json_before, state_json_after = self._transition_projections(new_state, update, appended)
             self._telemetry_evidence.validate_transition(
                 projection_before=state_json_before,
                 projection_after=state_json_after,
+                appended=appended,
             )
@@ -7,10 +7,16 @@ from opentelemetry.trace import Span
 from .._json import json_dumps
 
 FULL_PAYLOAD_POLICY = "junjo.full.v1"
+DELTA_PAYLOAD_POLICY = "junjo.delta.v1"
 
 
 def encode_json(value: object) -> str:
-    """Validate and encode one portable payload as deterministic JSON."""
+    """Validate and encode one portable payload as deterministic JSON.
+
+    Encoding uses the backend selected by :func:`junjo.set_json_encoder`,
+    which defaults to orjson when it is installed. Every backend produces the
+    same text.
+    """
 
     return json_dumps(value)
 
@@ -30,3 +36,17 @@ def set_full_payload(span: Span, root: str, value: object) -> None:
 
     for name, encoded in full_payload_attributes(root, value).items():
         span.set_attribute(name, encoded)
+
+
+def delta_payload_attributes(root: str, value: object) -> dict[str, str]:
+    """Build the complete adjacent metadata for one delta-evidence slot.
+
+    Consumers rebuild the complete value from the referenced evidence; the
+    slot is never complete on its own.
+    """
+
+    return {
+        root: encode_json(value),
+        f"{root}.mode": "delta",
+        f"{root}.policy": DELTA_PAYLOAD_POLICY,
+    }
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import asyncio
+from contextvars import ContextVar
 
 from opentelemetry import trace
 from opentelemetry.trace import Span
+from opentelemetry.util.types import AttributeValue
 
 from .diagnostics import (
     cancellation_reason,
@@ -13,6 +15,11 @@ from .diagnostics import (
     exception_stacktrace,
 )
 
+_PENDING_CHILD_SPAN_ATTRIBUTES: ContextVar[dict[str, AttributeValue] | None] = ContextVar(
+    "junjo_pending_child_span_attributes",
+    default=None,
+)
+
 
 def mark_span_failed(span: Span, exc: BaseException) -> None:
     """Annotate a span as failed using standard OpenTelemetry error fields."""
@@ -73,3 +80,23 @@ def get_current_span_identifiers() -> tuple[str, str]:
     :rtype: tuple[str, str]
     """
     return get_span_identifiers(trace.get_current_span())
+
+
+def set_child_span_attributes(attributes: dict[str, AttributeValue]) -> None:
+    """Stage attributes for the next span a ``RunConcurrent`` child opens.
+
+    The value is scoped to the child's task and consumed by the first span the
+    child opens, see :func:`record_child_span_attributes`.
+    """
+
+    _PENDING_CHILD_SPAN_ATTRIBUTES.set(attributes)
+
+
+def record_child_span_attributes(span: Span) -> None:
+    """Attach and clear staged ``RunConcurrent`` child attributes, if any."""
+
+    attributes = _PENDING_CHILD_SPAN_ATTRIBUTES.get()
+    if attributes is None:
+        return
+    _PENDING_CHILD_SPAN_ATTRIBUTES.set(None)
+    span.set_attributes(attributes)
@@ -3,13 +3,23 @@
 from __future__ import annotations
 
 import copy
+from collections import deque
+from collections.abc import Collection, Mapping
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Literal, TypeAlias
 
 import jsonpatch
 
 from .payload import FULL_PAYLOAD_POLICY, encode_json
 
+StoreEvidenceVerification: TypeAlias = Literal["incremental", "replay"]
+"""How terminal evidence proves the recorded patches reconstruct the end state.
+
+``"incremental"`` applies each patch in place to a running replica when it is
+recorded. ``"replay"`` retains every transition and applies them in one
+in-place pass over a single copy of the start state at finalization.
+"""
+
 
 @dataclass(frozen=True, slots=True)
 class StoreTransitionEvidence:
@@ -38,12 +48,36 @@ class StoreOwnerEvidence:
 
 
 class StoreEvidenceTracker:
-    """Retain full-policy transition facts independently from OpenTelemetry export."""
+    """Retain full-policy transition facts independently from OpenTelemetry export.
+
+    The tracker also owns the validated JSON projection of the live state. It
+    is replaced copy-on-write at the top-level field boundary on every live
+    commit and never mutated in place, so the previous commit's after-image is
+    reused as the next before-image without re-serializing the state.
+    Terminal evidence is checked against a fresh projection of the live state.
+    """
 
-    def __init__(self, initial_projection: Any) -> None:
+    def __init__(
+        self,
+        initial_projection: Any,
+        *,
+        verification: StoreEvidenceVerification = "incremental",
+        max_retained_transitions: int | None = None,
+    ) -> None:
+        if verification not in ("incremental", "replay"):
+            raise ValueError(f"Unknown Store evidence verification mode: {verification!r}.")
+        if max_retained_transitions is not None:
+            if max_retained_transitions < 0:
+                raise ValueError("max_retained_transitions must be non-negative.")
+            if verification == "replay":
+                raise ValueError("Replay verification requires every transition to be retained.")
         self._state_start = copy.deepcopy(initial_projection)
+        self._projection: dict[str, Any] = copy.deepcopy(initial_projection)
+        self._replica: Any = copy.deepcopy(initial_projection) if verification == "incremental" else None
+        self._replica_consistent = True
         self._revision = 0
-        self._transitions: list[StoreTransitionEvidence] = []
+        self._transition_count = 0
+        self._transitions: deque[StoreTransitionEvidence] = deque(maxlen=max_retained_transitions)
 
     @property
     def revision(self) -> int:
@@ -51,27 +85,55 @@ class StoreEvidenceTracker:
 
     @property
     def transition_count(self) -> int:
-        return len(self._transitions)
+        return self._transition_count
+
+    @property
+    def retained_transitions(self) -> tuple[StoreTransitionEvidence, ...]:
+        """Return the most recent transitions still held by this tracker."""
+
+        return tuple(self._transitions)
 
     @property
     def state_start(self) -> Any:
         return copy.deepcopy(self._state_start)
 
+    def current_projection(self, field_names: Collection[str] | None = None) -> dict[str, Any]:
+        """Return the cached live projection, optionally restricted to top-level fields.
+
+        The result shares nested values with the owned projection and must be
+        treated as read-only.
+        """
+
+        if field_names is None:
+            return dict(self._projection)
+        return {name: value for name, value in self._projection.items() if name in field_names}
+
     def record(
         self,
         *,
         projection_before: Any,
         projection_after: Any,
         live_state_changed: bool,
+        appended: Mapping[str, list[Any]] | None = None,
     ) -> StoreTransitionEvidence:
+        """Record one transition in lock order.
+
+        ``appended`` maps top-level array fields to the projections of items
+        appended to them. Those fields are left out of both projections and
+        each item becomes one ``add`` operation, so the existing array is
+        never diffed. The cached projection receives a new array holding the
+        same item references, because earlier projections may be shared.
+        """
+
         raw_patch, encoded_patch = self._validated_patch(
             projection_before,
             projection_after,
+            self._append_operations(appended),
         )
         revision_before = self._revision
         revision_after = revision_before + (1 if live_state_changed else 0)
         transition = StoreTransitionEvidence(
-            sequence=len(self._transitions) + 1,
+            sequence=self._transition_count + 1,
             revision_before=revision_before,
             revision_after=revision_after,
             patch=tuple(copy.deepcopy(raw_patch)),
@@ -81,57 +143,117 @@ class StoreEvidenceTracker:
         if transition.patch_json != encoded_patch:
             raise ValueError("Store transition patch encoding was not deterministic.")
         self._revision = revision_after
+        self._transition_count = transition.sequence
         self._transitions.append(transition)
+        if self._replica is not None and self._replica_consistent:
+            # The replica is mutated in place, so it must never share values
+            # with retained patches or the cached projection.
+            try:
+                self._replica = jsonpatch.JsonPatch(copy.deepcopy(raw_patch)).apply(self._replica, in_place=True)
+            except Exception:
+                self._replica_consistent = False
+        if live_state_changed:
+            # The tracker takes ownership of ``projection_after``; either a
+            # complete projection or one restricted to the changed fields.
+            self._projection = {
+                **self._projection,
+                **projection_after,
+                **{name: [*self._projection[name], *items] for name, items in (appended or {}).items()},
+            }
         return transition
 
-    def validate_transition(self, *, projection_before: Any, projection_after: Any) -> None:
+    def validate_transition(
+        self,
+        *,
+        projection_before: Any,
+        projection_after: Any,
+        appended: Mapping[str, list[Any]] | None = None,
+    ) -> None:
         """Prove an exact RFC 6902 transition is portable without mutation."""
 
-        self._validated_patch(projection_before, projection_after)
+        self._validated_patch(projection_before, projection_after, self._append_operations(appended))
+
+    def _append_operations(self, appended: Mapping[str, list[Any]] | None) -> list[dict[str, Any]]:
+        """Return the ``add`` operations a diff of the complete arrays would produce."""
+
+        operations: list[dict[str, Any]] = []
+        for name, items in (appended or {}).items():
+            start = len(self._projection[name])
+            operations.extend(
+                {"op": "add", "path": f"/{name}/{start + offset}", "value": item} for offset, item in enumerate(items)
+            )
+        return operations
 
     @staticmethod
     def _validated_patch(
         projection_before: Any,
         projection_after: Any,
+        append_operations: list[dict[str, Any]],
     ) -> tuple[list[dict[str, Any]], str]:
         """Build and validate a complete patch before any evidence commit."""
 
-        raw_patch = jsonpatch.make_patch(projection_before, projection_after).patch
+        raw_patch = jsonpatch.make_patch(projection_before, projection_after).patch + append_operations
         # A valid state can still produce an over-depth JSON Patch because each
         # changed value is wrapped by the patch array and operation object.
         return raw_patch, encode_json(raw_patch)
 
     def finalize(self, state_end: Any) -> StoreOwnerEvidence:
-        end = copy.deepcopy(state_end)
-        replay = copy.deepcopy(self._state_start)
-        expected_revision = 0
-        reconstructable = True
-        for expected_sequence, transition in enumerate(self._transitions, start=1):
-            if transition.sequence != expected_sequence:
+        """Prove the recorded transitions reconstruct ``state_end``.
+
+        ``state_end`` must be a fresh projection of the live state, taken
+        independently from the cached projection and the recorded patches, so
+        live state that diverged from its recorded transitions is reported as
+        not reconstructable.
+        """
+
+        end = state_end
+        reconstructable = self._transition_order_is_consistent() and self._projection == end
+        if self._replica is not None:
+            if not self._replica_consistent or self._replica != end:
                 reconstructable = False
-            if transition.revision_before != expected_revision:
+        else:
+            replay = copy.deepcopy(self._state_start)
+            for transition in self._transitions:
+                try:
+                    replay = jsonpatch.JsonPatch(copy.deepcopy(list(transition.patch))).apply(replay, in_place=True)
+                except Exception:
+                    reconstructable = False
+                    break
+            if replay != end:
                 reconstructable = False
-            if transition.revision_after not in (
-                transition.revision_before,
-                transition.revision_before + 1,
-            ):
-                reconstructable = False
-            expected_revision = transition.revision_after
-            try:
-                replay = jsonpatch.JsonPatch(list(transition.patch)).apply(replay, in_place=False)
-            except Exception:
-                reconstructable = False
-        if expected_revision != self._revision or replay != end:
-            reconstructable = False
         return StoreOwnerEvidence(
             state_start=self.state_start,
             state_end=end,
             revision_start=0,
             revision_end=self._revision,
-            transition_count=len(self._transitions),
+            transition_count=self._transition_count,
             reconstructable=reconstructable,
         )
 
+    def _transition_order_is_consistent(self) -> bool:
+        """Check sequence and revision continuity across the retained transitions."""
+
+        if not self._transitions:
+            return self._transitions.maxlen == 0 or (self._transition_count == 0 and self._revision == 0)
+        first = self._transitions[0]
+        expected_sequence = first.sequence
+        expected_revision = first.revision_before
+        if expected_sequence == 1 and expected_revision != 0:
+            return False
+        for transition in self._transitions:
+            if transition.sequence != expected_sequence:
+                return False
+            if transition.revision_before != expected_revision:
+                return False
+            if transition.revision_after not in (
+                transition.revision_before,
+                transition.revision_before + 1,
+            ):
+                return False
+            expected_sequence += 1
+            expected_revision = transition.revision_after
+        return expected_sequence == self._transition_count + 1 and expected_revision == self._revision
+
     def transition_attributes(self, transition: StoreTransitionEvidence) -> dict[str, str | int]:
         return {
             "junjo.store.transition.sequence": transition.sequence,
@@ -2,11 +2,12 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from collections.abc import Mapping
+from collections.abc import AsyncGenerator, AsyncIterator, Callable, Iterable, Mapping
 from dataclasses import dataclass, field
 from types import MappingProxyType, NoneType
-from typing import TYPE_CHECKING, Generic, Protocol, TypeVar, cast
+from typing import TYPE_CHECKING, Any, Generic, Protocol, TypeVar, cast
 
 from opentelemetry import trace
 
@@ -28,7 +29,7 @@ from .correlation import (
     _resolve_execution_correlation,
     _set_correlation_span_attributes,
 )
-from .hooks import Hooks
+from .hooks import HookCallback, Hooks
 from .node import Node
 from .run_concurrent import RunConcurrent
 from .store import BaseStore, ParentStateT, ParentStoreT, StateT, StoreT
@@ -42,6 +43,7 @@ from .telemetry.span_lifecycle import (
     get_span_identifiers,
     mark_span_cancelled,
     mark_span_failed,
+    record_child_span_attributes,
     record_span_exception,
 )
 from .telemetry.store_evidence import StoreOwnerEvidence
@@ -53,6 +55,7 @@ if TYPE_CHECKING:
 
 
 _CovariantStoreT = TypeVar("_CovariantStoreT", bound="BaseStore", covariant=True)
+InputT = TypeVar("InputT")
 
 
 logger = logging.getLogger("junjo.workflow")
@@ -100,6 +103,17 @@ class _ExecutionContext(Generic[StoreT]):
     node_execution_counter: dict[str, int] = field(default_factory=dict)
 
 
+@dataclass(frozen=True, slots=True)
+class _PreparedGraph:
+    """A graph with the compiled artifacts every execution derives from it."""
+
+    graph: Graph
+    compiled_graph: CompiledGraph
+    compiled_node_structural_ids_by_runtime_id: Mapping[str, str]
+    graph_json: str
+    validated: bool
+
+
 @dataclass(frozen=True, slots=True)
 class ExecutionResult(Generic[StateT]):
     """
@@ -129,6 +143,56 @@ class ExecutionResult(Generic[StateT]):
     node_execution_counts: Mapping[str, int]
 
 
+@dataclass(frozen=True, slots=True)
+class WorkflowBatchItem(Generic[InputT, StateT]):
+    """
+    The outcome of one input of a :meth:`Workflow.execute_many` batch.
+
+    Exactly one of ``result`` and ``error`` is set. A failed input does not
+    affect the other inputs of the batch.
+
+    - ``index``: The position of the input in the batch inputs.
+    - ``input``: The input the run was created from.
+    - ``result``: The :class:`ExecutionResult` of a completed run.
+    - ``error``: The failure of the run, usually a
+      :class:`~junjo.WorkflowExecutionError`. A run that is cancelled from
+      inside, rather than by the batch, fails with its
+      :class:`~junjo.WorkflowCancelledError`. Failures raised before the run
+      was admitted, such as a ``store_factory`` error, are reported as raised.
+    """
+
+    index: int
+    input: InputT
+    result: ExecutionResult[StateT] | None
+    error: BaseException | None
+
+
+@dataclass(frozen=True, slots=True)
+class WorkflowBatchStats:
+    """
+    Aggregate throughput of a :meth:`Workflow.execute_many` batch.
+
+    - ``item_count``: The number of runs that finished and were yielded.
+    - ``succeeded_count``: The number of runs that returned a result.
+    - ``failed_count``: The number of runs that failed.
+    - ``elapsed_seconds``: Wall-clock time from the first admission until the
+      batch finished or was closed. A batch closed before iteration started
+      reports zero.
+    """
+
+    item_count: int
+    succeeded_count: int
+    failed_count: int
+    elapsed_seconds: float
+
+    @property
+    def items_per_second(self) -> float:
+        """Returns the number of finished runs per second of batch time."""
+        if self.elapsed_seconds <= 0:
+            return 0.0
+        return self.item_count / self.elapsed_seconds
+
+
 async def _collect_workflow_terminal_evidence(
     store: BaseStore[StateT],
 ) -> tuple[StateT, StoreOwnerEvidence]:
@@ -189,6 +253,7 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
         max_iterations: int = 100,
         hooks: Hooks | None = None,
         name: str | None = None,
+        static_graph: bool = False,
     ):
         if name is not None:
             name = require_ijson_text(name, "Workflow name", nonempty=True)
@@ -198,6 +263,9 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
         self.hooks = hooks
         self._graph_factory = graph_factory
         self._store_factory = store_factory
+        self._static_graph = static_graph
+        self._static_graph_instance: Graph | None = None
+        self._static_prepared_graph: _PreparedGraph | None = None
 
     @property
     def id(self) -> str:
@@ -211,6 +279,44 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
             return self._name
         return self.__class__.__name__
 
+    @property
+    def static_graph(self) -> bool:
+        """Returns whether every execution reuses one graph built on first use."""
+        return self._static_graph
+
+    def _get_graph(self) -> Graph:
+        """Return the graph for a new execution or compilation of this definition."""
+        if not self._static_graph:
+            return self._graph_factory()
+        if self._static_graph_instance is None:
+            self._static_graph_instance = self._graph_factory()
+        return self._static_graph_instance
+
+    def _prepare_graph(self, *, validate_graph: bool) -> _PreparedGraph:
+        prepared = self._static_prepared_graph
+        if prepared is not None and (prepared.validated or not validate_graph):
+            return prepared
+
+        graph = self._get_graph()
+        if validate_graph:
+            graph.validate()
+        compiled_graph = graph.compile()
+        prepared = _PreparedGraph(
+            graph=graph,
+            compiled_graph=compiled_graph,
+            compiled_node_structural_ids_by_runtime_id=MappingProxyType(
+                {
+                    compiled_node.node_runtime_id: compiled_node.node_structural_id
+                    for compiled_node in compiled_graph.compiled_nodes
+                }
+            ),
+            graph_json=graph._snapshot_json(),
+            validated=validate_graph,
+        )
+        if self._static_graph:
+            self._static_prepared_graph = prepared
+        return prepared
+
     @property
     def span_type(self) -> ExecutableType:
         """Returns the OpenTelemetry span type for this executable."""
@@ -218,7 +324,7 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
             return ExecutableType.SUBFLOW
         return ExecutableType.WORKFLOW
 
-    async def execute(  # noqa: C901
+    async def execute(
         self,
         parent_store: ParentStoreT | None = None,
         parent_id: str | None = None,
@@ -231,7 +337,8 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
 
         Each call creates a fresh graph, a fresh store, a fresh run id, and a
         fresh lifecycle dispatcher. This keeps the workflow definition itself
-        immutable and safe to reuse across concurrent runs.
+        immutable and safe to reuse across concurrent runs. With
+        ``static_graph=True`` the graph built by the first call is reused.
 
         :param parent_store: The parent store when executing a subflow.
             Top-level workflows should omit this argument.
@@ -254,18 +361,32 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
         :raises WorkflowCancelledError: If an admitted execution is cancelled.
             This remains an :class:`asyncio.CancelledError`.
         """
+        return await self._execute(
+            parent_store,
+            parent_id,
+            validate_graph=validate_graph,
+            correlation=correlation,
+        )
+
+    async def _execute(  # noqa: C901
+        self,
+        parent_store: ParentStoreT | None,
+        parent_id: str | None,
+        *,
+        validate_graph: bool,
+        correlation: ExecutionCorrelation | None,
+        store: StoreT | None = None,
+        hook_snapshot: Mapping[str, tuple[HookCallback[Any], ...]] | None = None,
+    ) -> ExecutionResult[StateT]:
         effective_correlation = _resolve_execution_correlation(correlation)
         parent_active_identity = get_active_executable_identity()
-        graph = self._graph_factory()
-        if validate_graph:
-            graph.validate()
-        compiled_graph = graph.compile()
+        prepared_graph = self._prepare_graph(validate_graph=validate_graph)
         ctx = _ExecutionContext(
             run_id=generate_safe_id(),
-            graph=graph,
-            compiled_graph=compiled_graph,
-            store=self._store_factory(),
-            dispatcher=LifecycleDispatcher(self.hooks),
+            graph=prepared_graph.graph,
+            compiled_graph=prepared_graph.compiled_graph,
+            store=store if store is not None else self._store_factory(),
+            dispatcher=LifecycleDispatcher(self.hooks, snapshot=hook_snapshot),
         )
         ctx.store._set_lifecycle_context(
             GraphStoreLifecycleContext(
@@ -277,16 +398,11 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
                 executable_runtime_id=ctx.run_id,
                 executable_structural_id=ctx.compiled_graph.graph_structural_id,
                 enclosing_graph_structural_id=ctx.compiled_graph.graph_structural_id,
-                compiled_node_structural_ids_by_runtime_id=MappingProxyType(
-                    {
-                        compiled_node.node_runtime_id: compiled_node.node_structural_id
-                        for compiled_node in ctx.compiled_graph.compiled_nodes
-                    }
-                ),
+                compiled_node_structural_ids_by_runtime_id=(prepared_graph.compiled_node_structural_ids_by_runtime_id),
             )
         )
 
-        graph_json = ctx.graph.serialize_to_json_string()
+        graph_json = prepared_graph.graph_json
         tracer = trace.get_tracer(JUNJO_OTEL_MODULE_NAME)
         prepared_terminal_event = None
         result: ExecutionResult[StateT] | None = None
@@ -328,6 +444,7 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
                 span.set_attribute("junjo.executable_definition_id", self.id)
                 span.set_attribute("junjo.executable_runtime_id", ctx.run_id)
                 _set_correlation_span_attributes(span, effective_correlation)
+                record_child_span_attributes(span)
                 span.set_attribute(
                     "junjo.executable_structural_id",
                     ctx.compiled_graph.graph_structural_id,
@@ -649,7 +766,9 @@ class _NestableWorkflow(Generic[StateT, StoreT, ParentStateT, ParentStoreT]):
                     )
 
                 try:
-                    await ctx.dispatcher.dispatch(prepared_terminal_event, terminal=True)
+                    await ctx.dispatcher.close()
+                    if prepared_terminal_event is not None:
+                        await ctx.dispatcher.dispatch(prepared_terminal_event, terminal=True)
                 except asyncio.CancelledError as exc:
                     terminal_delivery_cancellation = exc
                 if terminal_delivery_cancellation is None:
@@ -703,6 +822,7 @@ class Workflow(_NestableWorkflow[StateT, StoreT, NoneType, NoneType]):
         max_iterations: int = 100,
         hooks: Hooks | None = None,
         name: str | None = None,
+        static_graph: bool = False,
     ):
         """
         A Workflow is a top-level, executable collection of nodes and edges
@@ -747,6 +867,13 @@ class Workflow(_NestableWorkflow[StateT, StoreT, NoneType, NoneType]):
             they do not control OpenTelemetry instrumentation or workflow
             execution.
         :type hooks: Hooks | None, optional
+        :param static_graph: Whether to call ``graph_factory`` once, on first
+            use, and reuse that graph for every execution. The graph is
+            validated, compiled, and serialized once instead of per run. Only
+            enable this when the topology never changes and every node is
+            stateless, because concurrent executions then share the same node
+            instances. Defaults to ``False``.
+        :type static_graph: bool, optional
 
         .. rubric:: Example without hooks
 
@@ -813,6 +940,67 @@ class Workflow(_NestableWorkflow[StateT, StoreT, NoneType, NoneType]):
             max_iterations=max_iterations,
             hooks=hooks,
             name=name,
+            static_graph=static_graph,
+        )
+
+    def execute_many(
+        self,
+        inputs: Iterable[InputT],
+        *,
+        store_factory: Callable[[InputT], StoreT],
+        max_concurrency: int = 8,
+        validate_graph: bool = True,
+    ) -> WorkflowBatch[InputT, StateT]:
+        """
+        Execute this workflow once per input with bounded concurrency.
+
+        Each input gets its own run with a fresh store built by
+        ``store_factory``, exactly as if :meth:`execute` had been called for
+        it. The returned :class:`WorkflowBatch` is an async iterator that
+        yields a :class:`WorkflowBatchItem` as each run finishes, in
+        completion order. A failed run is yielded with its error and never
+        stops the other runs. Use the batch as an async context manager so
+        that runs still in flight are cancelled if the loop stops early.
+
+        Inputs are consumed lazily, so at most ``max_concurrency`` runs and
+        their stores exist at a time. The hook registry is read once for the
+        whole batch. Combine with ``static_graph=True`` to also reuse one
+        compiled graph across every run.
+
+        .. code-block:: python
+
+            async with workflow.execute_many(
+                questions,
+                store_factory=lambda question: EvalStore(
+                    initial_state=EvalState(question=question)
+                ),
+                max_concurrency=16,
+            ) as batch:
+                async for item in batch:
+                    if item.error is not None:
+                        record_failure(item.input, item.error)
+            print(batch.stats.items_per_second)
+
+        :param inputs: The inputs to run the workflow for.
+        :type inputs: Iterable[InputT]
+        :param store_factory: Builds the store for one input.
+        :type store_factory: Callable[[InputT], StoreT]
+        :param max_concurrency: The maximum number of runs in flight at once.
+            Defaults to 8.
+        :type max_concurrency: int, optional
+        :param validate_graph: Whether each run validates its graph. Defaults
+            to ``True``.
+        :type validate_graph: bool, optional
+        :returns: An async iterator over the outcome of every input.
+        :rtype: WorkflowBatch[InputT, StateT]
+        :raises ValueError: If ``max_concurrency`` is less than 1.
+        """
+        return WorkflowBatch(
+            self,
+            inputs,
+            store_factory=store_factory,
+            max_concurrency=max_concurrency,
+            validate_graph=validate_graph,
         )
 
 
@@ -824,6 +1012,7 @@ class Subflow(_NestableWorkflow[StateT, StoreT, ParentStateT, ParentStoreT], ABC
         max_iterations: int = 100,
         hooks: Hooks | None = None,
         name: str | None = None,
+        static_graph: bool = False,
     ):
         """
         A Subflow is a workflow that:
@@ -861,6 +1050,10 @@ class Subflow(_NestableWorkflow[StateT, StoreT, ParentStateT, ParentStoreT], ABC
         :param hooks: An optional :class:`~junjo.hooks.Hooks` registry for
             observing lifecycle events emitted by this subflow.
         :type hooks: Hooks | None, optional
+        :param static_graph: Whether to build the subflow graph once and reuse
+            it for every execution. See :class:`~junjo.workflow.Workflow`.
+            Defaults to ``False``.
+        :type static_graph: bool, optional
 
         .. rubric:: Example
 
@@ -892,6 +1085,7 @@ class Subflow(_NestableWorkflow[StateT, StoreT, ParentStateT, ParentStoreT], ABC
             max_iterations=max_iterations,
             hooks=hooks,
             name=name,
+            static_graph=static_graph,
         )
 
     @abstractmethod
@@ -931,3 +1125,151 @@ class Subflow(_NestableWorkflow[StateT, StoreT, ParentStateT, ParentStoreT], ABC
         :type subflow_store: StoreT
         """
         raise NotImplementedError
+
+
+class WorkflowBatch(Generic[InputT, StateT]):
+    """
+    Async iterator over the runs of a :meth:`Workflow.execute_many` batch.
+
+    Runs start when iteration starts, and a batch can be iterated only once.
+    Exhausting the batch or calling :meth:`aclose` cancels every run still in
+    flight and sets :attr:`stats`. Breaking out of an ``async for`` loop, or
+    cancelling the consuming task in the loop body, does not close an async
+    iterator by itself, so iterate inside ``async with`` when the loop may
+    stop early:
+
+    .. code-block:: python
+
+        async with workflow.execute_many(inputs, store_factory=make_store) as batch:
+            async for item in batch:
+                if item.error is not None:
+                    break
+        print(batch.stats)
+    """
+
+    def __init__(
+        self,
+        workflow: Workflow[StateT, Any],
+        inputs: Iterable[InputT],
+        *,
+        store_factory: Callable[[InputT], BaseStore],
+        max_concurrency: int,
+        validate_graph: bool,
+    ):
+        if max_concurrency < 1:
+            raise ValueError("execute_many max_concurrency must be at least 1.")
+        self._workflow = workflow
+        self._inputs = inputs
+        self._store_factory = store_factory
+        self._max_concurrency = max_concurrency
+        self._validate_graph = validate_graph
+        self._iterator: AsyncGenerator[WorkflowBatchItem[InputT, StateT], None] | None = None
+        self._closed = False
+        self._stats: WorkflowBatchStats | None = None
+
+    @property
+    def stats(self) -> WorkflowBatchStats | None:
+        """Returns the batch throughput, or ``None`` until the batch finishes or is closed."""
+        return self._stats
+
+    def __aiter__(self) -> AsyncIterator[WorkflowBatchItem[InputT, StateT]]:
+        if self._iterator is not None or self._closed:
+            raise RuntimeError("A WorkflowBatch can only be iterated once.")
+        self._iterator = self._iterate()
+        return self._iterator
+
+    async def __aenter__(self) -> WorkflowBatch[InputT, StateT]:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """
+        Cancel every run still in flight and wait for it to finish.
+
+        After this returns, :attr:`stats` covers the runs yielded so far and
+        the batch can no longer be iterated. Closing a finished batch does
+        nothing.
+        """
+        self._closed = True
+        if self._iterator is not None:
+            await self._iterator.aclose()
+        elif self._stats is None:
+            self._stats = WorkflowBatchStats(item_count=0, succeeded_count=0, failed_count=0, elapsed_seconds=0.0)
+
+    async def _run_item(
+        self,
+        index: int,
+        item_input: InputT,
+        hook_snapshot: Mapping[str, tuple[HookCallback[Any], ...]],
+    ) -> WorkflowBatchItem[InputT, StateT]:
+        try:
+            result = await self._workflow._execute(
+                None,
+                None,
+                validate_graph=self._validate_graph,
+                correlation=None,
+                store=self._store_factory(item_input),
+                hook_snapshot=hook_snapshot,
+            )
+        except asyncio.CancelledError as exc:
+            current_task = asyncio.current_task()
+            if current_task is not None and current_task.cancelling():
+                # The batch is cancelling this run.
+                raise
+            return WorkflowBatchItem(index=index, input=item_input, result=None, error=exc)
+        except Exception as exc:
+            return WorkflowBatchItem(index=index, input=item_input, result=None, error=exc)
+        return WorkflowBatchItem(index=index, input=item_input, result=result, error=None)
+
+    async def _iterate(self) -> AsyncGenerator[WorkflowBatchItem[InputT, StateT], None]:
+        hooks = self._workflow.hooks
+        hook_snapshot = hooks._snapshot() if hooks is not None else {}
+        inputs = enumerate(self._inputs)
+        inputs_exhausted = False
+        pending: set[asyncio.Task[WorkflowBatchItem[InputT, StateT]]] = set()
+        succeeded_count = 0
+        failed_count = 0
+        started = time.perf_counter()
+
+        try:
+            while True:
+                while not inputs_exhausted and len(pending) < self._max_concurrency:
+                    next_input = next(inputs, None)
+                    if next_input is None:
+                        inputs_exhausted = True
+                        break
+                    index, item_input = next_input
+                    pending.add(asyncio.create_task(self._run_item(index, item_input, hook_snapshot)))
+                if not pending:
+                    break
+
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    item = task.result()
+                    if item.error is None:
+                        succeeded_count += 1
+                    else:
+                        failed_count += 1
+                    yield item
+        finally:
+            for task in pending:
+                task.cancel()
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+            self._stats = WorkflowBatchStats(
+                item_count=succeeded_count + failed_count,
+                succeeded_count=succeeded_count,
+                failed_count=failed_count,
+                elapsed_seconds=time.perf_counter() - started,
+            )
+            logger.debug(
+                "Finished batch of workflow %s (%s): %d succeeded, %d failed, %.1f runs/s",
+                self._workflow.name,
+                self._workflow.id,
+                succeeded_count,
+                failed_count,
+                self._stats.items_per_second,
+                extra={"executable_definition_id": self._workflow.id},
+            )
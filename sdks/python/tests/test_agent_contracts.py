@@ -2,14 +2,15 @@ from __future__ import annotations
 
 import hashlib
 import json
-from collections.abc import Mapping
+import time
+from collections.abc import Callable, Mapping, Sequence
 from dataclasses import FrozenInstanceError
 from pathlib import Path
 from typing import Annotated, Literal
 
 import pytest
 import rfc8785
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 import junjo.agent as agent_api
 import junjo.agent.testing as agent_testing_api
@@ -32,7 +33,9 @@ from junjo.agent import (
     ToolDefinition,
     UsageAggregateField,
 )
+from junjo.agent._boundary import validate_and_detach
 from junjo.agent._schema import _require_lossless_core_schema, normalize_schema
+from junjo.agent._telemetry import transcript_digest
 from junjo.agent.messages import normalize_model_response
 from junjo.agent.testing import ScriptedModelDriver
 
@@ -190,6 +193,18 @@ def test_every_shared_schema_profile_vector_matches_sdk_normalization() -> None:
             normalize_schema(vector["input"])
 
 
+def test_every_shared_transcript_digest_vector_matches_the_sdk_chain() -> None:
+    fixture = json.loads(
+        (CONTRACT_ROOT / "fixtures" / "fingerprints" / "transcript-digest-v1.json").read_text(encoding="utf-8")
+    )
+
+    for vector in fixture["vectors"]:
+        digest = ""
+        for request in vector["requests"]:
+            digest = transcript_digest(digest, request["appendedMessages"])
+            assert digest == request["messagesSha256"], vector["name"]
+
+
 def test_portable_json_depth_bound_accepts_128_and_rejects_deeper_iteratively() -> None:
     accepted = nested_arrays(128)
     assert thaw_json(freeze_json(accepted)) == accepted
@@ -219,6 +234,34 @@ def test_schema_and_definition_composites_enforce_the_complete_depth_bound() ->
             input_schema=nested_not_schema(128),
             output_schema={},
         )
+    # Embedded in a request, the same definition sits two levels deeper.
+    with pytest.raises(JsonNestingDepthError):
+        ModelRequest(
+            agent_key="agent",
+            run_id="run",
+            ordinal=1,
+            instructions="",
+            messages=[],
+            tools=[accepted],
+            output_schema={},
+        )
+    shallower = ToolDefinition(
+        name="bounded",
+        description="Bounded schema.",
+        input_schema=nested_not_schema(125),
+        output_schema={},
+    )
+    request = ModelRequest(
+        agent_key="agent",
+        run_id="run",
+        ordinal=1,
+        instructions="",
+        messages=[],
+        tools=[shallower],
+        output_schema={},
+    )
+    assert request.tools[0] is shallower
+    assert freeze_json(request.to_json())["tools"][0]["inputSchema"] == freeze_json(nested_not_schema(125))
 
 
 def test_core_schema_projection_preflight_is_iterative_for_adversarial_depth() -> None:
@@ -814,6 +857,109 @@ def test_result_rejects_malformed_or_incomplete_transcript() -> None:
         _result(transcript=(AgentInputMessage({"value": "question"}),))
 
 
+def test_shared_tool_catalog_request_benchmark(record_property: Callable[[str, object], None]) -> None:
+    class SearchInput(BaseModel):
+        query: str
+        filters: dict[str, list[str]] = {}
+        limit: int = 10
+
+    tools = [
+        Tool(
+            name=f"search_{index}",
+            description="Search one index.",
+            input_type=SearchInput,
+            output_type=SearchInput,
+            shared_service=lambda input, context: input,
+        )
+        for index in range(30)
+    ]
+    catalog = tuple(
+        ToolDefinition(
+            name=tool.name,
+            description=tool.description,
+            input_schema=tool.input_schema,
+            output_schema=tool.output_schema,
+        )
+        for tool in tools
+    )
+
+    def best_seconds(build_tools: Callable[[], Sequence[ToolDefinition]]) -> float:
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            for ordinal in range(1, 21):
+                ModelRequest(
+                    agent_key="agent",
+                    run_id="run",
+                    ordinal=ordinal,
+                    instructions="",
+                    messages=[],
+                    tools=build_tools(),
+                    output_schema={},
+                )
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    rebuilt = best_seconds(
+        lambda: [
+            ToolDefinition(
+                name=tool.name,
+                description=tool.description,
+                input_schema=tool.input_schema,
+                output_schema=tool.output_schema,
+            )
+            for tool in tools
+        ]
+    )
+    shared = best_seconds(lambda: catalog)
+    record_property("twenty_requests_ms_rebuilt_catalog", round(rebuilt * 1000, 3))
+    record_property("twenty_requests_ms_shared_catalog", round(shared * 1000, 3))
+
+
+def test_proven_boundary_validation_benchmark(record_property: Callable[[str, object], None]) -> None:
+    class Order(BaseModel):
+        id: str
+        lines: list[dict[str, int]]
+        notes: str | None = None
+
+    payloads = [
+        {"id": f"order-{index}", "lines": [{"sku": line, "qty": 2} for line in range(20)]} for index in range(200)
+    ]
+
+    def elapsed(*, strict: bool) -> float:
+        adapter = TypeAdapter(Order)
+        started = time.perf_counter()
+        for payload in payloads:
+            _typed, normalized = validate_and_detach(adapter, payload, strict=strict)
+            assert normalized["id"] == payload["id"]
+        return time.perf_counter() - started
+
+    record_property("two_hundred_values_ms_strict", round(elapsed(strict=True) * 1000, 3))
+    record_property("two_hundred_values_ms_proven", round(elapsed(strict=False) * 1000, 3))
+
+
+def test_proven_boundary_still_detaches_and_rejects_invalid_values() -> None:
+    class Order(BaseModel):
+        id: str
+        tags: list[str] = []
+
+    adapter = TypeAdapter(Order)
+    first = Order(id="one", tags=["a"])
+    for value in (first, Order(id="two", tags=["b"])):
+        typed, normalized = validate_and_detach(adapter, value)
+        assert typed == value
+        assert typed is not value
+        assert typed.tags is not value.tags
+        assert normalized == freeze_json(value.model_dump(mode="json"))
+
+    json_typed, _normalized = validate_and_detach(adapter, {"id": "three"})
+    assert json_typed == Order(id="three")
+    with pytest.raises(ValidationError):
+        validate_and_detach(adapter, {"id": 3})
+    with pytest.raises(ValidationError):
+        validate_and_detach(adapter, {"id": "four", "extra": True})
+
+
 def test_model_request_rejects_malformed_and_duplicate_members() -> None:
     common = {
         "agent_key": "agent",
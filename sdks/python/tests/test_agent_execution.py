@@ -13,6 +13,7 @@ from pydantic import BaseModel, ConfigDict, Field, SecretStr, field_serializer
 
 from junjo import Agent, AgentLimits, Hooks, ModelDriverBinding, ModelDriverDescriptor, Tool
 from junjo.agent import (
+    AgentConfigurationError,
     AgentHistoryValidationError,
     AgentInputMessage,
     AgentInputValidationError,
@@ -373,6 +374,9 @@ async def test_ordered_multi_tool_loop_preflights_then_executes_sequentially() -
         "tool_result",
         "tool_result",
     ]
+    # Every request shares the catalog the Agent froze at definition time.
+    assert driver.requests[0].tools == driver.requests[1].tools == agent.tool_definitions
+    assert driver.requests[1].tools[0] is agent.tool_definitions[0]
 
 
 @pytest.mark.asyncio
@@ -1081,6 +1085,50 @@ async def test_agent_input_rejects_lossy_typed_serialization(
     assert driver.requests == ()
 
 
+def create_lowercased_input_agent(boundary_validation: str) -> Agent:
+    return Agent(
+        key="lowercased_agent",
+        name="Lowercased Agent",
+        instructions="Preserve typed values.",
+        input_type=LowercasedValue,
+        model=ModelDriverBinding.shared(
+            descriptor=ModelDriverDescriptor(
+                driver_key="scripted",
+                provider="junjo",
+                model="scripted-v1",
+            ),
+            driver=ScriptedModelDriver(
+                [FinalOutputResponse(output={"value": 1}), FinalOutputResponse(output={"value": 2})]
+            ),
+        ),
+        tools=(),
+        output_type=IntegerValue,
+        boundary_validation=boundary_validation,  # type: ignore[arg-type]
+    )
+
+
+@pytest.mark.asyncio
+async def test_boundary_validation_reproves_every_value_only_in_strict_mode() -> None:
+    fast = create_lowercased_input_agent("fast")
+    strict = create_lowercased_input_agent("strict")
+    assert fast.boundary_validation == "fast"
+
+    # An already lowercase value passes the full proof for each boundary.
+    await fast.execute(LowercasedValue(value="abc"), dependencies=None)
+    await strict.execute(LowercasedValue(value="abc"), dependencies=None)
+
+    # Later values skip the proof by default, so a value-dependent loss is
+    # only caught when every value is proven.
+    await fast.execute(LowercasedValue(value="ABC"), dependencies=None)
+    with pytest.raises(AgentInputValidationError):
+        await strict.execute(LowercasedValue(value="ABC"), dependencies=None)
+
+
+def test_boundary_validation_mode_is_validated() -> None:
+    with pytest.raises(AgentConfigurationError, match="boundary_validation"):
+        create_lowercased_input_agent("none")
+
+
 @pytest.mark.asyncio
 async def test_tool_result_rejects_lossy_typed_serialization_and_marks_candidate_unavailable(
     span_exporter: InMemorySpanExporter,
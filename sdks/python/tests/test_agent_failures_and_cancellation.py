@@ -1026,7 +1026,7 @@ async def test_get_state_internal_failure_uses_last_known_snapshot_without_recur
 ) -> None:
     cause = RuntimeError("Store read failed")
 
-    async def fail_get_state(self):
+    async def fail_get_state(self, *, detached=True):
         raise cause
 
     monkeypatch.setattr(AgentStore, "get_state", fail_get_state)
@@ -1073,8 +1073,8 @@ async def test_cancellation_during_success_terminalization_drains_committed_outc
             await release.wait()
         await original_commit_success(self, output)
 
-    async def get_state(self):
-        state = await original_get_state(self)
+    async def get_state(self, *, detached=True):
+        state = await original_get_state(self, detached=detached)
         if terminal_await == "get_state" and state.terminal_reason == "final_output" and not entered.is_set():
             entered.set()
             await release.wait()
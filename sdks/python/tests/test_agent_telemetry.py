@@ -1,14 +1,17 @@
 from __future__ import annotations
 
+import hashlib
 import json
 
 import jsonpatch
 import pytest
+import rfc8785
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
-from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace import SpanLimits, TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from opentelemetry.sdk.trace.sampling import Decision, Sampler, SamplingResult
 from opentelemetry.trace import SpanKind
 from pydantic import BaseModel
 
@@ -21,6 +24,7 @@ from junjo import (
     Tool,
 )
 from junjo.agent import (
+    AgentConfigurationError,
     AgentInputValidationError,
     AgentModelResponseError,
     AgentToolOutputValidationError,
@@ -62,7 +66,7 @@ def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
     return exporter
 
 
-def agent_for(script, *, tools=()) -> Agent:
+def agent_for(script, *, tools=(), request_telemetry="full") -> Agent:
     return Agent(
         key="telemetry_agent",
         name="Telemetry Agent",
@@ -79,6 +83,7 @@ def agent_for(script, *, tools=()) -> Agent:
         tools=tools,
         output_type=Output,
         limits=AgentLimits(model_requests=4, tool_calls=4),
+        request_telemetry=request_telemetry,
     )
 
 
@@ -352,6 +357,56 @@ async def test_tool_operation_sequence_counts_and_state_revisions_are_owner_scop
     assert owner.attributes["junjo.agent.tool_call.completed_count"] == 1
 
 
+@pytest.mark.asyncio
+async def test_transcript_messages_are_recorded_as_single_add_operations(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    async def service(input: Args, context) -> ToolOutput:
+        return ToolOutput(value=input.value.upper())
+
+    tool = Tool(
+        name="upper",
+        description="Uppercase a value.",
+        input_type=Args,
+        output_type=ToolOutput,
+        shared_service=service,
+    )
+    agent = agent_for(
+        [
+            ToolCallsResponse(
+                tool_calls=[
+                    ToolCall(id="upper-1", name="upper", arguments={"value": "x"}),
+                    ToolCall(id="upper-2", name="upper", arguments={"value": "y"}),
+                ]
+            ),
+            FinalOutputResponse(output={"value": "XY"}),
+        ],
+        tools=[tool],
+    )
+
+    await agent.execute(Input(value="x"), dependencies=None)
+
+    spans = span_exporter.get_finished_spans()
+    owner = next(span for span in spans if span.attributes.get("junjo.span_type") == "agent")
+    transcript = json.loads(owner.attributes["junjo.agent.state.end"])["transcript"]
+    transcript_operations = {}
+    for span in spans:
+        for event in span.events:
+            if event.name != "set_state":
+                continue
+            patch = json.loads(event.attributes["junjo.state_json_patch"])
+            operations = [operation for operation in patch if operation["path"].startswith("/transcript")]
+            if operations:
+                transcript_operations[event.attributes["junjo.store.transition.sequence"]] = operations
+    recorded = [transcript_operations[sequence] for sequence in sorted(transcript_operations)]
+    assert len(transcript) == 5
+    assert recorded == [
+        [{"op": "add", "path": f"/transcript/{index}", "value": message}]
+        for index, message in enumerate(transcript)
+        if index > 0
+    ]
+
+
 @pytest.mark.asyncio
 async def test_nonserializable_model_and_tool_candidates_are_explicitly_unavailable(
     span_exporter: InMemorySpanExporter,
@@ -465,3 +520,135 @@ async def test_python_store_patch_generation_is_repeatable_for_identical_runs(
         ]
 
     assert await execute_once() == await execute_once()
+
+
+@pytest.mark.asyncio
+async def test_delta_request_telemetry_records_appended_messages_with_a_chained_digest(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    async def echo(input: Args, context) -> ToolOutput:
+        return ToolOutput(value=input.value)
+
+    tool = Tool(
+        name="echo",
+        description="Echo one value.",
+        input_type=Args,
+        output_type=ToolOutput,
+        shared_service=echo,
+    )
+    script = [
+        ToolCallsResponse(tool_calls=[ToolCall(id="one", name="echo", arguments={"value": "a"})]),
+        ToolCallsResponse(tool_calls=[ToolCall(id="two", name="echo", arguments={"value": "b"})]),
+        FinalOutputResponse(output={"value": "done"}),
+    ]
+
+    def request_attributes() -> list[dict[str, object]]:
+        models = [
+            span
+            for span in span_exporter.get_finished_spans()
+            if span.attributes.get("junjo.agent.operation_type") == "model_request"
+        ]
+        models.sort(key=lambda span: span.attributes["junjo.agent.model_request.ordinal"])
+        span_exporter.clear()
+        return [dict(span.attributes) for span in models]
+
+    await agent_for(script, tools=[tool]).execute(Input(value="question"), dependencies=None)
+    full = request_attributes()
+    await agent_for(script, tools=[tool], request_telemetry="delta").execute(
+        Input(value="question"), dependencies=None
+    )
+    delta = request_attributes()
+
+    previous = json.loads(full[0]["junjo.agent.model.request"])
+    first = json.loads(delta[0]["junjo.agent.model.request"])
+    assert delta[0]["junjo.agent.model.request.mode"] == "full"
+    assert first | {"runId": previous["runId"]} == previous
+    digest = hashlib.sha256(rfc8785.dumps(previous["messages"])).hexdigest()
+    for full_attributes, delta_attributes in zip(full[1:], delta[1:], strict=True):
+        assert delta_attributes["junjo.agent.model.request.mode"] == "delta"
+        assert delta_attributes["junjo.agent.model.request.policy"] == "junjo.delta.v1"
+        expected = json.loads(full_attributes["junjo.agent.model.request"])
+        payload = json.loads(delta_attributes["junjo.agent.model.request"])
+        assert payload["baseOrdinal"] == previous["ordinal"]
+        assert payload["baseMessageCount"] == len(previous["messages"])
+        assert previous["messages"] + payload["appendedMessages"] == expected["messages"]
+        assert [message["type"] for message in payload["appendedMessages"]] == [
+            "assistant_tool_calls",
+            "tool_result",
+        ]
+        digest = hashlib.sha256(digest.encode() + rfc8785.dumps(payload["appendedMessages"])).hexdigest()
+        assert payload["messagesSha256"] == digest
+        assert len(delta_attributes["junjo.agent.model.request"]) < len(full_attributes["junjo.agent.model.request"])
+        expected["runId"] = payload["runId"]
+        previous = expected
+
+
+class DropFirstModelRequest(Sampler):
+    def should_sample(self, parent_context, trace_id, name, kind=None, attributes=None, links=None, trace_state=None):
+        decision = Decision.DROP if name == "model request 1" else Decision.RECORD_AND_SAMPLE
+        return SamplingResult(decision, attributes)
+
+    def get_description(self) -> str:
+        return "DropFirstModelRequest"
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("provider", "expected_modes"),
+    [
+        (TracerProvider(sampler=DropFirstModelRequest()), {2: "full", 3: "delta"}),
+        # Every full request is longer than the limit, so none can be a base.
+        (TracerProvider(span_limits=SpanLimits(max_attribute_length=500)), {1: "full", 2: "full", 3: "full"}),
+    ],
+    ids=["unsampled", "truncated"],
+)
+async def test_delta_request_telemetry_restarts_in_full_after_a_request_not_recorded_verbatim(
+    monkeypatch: pytest.MonkeyPatch,
+    provider: TracerProvider,
+    expected_modes: dict[int, str],
+) -> None:
+    exporter = InMemorySpanExporter()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+
+    async def echo(input: Args, context) -> ToolOutput:
+        return ToolOutput(value=input.value)
+
+    tool = Tool(
+        name="echo",
+        description="Echo one value.",
+        input_type=Args,
+        output_type=ToolOutput,
+        shared_service=echo,
+    )
+    script = [
+        ToolCallsResponse(tool_calls=[ToolCall(id="one", name="echo", arguments={"value": "a"})]),
+        ToolCallsResponse(tool_calls=[ToolCall(id="two", name="echo", arguments={"value": "b"})]),
+        FinalOutputResponse(output={"value": "done"}),
+    ]
+    await agent_for(script, tools=[tool], request_telemetry="delta").execute(Input(value="question"), dependencies=None)
+
+    requests = {
+        span.attributes["junjo.agent.model_request.ordinal"]: dict(span.attributes)
+        for span in exporter.get_finished_spans()
+        if span.attributes.get("junjo.agent.operation_type") == "model_request"
+    }
+    assert {ordinal: attributes["junjo.agent.model.request.mode"] for ordinal, attributes in requests.items()} == (
+        expected_modes
+    )
+    for attributes in requests.values():
+        if attributes["junjo.agent.model.request.mode"] == "delta":
+            payload = json.loads(attributes["junjo.agent.model.request"])
+            base = json.loads(requests[payload["baseOrdinal"]]["junjo.agent.model.request"])
+            assert payload["baseMessageCount"] == len(base["messages"])
+            digest = hashlib.sha256(rfc8785.dumps(base["messages"])).hexdigest()
+            assert (
+                payload["messagesSha256"]
+                == hashlib.sha256(digest.encode() + rfc8785.dumps(payload["appendedMessages"])).hexdigest()
+            )
+
+
+def test_request_telemetry_mode_is_validated() -> None:
+    with pytest.raises(AgentConfigurationError, match="request_telemetry"):
+        agent_for([], request_telemetry="compressed")
@@ -0,0 +1,294 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Sequence
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
+from pydantic import BaseModel
+
+from junjo import Agent, AgentLimits, ModelDriverBinding, ModelDriverDescriptor, Tool
+from junjo.agent import (
+    AgentConfigurationError,
+    AgentToolError,
+    FinalOutputResponse,
+    ToolCall,
+    ToolCallsResponse,
+    ToolResultMessage,
+)
+from junjo.agent.testing import ScriptedModelDriver
+
+
+class Question(BaseModel):
+    question: str
+
+
+class Answer(BaseModel):
+    answer: str
+
+
+class LookupInput(BaseModel):
+    query: str
+    delay: int = 0
+
+
+class LookupOutput(BaseModel):
+    value: str
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+        self.finished: list[str] = []
+        self.cancelled: list[str] = []
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+    return exporter
+
+
+def lookup_tool(probe: ConcurrencyProbe) -> Tool:
+    async def lookup(input: LookupInput, context) -> LookupOutput:
+        probe.running += 1
+        probe.peak = max(probe.peak, probe.running)
+        try:
+            for _ in range(input.delay):
+                await asyncio.sleep(0)
+            if input.query == "fail":
+                raise RuntimeError("lookup unavailable")
+        except asyncio.CancelledError:
+            probe.cancelled.append(input.query)
+            raise
+        finally:
+            probe.running -= 1
+        probe.finished.append(input.query)
+        return LookupOutput(value=input.query.upper())
+
+    return Tool(
+        name="lookup",
+        description="Look up one value.",
+        input_type=LookupInput,
+        output_type=LookupOutput,
+        shared_service=lookup,
+    )
+
+
+def create_agent(
+    calls: Sequence[ToolCall],
+    *,
+    probe: ConcurrencyProbe,
+    tool_concurrency: int,
+) -> Agent:
+    driver = ScriptedModelDriver(
+        [
+            ToolCallsResponse(tool_calls=calls),
+            FinalOutputResponse(output={"answer": "done"}),
+        ]
+    )
+    return Agent(
+        key="concurrent_agent",
+        name="Concurrent Agent",
+        instructions="Look everything up.",
+        input_type=Question,
+        model=ModelDriverBinding.shared(
+            descriptor=ModelDriverDescriptor(
+                driver_key="scripted",
+                provider="junjo",
+                model="scripted-v1",
+            ),
+            driver=driver,
+        ),
+        tools=[lookup_tool(probe)],
+        output_type=Answer,
+        limits=AgentLimits(model_requests=4, tool_calls=8),
+        tool_concurrency=tool_concurrency,
+    )
+
+
+def lookup_calls(*queries: tuple[str, int]) -> list[ToolCall]:
+    return [
+        ToolCall(id=f"call-{query}", name="lookup", arguments={"query": query, "delay": delay})
+        for query, delay in queries
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_overlaps_services_and_commits_in_call_order(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    probe = ConcurrencyProbe()
+    agent = create_agent(
+        lookup_calls(("one", 20), ("two", 10), ("three", 0)),
+        probe=probe,
+        tool_concurrency=3,
+    )
+
+    result = await agent.execute(Question(question="go"), dependencies=None)
+
+    assert probe.peak == 3
+    # Later calls finish first, but results are committed in call order.
+    assert probe.finished == ["three", "two", "one"]
+    tool_results = [message for message in result.transcript if isinstance(message, ToolResultMessage)]
+    assert [message.tool_call_id for message in tool_results] == ["call-one", "call-two", "call-three"]
+    assert [message.result for message in tool_results] == [{"value": "ONE"}, {"value": "TWO"}, {"value": "THREE"}]
+    assert result.tool_call_completed_count == 3
+
+    tool_spans = [
+        span
+        for span in span_exporter.get_finished_spans()
+        if span.attributes.get("junjo.agent.operation_type") == "tool"
+    ]
+    started = sorted(tool_spans, key=lambda span: span.start_time)
+    assert [span.attributes["junjo.agent.tool_call.id"] for span in started] == [
+        "call-one",
+        "call-two",
+        "call-three",
+    ]
+    ended = sorted(tool_spans, key=lambda span: span.end_time)
+    assert [span.attributes["junjo.agent.tool_call.id"] for span in ended] == [
+        "call-one",
+        "call-two",
+        "call-three",
+    ]
+
+
+def store_transition_actions(exporter: InMemorySpanExporter) -> list[str]:
+    events = [event for span in exporter.get_finished_spans() for event in span.events if event.name == "set_state"]
+    events.sort(key=lambda event: int(str(event.attributes["id"]).rsplit(":", 1)[1]))
+    return [str(event.attributes["junjo.store.action"]) for event in events]
+
+
+def tool_span_revisions(exporter: InMemorySpanExporter) -> list[tuple[int, int]]:
+    tool_spans = sorted(
+        (span for span in exporter.get_finished_spans() if span.attributes.get("junjo.agent.operation_type") == "tool"),
+        key=lambda span: span.start_time,
+    )
+    return [
+        (
+            span.attributes["junjo.agent.tool.state_revision.before"],
+            span.attributes["junjo.agent.tool.state_revision.after"],
+        )
+        for span in tool_spans
+    ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_interleaves_start_and_result_revisions(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    calls = lookup_calls(("one", 20), ("two", 10), ("three", 0))
+    sequential = await create_agent(calls, probe=ConcurrencyProbe(), tool_concurrency=1).execute(
+        Question(question="go"),
+        dependencies=None,
+    )
+    sequential_actions = store_transition_actions(span_exporter)
+    sequential_revisions = tool_span_revisions(span_exporter)
+    span_exporter.clear()
+
+    concurrent = await create_agent(calls, probe=ConcurrencyProbe(), tool_concurrency=3).execute(
+        Question(question="go"),
+        dependencies=None,
+    )
+
+    # Every start commits as its call is admitted, before earlier results.
+    tool_actions = ["record_tool_started"] * 3 + ["record_tool_result"] * 3
+    assert store_transition_actions(span_exporter) == [
+        "record_model_start",
+        "record_model_response",
+        "admit_tool_batch",
+        *tool_actions,
+        "record_model_start",
+        "record_model_response",
+        "commit_success",
+    ]
+    assert tool_span_revisions(span_exporter) == [(3, 7), (4, 8), (5, 9)]
+    assert sequential_actions[3:9] == ["record_tool_started", "record_tool_result"] * 3
+    assert sequential_revisions == [(3, 5), (5, 7), (7, 9)]
+
+    # The revision count, transcript, and final counters still match.
+    assert len(store_transition_actions(span_exporter)) == len(sequential_actions)
+    assert concurrent.transcript == sequential.transcript
+    assert (concurrent.tool_call_started_count, concurrent.tool_call_completed_count) == (
+        sequential.tool_call_started_count,
+        sequential.tool_call_completed_count,
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_batch_respects_the_configured_limit() -> None:
+    probe = ConcurrencyProbe()
+    agent = create_agent(
+        lookup_calls(("one", 5), ("two", 5), ("three", 5), ("four", 5)),
+        probe=probe,
+        tool_concurrency=2,
+    )
+
+    result = await agent.execute(Question(question="go"), dependencies=None)
+
+    assert probe.peak == 2
+    assert result.tool_call_completed_count == 4
+
+
+@pytest.mark.asyncio
+async def test_default_agent_runs_tools_sequentially() -> None:
+    probe = ConcurrencyProbe()
+    agent = create_agent(lookup_calls(("one", 5), ("two", 0)), probe=probe, tool_concurrency=1)
+
+    await agent.execute(Question(question="go"), dependencies=None)
+
+    assert agent.tool_concurrency == 1
+    assert probe.peak == 1
+    assert probe.finished == ["one", "two"]
+
+
+@pytest.mark.asyncio
+async def test_failed_call_cancels_later_calls_and_commits_no_later_result() -> None:
+    probe = ConcurrencyProbe()
+    agent = create_agent(
+        lookup_calls(("done", 0), ("fail", 5), ("slow", 50)),
+        probe=probe,
+        tool_concurrency=3,
+    )
+
+    with pytest.raises(AgentToolError) as raised:
+        await agent.execute(Question(question="go"), dependencies=None)
+
+    assert isinstance(raised.value.__cause__, RuntimeError)
+    assert probe.cancelled == ["slow"]
+    assert probe.running == 0
+    state = raised.value.state
+    tool_results = [message for message in state.transcript if message["type"] == "tool_result"]
+    assert [message["callId"] for message in tool_results] == ["call-done"]
+    assert state.tool_call_completed_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_agent_cancels_every_call_in_flight() -> None:
+    probe = ConcurrencyProbe()
+    agent = create_agent(lookup_calls(("one", 1000), ("two", 1000)), probe=probe, tool_concurrency=2)
+    task = asyncio.create_task(agent.execute(Question(question="go"), dependencies=None))
+
+    while probe.running < 2:
+        await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert sorted(probe.cancelled) == ["one", "two"]
+    assert probe.running == 0
+
+
+@pytest.mark.parametrize("tool_concurrency", [0, -1, True, 1.5])
+def test_tool_concurrency_must_be_a_positive_integer(tool_concurrency: object) -> None:
+    with pytest.raises(AgentConfigurationError, match="tool_concurrency"):
+        create_agent(lookup_calls(("one", 0)), probe=ConcurrencyProbe(), tool_concurrency=tool_concurrency)  # type: ignore[arg-type]
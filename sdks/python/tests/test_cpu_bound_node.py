@@ -0,0 +1,167 @@
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from junjo import (
+    BaseState,
+    BaseStore,
+    CpuBoundNode,
+    Graph,
+    Hooks,
+    Workflow,
+    WorkflowCancelledError,
+    WorkflowExecutionError,
+)
+
+
+class ScoreState(BaseState):
+    values: list[int] = []
+    total: int = 0
+    worker_pid: int = 0
+    worker_thread: str = ""
+
+
+class ScoreStore(BaseStore[ScoreState]):
+    pass
+
+
+class SumNode(CpuBoundNode[ScoreStore, ScoreState]):
+    def compute(self, state: ScoreState) -> dict:
+        return {
+            "total": sum(value * value for value in state.values),
+            "worker_pid": os.getpid(),
+            "worker_thread": threading.current_thread().name,
+        }
+
+
+class FailingNode(CpuBoundNode[ScoreStore, ScoreState]):
+    def compute(self, state: ScoreState) -> dict:
+        raise ValueError("cannot score")
+
+
+class BlockingNode(CpuBoundNode[ScoreStore, ScoreState]):
+    def __init__(self, release: threading.Event, started: threading.Event) -> None:
+        super().__init__()
+        self.release = release
+        self.started = started
+
+    def compute(self, state: ScoreState) -> dict:
+        self.started.set()
+        self.release.wait(timeout=5)
+        return {"total": 1}
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+
+    return exporter
+
+
+def create_workflow(node: CpuBoundNode, *, hooks: Hooks | None = None) -> Workflow[ScoreState, ScoreStore]:
+    return Workflow[ScoreState, ScoreStore](
+        name="Score Workflow",
+        graph_factory=lambda: Graph(source=node, sinks=[node], edges=[]),
+        store_factory=lambda: ScoreStore(initial_state=ScoreState(values=[1, 2, 3])),
+        hooks=hooks,
+    )
+
+
+@pytest.mark.asyncio
+async def test_compute_runs_off_the_event_loop_and_commits_its_update(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks()
+    completed: list[str] = []
+    changed: list[str] = []
+    hooks.on_node_completed(lambda event: completed.append(event.name))
+    hooks.on_state_changed(lambda event: changed.append(event.action_name))
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="score") as executor:
+        result = await create_workflow(SumNode(executor=executor), hooks=hooks).execute()
+
+    assert result.state.total == 14
+    assert result.state.worker_thread.startswith("score")
+    assert completed == ["SumNode"]
+    assert changed == ["SumNode"]
+    node_span = next(span for span in span_exporter.get_finished_spans() if span.name == "SumNode")
+    assert node_span.attributes["junjo.node.executor"] == "ThreadPoolExecutor"
+    assert [event.name for event in node_span.events].count("set_state") == 1
+
+
+@pytest.mark.asyncio
+async def test_default_executor_keeps_the_event_loop_responsive() -> None:
+    release = threading.Event()
+    started = threading.Event()
+    workflow_task = asyncio.create_task(create_workflow(BlockingNode(release, started)).execute())
+
+    ticks = 0
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    deadline = time.perf_counter() + 0.05
+    while time.perf_counter() < deadline:
+        ticks += 1
+        await asyncio.sleep(0)
+    release.set()
+
+    result = await workflow_task
+    assert result.state.total == 1
+    assert ticks > 1
+
+
+@pytest.mark.asyncio
+async def test_process_pool_executor_runs_compute_in_a_worker_process() -> None:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        result = await create_workflow(SumNode(executor=executor)).execute()
+
+    assert result.state.total == 14
+    assert result.state.worker_pid != os.getpid()
+
+
+@pytest.mark.asyncio
+async def test_compute_failure_fails_the_node() -> None:
+    failed: list[str] = []
+    hooks = Hooks()
+    hooks.on_node_failed(lambda event: failed.append(event.name))
+
+    with pytest.raises(WorkflowExecutionError) as raised:
+        await create_workflow(FailingNode(), hooks=hooks).execute()
+
+    assert isinstance(raised.value.__cause__, ValueError)
+    assert raised.value.state.total == 0
+    assert failed == ["FailingNode"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_node_discards_the_pending_update() -> None:
+    release = threading.Event()
+    started = threading.Event()
+    cancelled: list[str] = []
+    hooks = Hooks()
+    hooks.on_node_cancelled(lambda event: cancelled.append(event.name))
+    workflow_task = asyncio.create_task(create_workflow(BlockingNode(release, started), hooks=hooks).execute())
+
+    while not started.is_set():
+        await asyncio.sleep(0.001)
+    workflow_task.cancel()
+    with pytest.raises(WorkflowCancelledError) as raised:
+        await workflow_task
+    release.set()
+
+    assert cancelled == ["BlockingNode"]
+    assert raised.value.state.total == 0
@@ -1,8 +1,11 @@
 import json
+from collections import OrderedDict
 from unittest.mock import patch
 
 import pytest
 
+import junjo._json as junjo_json
+import junjo.graph as graph_module
 from junjo import (
     BaseState,
     BaseStore,
@@ -11,6 +14,7 @@ from junjo import (
     Graph,
     GraphSerializationError,
     Node,
+    RunConcurrent,
     Subflow,
 )
 
@@ -158,7 +162,11 @@ def test_serialize_to_json_string_raises_typed_error_for_json_encoding_failure()
     graph = Graph(source=node, sinks=[node], edges=[])
     graph.compile()
 
-    with patch.object(json, "dumps", side_effect=TypeError("boom")):
+    # Fail whichever JSON encoder backend is active.
+    with (
+        patch.object(json, "dumps", side_effect=TypeError("boom")),
+        patch.object(junjo_json, "_encode_orjson", side_effect=TypeError("boom")),
+    ):
         with pytest.raises(GraphSerializationError, match="Failed to serialize graph to JSON"):
             graph.serialize_to_json_string()
 
@@ -180,3 +188,108 @@ def test_serialized_graph_includes_explicit_runtime_and_structural_identity_fiel
     assert serialized["edges"][0]["edgeStructuralId"].startswith("edge_")
     assert serialized["edges"][0]["tailNodeRuntimeId"] == start.id
     assert serialized["edges"][0]["headNodeRuntimeId"] == end.id
+
+
+def create_composite_graph(*, child_label: str | None = None) -> Graph:
+    def create_child_graph() -> Graph:
+        start = StartNode()
+        if child_label is not None:
+            start.label = child_label
+        end = EndNode()
+        return Graph(source=start, sinks=[end], edges=[Edge(tail=start, head=end, condition=AlwaysTrue())])
+
+    start = StartNode()
+    fan_out = RunConcurrent(name="fan out", items=[StartNode(), EndNode()])
+    subflow = ExampleSubflow(
+        graph_factory=create_child_graph,
+        store_factory=lambda: ChildStore(initial_state=ChildState()),
+    )
+    end = EndNode()
+    return Graph(
+        source=start,
+        sinks=[end],
+        edges=[
+            Edge(tail=start, head=fan_out),
+            Edge(tail=fan_out, head=subflow),
+            Edge(tail=subflow, head=end),
+        ],
+    )
+
+
+@pytest.fixture
+def empty_snapshot_cache(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(graph_module, "_graph_snapshot_templates", OrderedDict())
+
+
+def test_cached_snapshot_matches_fresh_serialization_with_new_runtime_ids(empty_snapshot_cache: None) -> None:
+    first = create_composite_graph()
+    second = create_composite_graph()
+
+    assert first._snapshot_json() == first.serialize_to_json_string()
+    assert len(graph_module._graph_snapshot_templates) == 1
+
+    cached = second._snapshot_json()
+    assert cached == second.serialize_to_json_string()
+    assert len(graph_module._graph_snapshot_templates) == 1
+    assert json.loads(cached)["graphStructuralId"] == json.loads(first._snapshot_json())["graphStructuralId"]
+    assert {node["nodeRuntimeId"] for node in json.loads(cached)["nodes"]}.isdisjoint(
+        node["nodeRuntimeId"] for node in json.loads(first._snapshot_json())["nodes"]
+    )
+
+
+def test_snapshot_cache_is_bounded_lru(empty_snapshot_cache: None, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(graph_module, "_GRAPH_SNAPSHOT_CACHE_MAXSIZE", 2)
+    graphs = [create_composite_graph(child_label=f"child {index}") for index in range(3)]
+
+    graphs[0]._snapshot_json()
+    graphs[1]._snapshot_json()
+    graphs[0]._snapshot_json()
+    graphs[2]._snapshot_json()
+
+    assert list(graph_module._graph_snapshot_templates) == [
+        graphs[0].compile().graph_structural_id,
+        graphs[2].compile().graph_structural_id,
+    ]
+
+
+def test_snapshot_labels_containing_slot_markers_bypass_the_cache(empty_snapshot_cache: None) -> None:
+    graph = create_composite_graph(child_label="\ue0000\ue001")
+
+    assert graph._snapshot_json() == graph.serialize_to_json_string()
+    assert len(graph_module._graph_snapshot_templates) == 0
+
+
+def create_two_subflow_graph(*, share_child_nodes: bool) -> Graph:
+    shared_start = StartNode()
+    shared_end = EndNode()
+
+    def create_child_graph() -> Graph:
+        start, end = (shared_start, shared_end) if share_child_nodes else (StartNode(), EndNode())
+        return Graph(source=start, sinks=[end], edges=[Edge(tail=start, head=end)])
+
+    first = ExampleSubflow(
+        graph_factory=create_child_graph,
+        store_factory=lambda: ChildStore(initial_state=ChildState()),
+    )
+    second = ExampleSubflow(
+        graph_factory=create_child_graph,
+        store_factory=lambda: ChildStore(initial_state=ChildState()),
+    )
+    return Graph(source=first, sinks=[second], edges=[Edge(tail=first, head=second)])
+
+
+@pytest.mark.parametrize("cached_shares_child_nodes", [False, True])
+def test_snapshot_with_nodes_shared_across_subflows_matches_fresh_serialization(
+    empty_snapshot_cache: None,
+    cached_shares_child_nodes: bool,
+) -> None:
+    cached_graph = create_two_subflow_graph(share_child_nodes=cached_shares_child_nodes)
+    graph = create_two_subflow_graph(share_child_nodes=not cached_shares_child_nodes)
+    assert graph.compile().graph_structural_id == cached_graph.compile().graph_structural_id
+
+    assert cached_graph._snapshot_json() == cached_graph.serialize_to_json_string()
+    assert graph._snapshot_json() == graph.serialize_to_json_string()
+    assert len(graph_module._graph_snapshot_templates) == 1
+
+    repeated = create_two_subflow_graph(share_child_nodes=cached_shares_child_nodes)
+    assert repeated._snapshot_json() == repeated.serialize_to_json_string()
@@ -0,0 +1,164 @@
+"""Graph traversal through the precompiled plan, plus a steps-per-second benchmark."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from junjo import BaseState, BaseStore, Condition, Edge, Graph, Node, Workflow
+
+ITERATIONS = 60
+
+
+class RetryState(BaseState):
+    attempts: int = 0
+    payload: dict[str, list[int]] = {}
+
+
+class RetryStore(BaseStore[RetryState]):
+    async def set_attempts(self, attempts: int) -> None:
+        await self.set_state({"attempts": attempts})
+
+
+class AttemptNode(Node[RetryStore]):
+    async def service(self, store: RetryStore) -> None:
+        state = await store.get_state(detached=False)
+        await store.set_attempts(state.attempts + 1)
+
+
+class CheckNode(Node[RetryStore]):
+    async def service(self, store: RetryStore) -> None:
+        return None
+
+
+class DoneNode(Node[RetryStore]):
+    async def service(self, store: RetryStore) -> None:
+        return None
+
+
+class AttemptsReached(Condition[RetryState]):
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.evaluated_states: list[RetryState] = []
+
+    def evaluate(self, state: RetryState) -> bool:
+        self.evaluated_states.append(state)
+        return state.attempts >= self.limit
+
+
+class Always(Condition[RetryState]):
+    def __init__(self) -> None:
+        self.evaluated_states: list[RetryState] = []
+
+    def evaluate(self, state: RetryState) -> bool:
+        self.evaluated_states.append(state)
+        return True
+
+
+def create_retry_workflow(iterations: int = ITERATIONS) -> Workflow[RetryState, RetryStore]:
+    def graph_factory() -> Graph:
+        attempt = AttemptNode()
+        check = CheckNode()
+        done = DoneNode()
+        return Graph(
+            source=attempt,
+            sinks=[done],
+            edges=[
+                Edge(tail=attempt, head=check),
+                Edge(tail=check, head=done, condition=AttemptsReached(iterations)),
+                Edge(tail=check, head=attempt),
+            ],
+        )
+
+    return Workflow[RetryState, RetryStore](
+        name="Retry Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: RetryStore(
+            initial_state=RetryState(payload={f"key-{index}": list(range(50)) for index in range(50)})
+        ),
+        max_iterations=iterations + 1,
+    )
+
+
+def count_state_reads(monkeypatch: pytest.MonkeyPatch) -> list[bool]:
+    reads: list[bool] = []
+    original_get_state = BaseStore.get_state
+
+    async def recording_get_state(self, *, detached=True):
+        reads.append(detached)
+        return await original_get_state(self, detached=detached)
+
+    monkeypatch.setattr(BaseStore, "get_state", recording_get_state)
+    return reads
+
+
+@pytest.mark.asyncio
+async def test_unconditional_edge_resolves_without_reading_the_store(monkeypatch: pytest.MonkeyPatch) -> None:
+    tail = CheckNode()
+    head = DoneNode()
+    graph = Graph(source=tail, sinks=[head], edges=[Edge(tail=tail, head=head)])
+    store = RetryStore(initial_state=RetryState())
+    reads = count_state_reads(monkeypatch)
+
+    assert await graph.get_next_node(store, tail) is head
+    assert reads == []
+
+
+@pytest.mark.asyncio
+async def test_conditions_of_one_step_share_one_detached_snapshot(monkeypatch: pytest.MonkeyPatch) -> None:
+    tail = CheckNode()
+    skipped = DoneNode()
+    taken = DoneNode()
+    first = AttemptsReached(1)
+    second = Always()
+    graph = Graph(
+        source=tail,
+        sinks=[skipped, taken],
+        edges=[
+            Edge(tail=tail, head=skipped, condition=first),
+            Edge(tail=tail, head=taken, condition=second),
+        ],
+    )
+    store = RetryStore(initial_state=RetryState())
+    reads = count_state_reads(monkeypatch)
+
+    assert await graph.get_next_node(store, tail) is taken
+    assert reads == [True]
+    assert first.evaluated_states[0] is second.evaluated_states[0]
+
+
+@pytest.mark.asyncio
+async def test_traversal_plan_is_built_once_per_compiled_graph(monkeypatch: pytest.MonkeyPatch) -> None:
+    tail = AttemptNode()
+    head = DoneNode()
+    graph = Graph(source=tail, sinks=[head], edges=[Edge(tail=tail, head=head)])
+    builds: list[object] = []
+    original_build = Graph._build_traversal_plan
+
+    def recording_build(compiled):
+        builds.append(compiled)
+        return original_build(compiled)
+
+    monkeypatch.setattr(Graph, "_build_traversal_plan", staticmethod(recording_build))
+    store = RetryStore(initial_state=RetryState())
+
+    for _ in range(3):
+        assert await graph.get_next_node(store, tail) is head
+    assert builds == [graph.compile()]
+
+
+@pytest.mark.asyncio
+async def test_retry_loop_steps_per_second(record_property: Callable[[str, object], None]) -> None:
+    workflow = create_retry_workflow()
+    result = await workflow.execute()
+    assert result.state.attempts == ITERATIONS
+
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        await workflow.execute()
+        best = min(best, time.perf_counter() - started)
+
+    # Every attempt runs AttemptNode and CheckNode, then DoneNode once.
+    steps = ITERATIONS * 2 + 1
+    record_property("traversal_steps_per_second", round(steps / best))
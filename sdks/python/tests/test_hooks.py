@@ -15,6 +15,7 @@ from opentelemetry.trace import StatusCode
 from junjo import (
     BaseState,
     BaseStore,
+    Edge,
     Graph,
     Hooks,
     Node,
@@ -802,3 +803,252 @@ async def test_failed_workflow_and_node_spans_emit_standard_error_type(
 def test_old_hook_manager_module_is_removed() -> None:
     with pytest.raises(ModuleNotFoundError):
         importlib.import_module("junjo.telemetry.hook_manager")
+
+
+class YieldingNode(Node[HookStore]):
+    async def service(self, store: HookStore) -> None:
+        await asyncio.sleep(0)
+
+
+class ReleasingNode(Node[HookStore]):
+    def __init__(self, gate: asyncio.Event) -> None:
+        super().__init__()
+        self.gate = gate
+
+    async def service(self, store: HookStore) -> None:
+        self.gate.set()
+        await asyncio.sleep(0)
+
+
+def create_gated_workflow(
+    gate: asyncio.Event,
+    *,
+    hooks: Hooks,
+    yielding_nodes: int = 4,
+) -> Workflow[HookState, HookStore]:
+    def graph_factory() -> Graph:
+        nodes: list[Node] = [YieldingNode() for _ in range(yielding_nodes)]
+        nodes.append(ReleasingNode(gate))
+        return Graph(
+            source=nodes[0],
+            sinks=[nodes[-1]],
+            edges=[Edge(tail=tail, head=head) for tail, head in zip(nodes, nodes[1:], strict=False)],
+        )
+
+    return Workflow[HookState, HookStore](
+        name="Gated Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: HookStore(initial_state=HookState()),
+        hooks=hooks,
+    )
+
+
+def record_gated_node_completions(hooks: Hooks, gate: asyncio.Event) -> list[str]:
+    delivered: list[str] = []
+
+    async def slow_subscriber(event) -> None:
+        await gate.wait()
+        delivered.append(event.executable_runtime_id)
+
+    hooks.on_node_completed(slow_subscriber)
+    return delivered
+
+
+@pytest.mark.parametrize(
+    "options",
+    [
+        {"delivery": "streamed"},
+        {"delivery": "queued", "backpressure": "drop_all"},
+        {"delivery": "queued", "max_queued_events": 0},
+        {"callback_concurrency": "parallel"},
+    ],
+)
+def test_hooks_reject_unknown_delivery_options(options: dict) -> None:
+    with pytest.raises(ValueError):
+        Hooks(**options)
+
+
+@pytest.mark.asyncio
+async def test_queued_delivery_does_not_block_execution_on_slow_callbacks() -> None:
+    gate = asyncio.Event()
+    hooks = Hooks(delivery="queued")
+    delivered = record_gated_node_completions(hooks, gate)
+    delivered_before_terminal: list[int] = []
+    hooks.on_workflow_completed(lambda event: delivered_before_terminal.append(len(delivered)))
+
+    # Inline delivery would deadlock: the first node's callback waits for the
+    # gate that only the last node opens.
+    result = await asyncio.wait_for(create_gated_workflow(gate, hooks=hooks).execute(), timeout=5)
+
+    assert len(delivered) == 5
+    assert delivered_before_terminal == [5]
+    assert set(result.node_execution_counts) == set(delivered)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("backpressure", ["drop_oldest", "drop_new"])
+async def test_queued_delivery_drops_events_when_full_and_counts_them(
+    span_exporter: InMemorySpanExporter,
+    backpressure: str,
+) -> None:
+    gate = asyncio.Event()
+    hooks = Hooks(delivery="queued", max_queued_events=1, backpressure=backpressure)
+    delivered = record_gated_node_completions(hooks, gate)
+
+    await asyncio.wait_for(
+        create_gated_workflow(gate, hooks=hooks, yielding_nodes=6).execute(),
+        timeout=5,
+    )
+
+    workflow_span = next(span for span in span_exporter.get_finished_spans() if span.name == "Gated Workflow")
+    dropped = workflow_span.attributes["junjo.hook.queue.dropped_count"]
+    node_spans = [span for span in span_exporter.get_finished_spans() if span.attributes["junjo.span_type"] == "node"]
+    emitted = [span.attributes["junjo.executable_runtime_id"] for span in node_spans]
+    assert dropped > 0
+    assert len(delivered) + dropped == len(emitted)
+    assert delivered == [runtime_id for runtime_id in emitted if runtime_id in delivered]
+    if backpressure == "drop_new":
+        assert delivered[0] == emitted[0]
+    else:
+        assert delivered[-1] == emitted[-1]
+
+
+@pytest.mark.asyncio
+async def test_queued_delivery_blocks_when_full_without_dropping(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks(delivery="queued", max_queued_events=1)
+    delivered: list[str] = []
+
+    async def slow_subscriber(event) -> None:
+        await asyncio.sleep(0)
+        delivered.append(event.name)
+
+    hooks.on_node_completed(slow_subscriber)
+    hooks.on_state_changed(slow_subscriber)
+
+    result = await create_simple_workflow(hooks=hooks).execute()
+
+    workflow_span = next(span for span in span_exporter.get_finished_spans() if span.name == "Hook Workflow")
+    assert result.state.steps == ["HookNode"]
+    assert delivered == ["HookNode", "HookNode"]
+    assert workflow_span.attributes["junjo.hook.queue.dropped_count"] == 0
+
+
+@pytest.mark.asyncio
+async def test_queued_hook_failures_are_recorded_once(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks(delivery="queued")
+
+    def failing_hook(event) -> None:
+        raise RuntimeError("bad hook")
+
+    hooks.on_node_completed(failing_hook)
+
+    await create_simple_workflow(hooks=hooks).execute()
+
+    hook_error_events = [
+        event
+        for span in span_exporter.get_finished_spans()
+        for event in span.events
+        if event.name == "junjo.hook_error"
+    ]
+    assert len(hook_error_events) == 1
+    assert hook_error_events[0].attributes["junjo.hook.event"] == "node_completed"
+    assert hook_error_events[0].attributes["junjo.hook.error.message"] == "bad hook"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callbacks_for_one_event_overlap() -> None:
+    hooks = Hooks(callback_concurrency="concurrent")
+    first_running = asyncio.Event()
+    second_running = asyncio.Event()
+    calls: list[str] = []
+
+    async def first(event) -> None:
+        first_running.set()
+        await second_running.wait()
+        calls.append("first")
+
+    async def second(event) -> None:
+        second_running.set()
+        await first_running.wait()
+        calls.append("second")
+
+    hooks.on_workflow_started(first)
+    hooks.on_workflow_started(second)
+    hooks.on_workflow_started(lambda event: calls.append("sync"))
+
+    # Sequential delivery would deadlock: each callback waits for the other.
+    await asyncio.wait_for(create_simple_workflow(hooks=hooks).execute(), timeout=5)
+
+    assert calls[0] == "sync"
+    assert sorted(calls[1:]) == ["first", "second"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_callback_failures_are_isolated_and_recorded(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks(callback_concurrency="concurrent")
+    calls: list[str] = []
+
+    async def failing(event) -> None:
+        await asyncio.sleep(0)
+        raise RuntimeError("bad hook")
+
+    async def directly_cancelled(event) -> None:
+        raise asyncio.CancelledError("observer-only")
+
+    async def succeeding(event) -> None:
+        await asyncio.sleep(0)
+        calls.append("continued")
+
+    hooks.on_workflow_started(failing)
+    hooks.on_workflow_started(directly_cancelled)
+    hooks.on_workflow_started(succeeding)
+
+    result = await create_simple_workflow(hooks=hooks).execute()
+
+    assert result.state.steps == ["HookNode"]
+    assert calls == ["continued"]
+    workflow_span = next(span for span in span_exporter.get_finished_spans() if span.name == "Hook Workflow")
+    error_types = [
+        event.attributes["junjo.hook.error.type"]
+        for event in workflow_span.events
+        if event.name == "junjo.hook_error"
+    ]
+    assert error_types == ["RuntimeError", "CancelledError"]
+
+
+@pytest.mark.asyncio
+async def test_cancelling_concurrent_terminal_delivery_cancels_every_callback(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks(callback_concurrency="concurrent")
+    callbacks_started = asyncio.Event()
+    running: list[str] = []
+
+    async def blocked(event) -> None:
+        running.append(event.name)
+        if len(running) == 2:
+            callbacks_started.set()
+        await asyncio.Future()
+
+    hooks.on_workflow_completed(blocked)
+    hooks.on_workflow_completed(blocked)
+    task = asyncio.create_task(create_simple_workflow(hooks=hooks).execute())
+    await asyncio.wait_for(callbacks_started.wait(), timeout=1)
+    task.cancel("terminal_delivery_cancelled")
+
+    with pytest.raises(asyncio.CancelledError, match="terminal_delivery_cancelled"):
+        await task
+
+    workflow_span = next(span for span in span_exporter.get_finished_spans() if span.name == "Hook Workflow")
+    reasons = [
+        event.attributes["junjo.hook.delivery.cancelled_reason"]
+        for event in workflow_span.events
+        if event.name == "junjo.hook_delivery_cancelled"
+    ]
+    assert reasons == ["terminal_delivery_cancelled", "terminal_delivery_cancelled"]
@@ -0,0 +1,200 @@
+"""Throughput of portable JSON normalization on realistic state payloads."""
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from types import MappingProxyType
+
+import pytest
+
+from junjo import get_json_encoder, set_json_encoder
+from junjo._json import (
+    JsonBoundaryError,
+    JsonNestingDepthError,
+    _encode_orjson,
+    _encode_stdlib,
+    freeze_json,
+    json_dumps,
+    normalize_json,
+    thaw_json,
+    validate_json_nesting,
+)
+
+PAYLOAD_SIZES = {"10KB": 10_000, "100KB": 100_000, "1MB": 1_000_000}
+
+
+def state_payload(target_bytes: int) -> dict[str, object]:
+    """Build a conversation-style state projection of roughly ``target_bytes``."""
+
+    messages: list[object] = []
+    documents: dict[str, object] = {}
+    payload: dict[str, object] = {"run": {"attempt": 1, "done": False}, "messages": messages, "documents": documents}
+    index = 0
+    size = 0
+    while size < target_bytes:
+        message = {
+            "role": "assistant" if index % 2 else "user",
+            "content": f"Message {index}: the quick brown fox jumps over the lazy dog — ünïcode included.",
+            "usage": {"input_tokens": index * 3, "output_tokens": index, "latency": 0.25 * index},
+            "tool_calls": [{"id": f"call-{index}", "arguments": {"query": "weather", "limit": 5}}],
+        }
+        messages.append(message)
+        size += len(json.dumps(message))
+        if index % 4 == 0:
+            document = {"title": f"Document {index}", "score": 0.5, "chunks": ["lorem ipsum"] * 8}
+            documents[f"doc-{index}"] = document
+            size += len(json.dumps(document))
+        index += 1
+    return payload
+
+
+def three_pass_normalize(value: object) -> object:
+    """The previous nesting-walk, freeze, then thaw pipeline, kept as a reference."""
+
+    validate_json_nesting(value)
+    return thaw_json(freeze_json(value))
+
+
+def three_pass_dumps(value: object) -> str:
+    return json.dumps(
+        three_pass_normalize(value),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+
+
+def throughput(function: Callable[[object], object], payload: object, size: int) -> float:
+    """Return the best observed megabytes per second over three repetitions."""
+
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        function(payload)
+        best = min(best, time.perf_counter() - started)
+    return size / best / 1_000_000
+
+
+@pytest.mark.parametrize("label", list(PAYLOAD_SIZES))
+def test_single_pass_normalization_matches_three_pass_reference(
+    label: str,
+    record_property: Callable[[str, object], None],
+) -> None:
+    payload = state_payload(PAYLOAD_SIZES[label])
+    size = len(json.dumps(payload).encode())
+
+    assert normalize_json(payload) == three_pass_normalize(payload)
+    assert json_dumps(payload) == three_pass_dumps(payload)
+
+    normalize_rate = throughput(normalize_json, payload, size)
+    dumps_rate = throughput(json_dumps, payload, size)
+    reference_normalize_rate = throughput(three_pass_normalize, payload, size)
+    reference_dumps_rate = throughput(three_pass_dumps, payload, size)
+    record_property("normalize_json_mb_per_s", round(normalize_rate, 1))
+    record_property("json_dumps_mb_per_s", round(dumps_rate, 1))
+    record_property("three_pass_normalize_mb_per_s", round(reference_normalize_rate, 1))
+    record_property("three_pass_dumps_mb_per_s", round(reference_dumps_rate, 1))
+
+
+@pytest.fixture
+def stdlib_encoder() -> Iterator[None]:
+    selected = get_json_encoder()
+    set_json_encoder("stdlib")
+    try:
+        yield
+    finally:
+        set_json_encoder(selected)
+
+
+ENCODER_VECTORS = [
+    {"z": 1, "a": 2, "é": 3, "Z": 4, "😀": 5, "\uffff": 6},
+    '\x00\x1f\x7f \b\f\n\r\t"\\/é😀\u2028',
+    [0.0, -0.0, 1.0, 0.1, 0.0001, 0.00009999, 1.5e-05, 2.5e-07, 5e-324, 1e15, 1e16, 1.7976931348623157e308],
+    [0, -1, 9_007_199_254_740_991, -9_007_199_254_740_991, True, False, None],
+    {"nested": ({"tuple": (1, "two")}, MappingProxyType({"b": [], "a": {}}))},
+]
+
+
+@pytest.mark.parametrize("value", ENCODER_VECTORS)
+def test_orjson_backend_is_byte_identical_to_stdlib(value: object) -> None:
+    pytest.importorskip("orjson")
+    selected = get_json_encoder()
+    try:
+        set_json_encoder("stdlib")
+        expected = json_dumps(value)
+        set_json_encoder("orjson")
+        assert json_dumps(value) == expected
+    finally:
+        set_json_encoder(selected)
+    assert expected == _encode_stdlib(three_pass_normalize(value))
+
+
+@pytest.mark.parametrize("label", list(PAYLOAD_SIZES))
+def test_orjson_backend_matches_stdlib_on_state_payloads(
+    label: str,
+    record_property: Callable[[str, object], None],
+    stdlib_encoder: None,
+) -> None:
+    pytest.importorskip("orjson")
+    payload = state_payload(PAYLOAD_SIZES[label])
+    size = len(json.dumps(payload).encode())
+
+    stdlib_text = json_dumps(payload)
+    stdlib_dumps_rate = throughput(json_dumps, payload, size)
+    set_json_encoder("orjson")
+    assert json_dumps(payload) == stdlib_text
+    orjson_dumps_rate = throughput(json_dumps, payload, size)
+    record_property("stdlib_json_dumps_mb_per_s", round(stdlib_dumps_rate, 1))
+    record_property("orjson_json_dumps_mb_per_s", round(orjson_dumps_rate, 1))
+    # Validation dominates end-to-end timings; record the encoding step alone.
+    record_property("stdlib_encode_mb_per_s", round(throughput(_encode_stdlib, payload, size), 1))
+    record_property("orjson_encode_mb_per_s", round(throughput(_encode_orjson, payload, size), 1))
+
+
+def test_json_encoder_selection_rejects_unknown_backends(stdlib_encoder: None) -> None:
+    with pytest.raises(ValueError):
+        set_json_encoder("ujson")  # type: ignore[arg-type]
+    assert get_json_encoder() == "stdlib"
+
+
+def test_json_dumps_normalizes_frozen_containers_before_encoding() -> None:
+    value = {"b": (1, 2), "a": MappingProxyType({"z": None, "y": [True]})}
+
+    assert json_dumps(value) == '{"a":{"y":[true],"z":null},"b":[1,2]}'
+    assert json_dumps(freeze_json({"k": [1.5]})) == '{"k":[1.5]}'
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"nested": [9_007_199_254_740_992]},
+        {"nested": {"text": "\ud800"}},
+        {"nested": [float("nan")]},
+        {1: "non-string key"},
+        {"nested": (object(),)},
+    ],
+)
+def test_single_pass_paths_reject_what_the_reference_rejects(value: object) -> None:
+    with pytest.raises(JsonBoundaryError):
+        three_pass_normalize(value)
+    with pytest.raises(JsonBoundaryError):
+        normalize_json(value)
+    with pytest.raises(JsonBoundaryError):
+        json_dumps(value)
+
+
+def test_single_pass_paths_enforce_the_nesting_bound() -> None:
+    accepted: object = "leaf"
+    for _ in range(128):
+        accepted = {"k": accepted}
+    assert normalize_json(accepted) == accepted
+    assert json.loads(json_dumps(accepted)) == accepted
+
+    rejected = {"k": accepted}
+    with pytest.raises(JsonNestingDepthError):
+        normalize_json(rejected)
+    with pytest.raises(JsonNestingDepthError):
+        json_dumps(rejected)
+    with pytest.raises(JsonNestingDepthError):
+        validate_json_nesting(rejected)
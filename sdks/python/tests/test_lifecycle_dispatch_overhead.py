@@ -0,0 +1,134 @@
+"""Per-node lifecycle overhead with zero, one, and many subscribed hooks."""
+
+import time
+from collections.abc import Callable
+
+import pytest
+
+from junjo import BaseState, BaseStore, Edge, Graph, Hooks, Node, Workflow
+from junjo._lifecycle import LifecycleDispatcher
+
+NODE_COUNT = 50
+
+
+class CounterState(BaseState):
+    count: int = 0
+    payload: dict[str, list[int]] = {}
+
+
+class CounterStore(BaseStore[CounterState]):
+    async def increment(self, value: int) -> None:
+        await self.set_state({"count": value})
+
+
+class IncrementNode(Node[CounterStore]):
+    def __init__(self, value: int) -> None:
+        super().__init__()
+        self.value = value
+
+    async def service(self, store: CounterStore) -> None:
+        await store.increment(self.value)
+
+
+def create_chain_workflow(*, hooks: Hooks | None = None) -> Workflow[CounterState, CounterStore]:
+    def graph_factory() -> Graph:
+        nodes = [IncrementNode(index + 1) for index in range(NODE_COUNT)]
+        return Graph(
+            source=nodes[0],
+            sinks=[nodes[-1]],
+            edges=[Edge(tail=tail, head=head) for tail, head in zip(nodes, nodes[1:], strict=False)],
+        )
+
+    return Workflow[CounterState, CounterStore](
+        name="Chain Workflow",
+        graph_factory=graph_factory,
+        # A wide state makes the deep copy behind state_changed measurable.
+        store_factory=lambda: CounterStore(
+            initial_state=CounterState(payload={f"key-{index}": list(range(50)) for index in range(50)})
+        ),
+        hooks=hooks,
+    )
+
+
+def subscribe_everywhere(hooks: Hooks, callbacks_per_event: int) -> None:
+    registrations = [getattr(hooks, name) for name in dir(hooks) if name.startswith("on_")]
+    for register in registrations:
+        for _ in range(callbacks_per_event):
+            register(lambda event: None)
+
+
+def hooks_for(label: str) -> Hooks | None:
+    if label == "zero":
+        return None
+    hooks = Hooks()
+    if label == "one":
+        hooks.on_node_completed(lambda event: None)
+    else:
+        subscribe_everywhere(hooks, callbacks_per_event=8)
+    return hooks
+
+
+async def per_node_overhead(hooks: Hooks | None) -> float:
+    """Return the best observed microseconds per node over five runs."""
+
+    workflow = create_chain_workflow(hooks=hooks)
+    await workflow.execute()
+    best = float("inf")
+    for _ in range(5):
+        started = time.perf_counter()
+        await workflow.execute()
+        best = min(best, time.perf_counter() - started)
+    return best / NODE_COUNT * 1_000_000
+
+
+def test_dispatcher_subscription_flags_ignore_unsubscribed_events() -> None:
+    hooks = Hooks()
+    hooks.on_node_completed(lambda event: None)
+    removed = hooks.on_state_changed(lambda event: None)
+    removed()
+
+    dispatcher = LifecycleDispatcher(hooks)
+
+    assert dispatcher.subscribes("node_completed")
+    assert not dispatcher.subscribes("state_changed")
+    assert not dispatcher.subscribes("node_started")
+    assert not LifecycleDispatcher(None).subscribes("node_completed")
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_events_are_never_built_or_dispatched(monkeypatch: pytest.MonkeyPatch) -> None:
+    dispatched: list[str] = []
+    original_dispatch = LifecycleDispatcher.dispatch
+
+    async def recording_dispatch(self, prepared, *, terminal=False):
+        if prepared is not None:
+            dispatched.append(prepared.event_name)
+        await original_dispatch(self, prepared, terminal=terminal)
+
+    def unexpected_state_changed(*args, **kwargs):
+        raise AssertionError("state_changed payload built without a subscriber")
+
+    monkeypatch.setattr(LifecycleDispatcher, "dispatch", recording_dispatch)
+    monkeypatch.setattr(LifecycleDispatcher, "state_changed", unexpected_state_changed)
+
+    completed: list[str] = []
+    hooks = Hooks()
+    hooks.on_node_completed(lambda event: completed.append(event.name))
+
+    await create_chain_workflow(hooks=hooks).execute()
+    assert dispatched == ["node_completed"] * NODE_COUNT
+    assert completed == ["IncrementNode"] * NODE_COUNT
+
+    dispatched.clear()
+    await create_chain_workflow().execute()
+    assert dispatched == []
+
+
+@pytest.mark.asyncio
+async def test_per_node_overhead_by_subscription_count(record_property: Callable[[str, object], None]) -> None:
+    # Recorded only: without subscribers a node pays for neither event
+    # construction nor the detached state copy that state_changed hooks
+    # receive, which test_unsubscribed_events_are_never_built_or_dispatched
+    # asserts directly.
+    for label in ("zero", "one", "many"):
+        record_property(f"per_node_us_{label}_hooks", round(await per_node_overhead(hooks_for(label)), 1))
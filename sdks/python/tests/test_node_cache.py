@@ -0,0 +1,265 @@
+import sqlite3
+import time
+from pathlib import Path
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from junjo import (
+    BaseState,
+    BaseStore,
+    CachedNode,
+    Graph,
+    InMemoryNodeCache,
+    NodeCache,
+    SQLiteNodeCache,
+    Workflow,
+    WorkflowExecutionError,
+)
+
+
+class Category(BaseState):
+    label: str
+    confidence: float
+
+
+class MessageState(BaseState):
+    message: str = ""
+    channel: str = ""
+    category: Category | None = None
+    prompt: str = ""
+
+
+class MessageStore(BaseStore[MessageState]):
+    async def set_category(self, category: Category) -> None:
+        await self.set_state({"category": category})
+
+    async def set_prompt(self, prompt: str) -> None:
+        await self.set_state({"prompt": prompt})
+
+
+class ClassifyMessageNode(CachedNode[MessageStore]):
+    cache_key_fields = ("message",)
+
+    def __init__(self, cache: NodeCache) -> None:
+        super().__init__(cache=cache)
+        self.service_calls = 0
+
+    async def service(self, store: MessageStore) -> None:
+        self.service_calls += 1
+        state = await store.get_state()
+        if state.message == "fail":
+            raise RuntimeError("classifier unavailable")
+        await store.set_category(Category(label=state.message.upper(), confidence=0.5))
+        await store.set_prompt(f"Reply to {state.message}")
+
+
+class SwallowedRejectionNode(CachedNode[MessageStore]):
+    cache_key_fields = ("message",)
+
+    def __init__(self, cache: NodeCache, *, in_transaction: bool) -> None:
+        super().__init__(cache=cache)
+        self.in_transaction = in_transaction
+        self.service_calls = 0
+
+    async def service(self, store: MessageStore) -> None:
+        self.service_calls += 1
+        await store.set_prompt("Reply later")
+        try:
+            if self.in_transaction:
+                async with store.transaction():
+                    await store.set_state({"category": "not a category"})
+            else:
+                await store.set_state({"category": "not a category"})
+        except ValueError:
+            pass
+
+
+class UnknownFieldNode(CachedNode[MessageStore]):
+    cache_key_fields = ("missing",)
+
+    async def service(self, store: MessageStore) -> None:
+        return None
+
+
+class UndeclaredNode(CachedNode[MessageStore]):
+    async def service(self, store: MessageStore) -> None:
+        return None
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+
+    return exporter
+
+
+def create_workflow(node: CachedNode) -> Workflow[MessageState, MessageStore]:
+    return Workflow[MessageState, MessageStore](
+        name="Classify Workflow",
+        graph_factory=lambda: Graph(source=node, sinks=[node], edges=[]),
+        store_factory=lambda: MessageStore(initial_state=MessageState()),
+    )
+
+
+async def run(node: CachedNode, message: str, channel: str = "email") -> MessageState:
+    workflow = Workflow[MessageState, MessageStore](
+        name="Classify Workflow",
+        graph_factory=lambda: Graph(source=node, sinks=[node], edges=[]),
+        store_factory=lambda: MessageStore(initial_state=MessageState(message=message, channel=channel)),
+    )
+    return (await workflow.execute()).state
+
+
+@pytest.mark.asyncio
+async def test_hit_replays_the_cached_update_without_running_the_node(span_exporter: InMemorySpanExporter) -> None:
+    node = ClassifyMessageNode(InMemoryNodeCache())
+
+    first = await run(node, "hello")
+    # Fields outside cache_key_fields do not affect the key.
+    second = await run(node, "hello", channel="sms")
+
+    assert node.service_calls == 1
+    assert second.category == first.category == Category(label="HELLO", confidence=0.5)
+    assert second.prompt == "Reply to hello"
+    assert second.channel == "sms"
+
+    node_spans = [span for span in span_exporter.get_finished_spans() if span.name == "ClassifyMessageNode"]
+    assert [span.attributes["junjo.node.cache_hit"] for span in node_spans] == [False, True]
+    assert [event.name for event in node_spans[1].events].count("set_state") == 1
+
+
+@pytest.mark.asyncio
+async def test_different_key_fields_miss() -> None:
+    node = ClassifyMessageNode(InMemoryNodeCache())
+
+    await run(node, "hello")
+    other = await run(node, "goodbye")
+
+    assert node.service_calls == 2
+    assert other.category == Category(label="GOODBYE", confidence=0.5)
+
+
+@pytest.mark.asyncio
+async def test_failed_runs_are_not_cached() -> None:
+    node = ClassifyMessageNode(InMemoryNodeCache())
+
+    for _ in range(2):
+        with pytest.raises(WorkflowExecutionError):
+            await run(node, "fail")
+
+    assert node.service_calls == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("in_transaction", [False, True])
+async def test_runs_that_swallow_a_rejected_update_are_not_cached(in_transaction: bool) -> None:
+    node = SwallowedRejectionNode(InMemoryNodeCache(), in_transaction=in_transaction)
+
+    for _ in range(2):
+        state = await run(node, "hello")
+        assert state.prompt == "Reply later"
+        assert state.category is None
+
+    assert node.service_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used_and_expired_entries(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = InMemoryNodeCache(max_entries=2, ttl_seconds=10)
+    now = time.monotonic()
+    monkeypatch.setattr(time, "monotonic", lambda: now)
+
+    await cache.set("a", "1")
+    await cache.set("b", "2")
+    assert await cache.get("a") == "1"
+    await cache.set("c", "3")
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == "1"
+
+    now += 11
+    assert await cache.get("a") is None
+    assert await cache.get("c") is None
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_persists_updates_across_instances(tmp_path: Path) -> None:
+    path = tmp_path / "node-cache.sqlite"
+    first_cache = SQLiteNodeCache(path)
+    first_node = ClassifyMessageNode(first_cache)
+    await run(first_node, "hello")
+    first_cache.close()
+
+    second_cache = SQLiteNodeCache(path)
+    second_node = ClassifyMessageNode(second_cache)
+    state = await run(second_node, "hello")
+    second_cache.close()
+
+    assert second_node.service_calls == 0
+    assert state.category == Category(label="HELLO", confidence=0.5)
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_expires_entries(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache = SQLiteNodeCache(tmp_path / "node-cache.sqlite", ttl_seconds=5)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    await cache.set("key", "{}")
+    assert await cache.get("key") == "{}"
+    now += 6
+    assert await cache.get("key") is None
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_deletes_expired_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    path = tmp_path / "node-cache.sqlite"
+    cache = SQLiteNodeCache(path, ttl_seconds=5)
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now)
+
+    def stored_keys() -> list[str]:
+        with sqlite3.connect(path) as connection:
+            return [row[0] for row in connection.execute("SELECT key FROM junjo_node_cache ORDER BY key")]
+
+    await cache.set("read", "{}")
+    await cache.set("unread", "{}")
+    now += 6
+    assert await cache.get("read") is None
+    assert stored_keys() == ["unread"]
+
+    await cache.set("fresh", "{}")
+    assert stored_keys() == ["fresh"]
+    cache.close()
+
+
+def test_cached_node_requires_key_fields() -> None:
+    with pytest.raises(TypeError, match="cache_key_fields"):
+        UndeclaredNode(cache=InMemoryNodeCache())
+
+
+def test_cache_options_are_validated() -> None:
+    with pytest.raises(ValueError, match="max_entries"):
+        InMemoryNodeCache(max_entries=0)
+    with pytest.raises(ValueError, match="ttl_seconds"):
+        SQLiteNodeCache(":memory:", ttl_seconds=0)
+
+
+@pytest.mark.asyncio
+async def test_unknown_key_field_fails_the_node() -> None:
+    with pytest.raises(WorkflowExecutionError) as raised:
+        await create_workflow(UnknownFieldNode(cache=InMemoryNodeCache())).execute()
+
+    assert isinstance(raised.value.__cause__, ValueError)
@@ -0,0 +1,216 @@
+import asyncio
+import builtins
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from junjo import (
+    BaseState,
+    BaseStore,
+    Graph,
+    Node,
+    RunConcurrent,
+    Subflow,
+    Workflow,
+    WorkflowExecutionError,
+)
+
+
+class ConcurrencyState(BaseState):
+    started: list[str] = []
+
+
+class ConcurrencyStore(BaseStore[ConcurrencyState]):
+    async def record_start(self, label: str) -> None:
+        async with self.transaction():
+            state = await self.get_state(detached=False)
+            await self.set_state({"started": [*state.started, label]})
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+    async def hold(self) -> None:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            for _ in range(3):
+                await asyncio.sleep(0)
+        finally:
+            self.running -= 1
+
+
+class ProbeNode(Node[ConcurrencyStore]):
+    def __init__(self, label: str, probe: ConcurrencyProbe) -> None:
+        super().__init__()
+        self.label = label
+        self.probe = probe
+
+    @property
+    def name(self) -> str:
+        return self.label
+
+    async def service(self, store: ConcurrencyStore) -> None:
+        await store.record_start(self.label)
+        await self.probe.hold()
+
+
+class FailingProbeNode(ProbeNode):
+    async def service(self, store: ConcurrencyStore) -> None:
+        await super().service(store)
+        raise RuntimeError("boom")
+
+
+class ProbeSubflow(Subflow[ConcurrencyState, ConcurrencyStore, ConcurrencyState, ConcurrencyStore]):
+    async def pre_run_actions(self, parent_store: ConcurrencyStore, subflow_store: ConcurrencyStore) -> None:
+        return None
+
+    async def post_run_actions(self, parent_store: ConcurrencyStore, subflow_store: ConcurrencyStore) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def suppress_prints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(builtins, "print", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+
+    return exporter
+
+
+def create_workflow(
+    items_factory,
+    *,
+    max_concurrency: int | None,
+) -> Workflow[ConcurrencyState, ConcurrencyStore]:
+    def graph_factory() -> Graph:
+        run_concurrent = RunConcurrent(
+            name="Bounded Execution",
+            items=items_factory(),
+            max_concurrency=max_concurrency,
+        )
+        return Graph(source=run_concurrent, sinks=[run_concurrent], edges=[])
+
+    return Workflow[ConcurrencyState, ConcurrencyStore](
+        name="Bounded Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: ConcurrencyStore(initial_state=ConcurrencyState()),
+    )
+
+
+def test_run_concurrent_rejects_non_positive_max_concurrency() -> None:
+    with pytest.raises(ValueError, match="max_concurrency"):
+        RunConcurrent(name="Bounded", items=[ProbeNode("a", ConcurrencyProbe())], max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_max_concurrency_bounds_running_children_in_fifo_order(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    probe = ConcurrencyProbe()
+    labels = [f"child-{index}" for index in range(6)]
+
+    result = await create_workflow(
+        lambda: [ProbeNode(label, probe) for label in labels],
+        max_concurrency=2,
+    ).execute()
+
+    assert probe.peak == 2
+    assert result.state.started == labels
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert spans["Bounded Execution"].attributes["junjo.run_concurrent.max_concurrency"] == 2
+    waits = [spans[label].attributes["junjo.run_concurrent.queue_wait_ms"] for label in labels]
+    assert all(wait >= 0 for wait in waits)
+    assert waits == sorted(waits)
+    assert waits[-1] > waits[0]
+
+
+@pytest.mark.asyncio
+async def test_unbounded_run_concurrent_starts_every_child_without_queue_wait(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    probe = ConcurrencyProbe()
+    labels = [f"child-{index}" for index in range(4)]
+
+    await create_workflow(
+        lambda: [ProbeNode(label, probe) for label in labels],
+        max_concurrency=None,
+    ).execute()
+
+    assert probe.peak == 4
+    for span in span_exporter.get_finished_spans():
+        assert "junjo.run_concurrent.queue_wait_ms" not in span.attributes
+        assert "junjo.run_concurrent.max_concurrency" not in span.attributes
+
+
+@pytest.mark.asyncio
+async def test_bounded_failure_cancels_running_siblings_and_skips_waiting_children(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    probe = ConcurrencyProbe()
+
+    class BlockedNode(ProbeNode):
+        async def service(self, store: ConcurrencyStore) -> None:
+            await store.record_start(self.label)
+            await asyncio.Future()
+
+    with pytest.raises(WorkflowExecutionError) as raised:
+        await create_workflow(
+            lambda: [
+                BlockedNode("blocked", probe),
+                FailingProbeNode("failing", probe),
+                ProbeNode("never-admitted", probe),
+            ],
+            max_concurrency=2,
+        ).execute()
+
+    assert str(raised.value.__cause__) == "boom"
+    assert raised.value.state.started == ["blocked", "failing"]
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert spans["blocked"].attributes["junjo.cancelled_reason"] == "sibling_failed"
+    assert "never-admitted" not in spans
+
+
+@pytest.mark.asyncio
+async def test_subflow_children_record_queue_wait_on_the_subflow_span_only(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    probe = ConcurrencyProbe()
+
+    def subflow(label: str) -> ProbeSubflow:
+        def graph_factory() -> Graph:
+            node = ProbeNode(f"{label}-inner", probe)
+            return Graph(source=node, sinks=[node], edges=[])
+
+        return ProbeSubflow(
+            name=label,
+            graph_factory=graph_factory,
+            store_factory=lambda: ConcurrencyStore(initial_state=ConcurrencyState()),
+        )
+
+    await create_workflow(
+        lambda: [subflow("first"), subflow("second")],
+        max_concurrency=1,
+    ).execute()
+
+    spans = {span.name: span for span in span_exporter.get_finished_spans()}
+    assert "junjo.run_concurrent.queue_wait_ms" in spans["first"].attributes
+    assert "junjo.run_concurrent.queue_wait_ms" in spans["second"].attributes
+    assert "junjo.run_concurrent.queue_wait_ms" not in spans["first-inner"].attributes
+    assert "junjo.run_concurrent.queue_wait_ms" not in spans["second-inner"].attributes
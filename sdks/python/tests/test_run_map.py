@@ -0,0 +1,258 @@
+import asyncio
+import builtins
+
+import pytest
+from opentelemetry import trace
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (
+    InMemorySpanExporter,
+)
+
+from junjo import (
+    BaseState,
+    BaseStore,
+    ExecutionResult,
+    Graph,
+    MapNode,
+    Node,
+    RunMap,
+    Subflow,
+    Workflow,
+    WorkflowExecutionError,
+    current_map_item,
+)
+
+
+class DocumentState(BaseState):
+    documents: list[str] = []
+    summaries: list[str] = []
+
+
+class DocumentStore(BaseStore[DocumentState]):
+    async def set_summaries(self, summaries: list[str]) -> None:
+        await self.set_state({"summaries": summaries})
+
+
+class ItemState(BaseState):
+    document: str = ""
+    summary: str = ""
+
+
+class ItemStore(BaseStore[ItemState]):
+    async def set_document(self, document: str) -> None:
+        await self.set_state({"document": document})
+
+    async def set_summary(self, summary: str) -> None:
+        await self.set_state({"summary": summary})
+
+
+class SummarizeNode(MapNode[DocumentStore, str, str]):
+    def __init__(self) -> None:
+        super().__init__()
+        self.running = 0
+        self.peak = 0
+
+    async def map_item(self, item: str, store: DocumentStore) -> str:
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            # Later documents finish first so merge order must come from the
+            # element order, not completion order.
+            for _ in range(10 - len(item)):
+                await asyncio.sleep(0)
+        finally:
+            self.running -= 1
+        if item == "bad":
+            raise RuntimeError("boom")
+        return item.upper()
+
+
+class SummarizeItemNode(Node[ItemStore]):
+    async def service(self, store: ItemStore) -> None:
+        state = await store.get_state()
+        await store.set_summary(state.document.upper())
+
+
+class SummarizeSubflow(Subflow[ItemState, ItemStore, DocumentState, DocumentStore]):
+    async def pre_run_actions(self, parent_store: DocumentStore, subflow_store: ItemStore) -> None:
+        await subflow_store.set_document(str(current_map_item()))
+
+    async def post_run_actions(self, parent_store: DocumentStore, subflow_store: ItemStore) -> None:
+        return None
+
+
+@pytest.fixture(autouse=True)
+def suppress_prints(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(builtins, "print", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def span_exporter(monkeypatch: pytest.MonkeyPatch) -> InMemorySpanExporter:
+    exporter = InMemorySpanExporter()
+    provider = TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+
+    monkeypatch.setattr(trace, "_TRACER_PROVIDER", provider)
+    monkeypatch.setattr(trace._TRACER_PROVIDER_SET_ONCE, "_done", True)
+
+    return exporter
+
+
+def create_map_workflow(
+    documents: list[str],
+    template_factory=SummarizeNode,
+    *,
+    merge=None,
+    max_concurrency: int | None = 2,
+) -> Workflow[DocumentState, DocumentStore]:
+    async def merge_summaries(store: DocumentStore, results: list) -> None:
+        await store.set_summaries(list(results))
+
+    def graph_factory() -> Graph:
+        run_map = RunMap(
+            name="Summarize Documents",
+            item=template_factory(),
+            select=lambda state: state.documents,
+            merge=merge or merge_summaries,
+            max_concurrency=max_concurrency,
+        )
+        return Graph(source=run_map, sinks=[run_map], edges=[])
+
+    return Workflow[DocumentState, DocumentStore](
+        name="Map Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: DocumentStore(initial_state=DocumentState(documents=documents)),
+    )
+
+
+def test_run_map_requires_a_map_node_or_subflow_template() -> None:
+    with pytest.raises(TypeError, match="MapNode or a Subflow"):
+        RunMap(
+            name="Invalid",
+            item=SummarizeItemNode(),
+            select=lambda state: [],
+            merge=lambda store, results: asyncio.sleep(0),
+        )
+
+
+def test_current_map_item_outside_run_map_raises() -> None:
+    with pytest.raises(RuntimeError, match="RunMap"):
+        current_map_item()
+
+
+@pytest.mark.asyncio
+async def test_map_node_outside_run_map_fails() -> None:
+    node = SummarizeNode()
+    workflow = Workflow[DocumentState, DocumentStore](
+        name="Misplaced Map Node",
+        graph_factory=lambda: Graph(source=node, sinks=[node], edges=[]),
+        store_factory=lambda: DocumentStore(initial_state=DocumentState()),
+    )
+
+    with pytest.raises(WorkflowExecutionError) as raised:
+        await workflow.execute()
+    assert isinstance(raised.value.__cause__, RuntimeError)
+
+
+@pytest.mark.asyncio
+async def test_run_map_processes_each_element_and_merges_once_in_element_order(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    documents = ["a", "bb", "ccc", "dddd", "eeeee"]
+
+    result = await create_map_workflow(documents).execute()
+
+    assert result.state.summaries == [document.upper() for document in documents]
+
+    spans = span_exporter.get_finished_spans()
+    run_map_span = next(span for span in spans if span.name == "Summarize Documents")
+    assert run_map_span.attributes["junjo.run_map.item_count"] == len(documents)
+    assert run_map_span.attributes["junjo.run_concurrent.max_concurrency"] == 2
+    set_state_events = [event for event in run_map_span.events if event.name == "set_state"]
+    assert len(set_state_events) == 1
+    assert set_state_events[0].attributes["junjo.store.action"] == "Summarize Documents"
+
+    element_spans = [span for span in spans if span.name == "SummarizeNode"]
+    assert sorted(span.attributes["junjo.run_map.item_index"] for span in element_spans) == list(range(len(documents)))
+    assert all(span.parent.span_id == run_map_span.context.span_id for span in element_spans)
+
+
+@pytest.mark.asyncio
+async def test_run_map_respects_max_concurrency() -> None:
+    template = SummarizeNode()
+
+    await create_map_workflow(["a", "bb", "ccc", "dddd"], lambda: template, max_concurrency=2).execute()
+
+    assert template.peak == 2
+
+
+@pytest.mark.asyncio
+async def test_run_map_subflow_template_reads_current_item() -> None:
+    def create_subflow() -> SummarizeSubflow:
+        node = SummarizeItemNode()
+        return SummarizeSubflow(
+            graph_factory=lambda: Graph(source=node, sinks=[node], edges=[]),
+            store_factory=lambda: ItemStore(initial_state=ItemState()),
+        )
+
+    async def merge_summaries(store: DocumentStore, results: list[ExecutionResult]) -> None:
+        await store.set_summaries([result.state.summary for result in results])
+
+    result = await create_map_workflow(
+        ["x", "yy", "zzz"],
+        create_subflow,
+        merge=merge_summaries,
+    ).execute()
+
+    assert result.state.summaries == ["X", "YY", "ZZZ"]
+
+
+@pytest.mark.asyncio
+async def test_run_map_failure_skips_merge() -> None:
+    merged: list[list] = []
+
+    async def record_merge(store: DocumentStore, results: list) -> None:
+        merged.append(results)
+
+    workflow = create_map_workflow(["a", "bad", "ccc"], merge=record_merge)
+    with pytest.raises(WorkflowExecutionError) as raised:
+        await workflow.execute()
+
+    assert isinstance(raised.value.__cause__, RuntimeError)
+    assert merged == []
+
+
+@pytest.mark.asyncio
+async def test_run_map_merges_empty_selection() -> None:
+    merged: list[list] = []
+
+    async def record_merge(store: DocumentStore, results: list) -> None:
+        merged.append(results)
+
+    await create_map_workflow([], merge=record_merge).execute()
+
+    assert merged == [[]]
+
+
+@pytest.mark.asyncio
+async def test_run_map_records_a_lambda_merge_under_its_own_name(span_exporter: InMemorySpanExporter) -> None:
+    await create_map_workflow(
+        ["a", "bb"],
+        merge=lambda store, results: store.set_summaries(list(results)),
+    ).execute()
+
+    run_map_span = next(span for span in span_exporter.get_finished_spans() if span.name == "Summarize Documents")
+    actions = [event.attributes["junjo.store.action"] for event in run_map_span.events if event.name == "set_state"]
+    assert actions == ["Summarize Documents"]
+
+
+@pytest.mark.asyncio
+async def test_run_map_counts_its_template_once_per_execution_not_per_element() -> None:
+    documents = [f"document {index}" for index in range(150)]
+    template = SummarizeNode()
+
+    result = await create_map_workflow(documents, lambda: template, max_concurrency=None).execute()
+
+    assert len(result.state.summaries) == len(documents)
+    assert result.node_execution_counts[template.id] == 1
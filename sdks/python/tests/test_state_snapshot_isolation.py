@@ -2,7 +2,7 @@ import builtins
 
 import pytest
 
-from junjo import BaseState, BaseStore, Graph, Node, Workflow
+from junjo import BaseState, BaseStore, Condition, Edge, Graph, Node, Workflow
 
 
 class SnapshotState(BaseState):
@@ -78,3 +78,88 @@ async def test_execution_result_state_is_detached_from_internal_store_snapshot()
 
     assert internal_state_after.items == [1]
     assert internal_state_after.metadata == {"status": "ready"}
+
+
+class RevisionState(BaseState):
+    items: list[int]
+    metadata: dict[str, str]
+    count: int = 0
+
+
+class RevisionStore(BaseStore[RevisionState]):
+    async def set_count(self, count: int) -> None:
+        await self.set_state({"count": count})
+
+
+@pytest.mark.asyncio
+async def test_shared_snapshot_is_a_stable_view_of_its_revision() -> None:
+    store = RevisionStore(
+        initial_state=RevisionState(items=[1, 2], metadata={"status": "ready"}),
+    )
+
+    before = await store.get_state(detached=False)
+    await store.set_count(1)
+    after = await store.get_state(detached=False)
+
+    assert before.count == 0
+    assert after.count == 1
+    assert before.metadata == after.metadata == {"status": "ready"}
+
+    # Attribute assignment on a shared snapshot never reaches the live store.
+    after.count = 99
+    assert (await store.get_state()).count == 1
+
+    detached = await store.get_state()
+    assert detached.metadata is not after.metadata
+    assert detached.metadata == after.metadata
+
+
+class MutatingCondition(Condition[SnapshotState]):
+    def evaluate(self, state: SnapshotState) -> bool:
+        state.items.append(99)
+        state.metadata["status"] = "leaked"
+        return True
+
+
+class NoopNode(Node[SnapshotStore]):
+    async def service(self, store: SnapshotStore) -> None:
+        return None
+
+
+@pytest.mark.asyncio
+async def test_mutating_edge_condition_cannot_change_the_live_store() -> None:
+    store = SnapshotStore(initial_state=SnapshotState(items=[1], metadata={"status": "ready"}))
+    first = NoopNode()
+    second = NoopNode()
+
+    assert await Edge(tail=first, head=second, condition=MutatingCondition()).next_node(store) is second
+
+    assert (await store.get_state()).items == [1]
+    assert (await store._get_store_owner_evidence()).reconstructable is True
+
+
+@pytest.mark.asyncio
+async def test_mutating_condition_during_traversal_cannot_change_the_live_store() -> None:
+    created_stores: list[SnapshotStore] = []
+
+    def create_store() -> SnapshotStore:
+        store = SnapshotStore(initial_state=SnapshotState(items=[1], metadata={"status": "ready"}))
+        created_stores.append(store)
+        return store
+
+    first = NoopNode()
+    second = NoopNode()
+    workflow = Workflow[SnapshotState, SnapshotStore](
+        graph_factory=lambda: Graph(
+            source=first,
+            sinks=[second],
+            edges=[Edge(tail=first, head=second, condition=MutatingCondition())],
+        ),
+        store_factory=create_store,
+    )
+
+    result = await workflow.execute()
+
+    assert result.state.items == [1]
+    assert result.state.metadata == {"status": "ready"}
+    assert (await created_stores[0]._get_store_owner_evidence()).reconstructable is True
@@ -1,7 +1,7 @@
 import asyncio
 
 import pytest
-from pydantic import model_validator
+from pydantic import field_validator, model_validator
 
 from junjo import BaseState, BaseStore
 
@@ -25,6 +25,28 @@ class MeetingWindowStore(BaseStore[MeetingWindowState]):
         await self.set_state({"end_time": end_time})
 
 
+DOCUMENT_VALIDATIONS: list[int] = []
+
+
+class DocumentState(BaseState):
+    title: str = ""
+    documents: list[str] = []
+
+    @field_validator("documents")
+    @classmethod
+    def count_document_validation(cls, documents: list[str]) -> list[str]:
+        DOCUMENT_VALIDATIONS.append(len(documents))
+        return documents
+
+
+class DocumentStore(BaseStore[DocumentState]):
+    async def set_title(self, title: object) -> None:
+        await self.set_state({"title": title})
+
+    async def set_fields(self, update: dict) -> None:
+        await self.set_state(update)
+
+
 @pytest.mark.asyncio
 async def test_set_state_validates_against_locked_current_state() -> None:
     store = MeetingWindowStore(
@@ -56,3 +78,56 @@ async def test_set_state_validates_against_locked_current_state() -> None:
     current_state = await store.get_state()
     assert current_state.start_time == 4
     assert current_state.end_time == 5
+
+
+@pytest.mark.asyncio
+async def test_partial_validation_skips_untouched_fields_and_full_mode_revalidates() -> None:
+    documents = [f"doc-{index}" for index in range(100)]
+    partial = DocumentStore(DocumentState(documents=documents))
+    full = DocumentStore(DocumentState(documents=documents), state_validation="full")
+    DOCUMENT_VALIDATIONS.clear()
+
+    await partial.set_title("partial")
+    assert DOCUMENT_VALIDATIONS == []
+
+    await full.set_title("partial")
+    assert DOCUMENT_VALIDATIONS == [100]
+
+    assert await partial.get_state() == await full.get_state()
+    assert (await partial._get_store_owner_evidence()).state_end == (await full._get_store_owner_evidence()).state_end
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("state_validation", ["partial", "full"])
+async def test_partial_validation_rejects_what_full_validation_rejects(state_validation: str) -> None:
+    store = DocumentStore(DocumentState(title="kept"), state_validation=state_validation)
+
+    with pytest.raises(ValueError):
+        await store.set_title(["not", "a", "title"])
+    with pytest.raises(ValueError):
+        await store.set_fields({"title": "changed", "unknown": 1})
+
+    assert (await store.get_state()).title == "kept"
+    assert (await store._get_store_owner_evidence()).transition_count == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("state_validation", ["partial", "full"])
+async def test_model_validators_judge_only_the_merged_state(state_validation: str) -> None:
+    store = MeetingWindowStore(
+        MeetingWindowState(start_time=1, end_time=5),
+        state_validation=state_validation,
+    )
+
+    with pytest.raises(ValueError):
+        await store.set_start_time(6)
+
+    # Each intermediate single-field state would be invalid.
+    await store.set_state({"start_time": 10, "end_time": 12})
+    state = await store.get_state()
+    assert (state.start_time, state.end_time) == (10, 12)
+
+
+def test_store_rejects_unknown_state_validation_mode() -> None:
+    with pytest.raises(ValueError):
+        DocumentStore(DocumentState(), state_validation="lazy")  # type: ignore[arg-type]
@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import time
+from collections.abc import Callable
+from typing import Any
 
+import jsonpatch
 import pytest
 from opentelemetry import trace
 from opentelemetry.exporter.otlp.proto.common.trace_encoder import encode_spans
 from opentelemetry.sdk.trace import TracerProvider
 from opentelemetry.sdk.trace.export import SimpleSpanProcessor
 from opentelemetry.sdk.trace.export.in_memory_span_exporter import InMemorySpanExporter
-from pydantic import field_serializer
+from pydantic import field_serializer, field_validator
 
-from junjo import BaseState, BaseStore, Edge, Graph, Node, Workflow
+from junjo import BaseState, BaseStore, Edge, Graph, Hooks, Node, Workflow, store_action
 
 
 class State(BaseState):
@@ -32,6 +37,61 @@ class Store(BaseStore[State]):
         await self.set_state({"hidden_projection": state.hidden_projection + 1})
 
 
+class DeclaredActionStore(BaseStore[State]):
+    @store_action
+    async def set_visible(self, value: int) -> None:
+        await self._commit_visible(value)
+
+    @store_action(name="reveal")
+    async def increment_visible(self) -> None:
+        state = await self.get_state()
+        await self.set_state({"visible": state.visible + 1})
+
+    @store_action
+    async def copy_visible_to(self, other: Store) -> None:
+        state = await self.get_state()
+        await other.set_state({"visible": state.visible})
+
+    async def _commit_visible(self, value: int) -> None:
+        await self.set_state({"visible": value})
+
+
+class BatchState(BaseState):
+    count: int = 0
+    label: str = ""
+    tags: list[str] = []
+
+
+class BatchStore(BaseStore[BatchState]):
+    @store_action
+    async def increment(self) -> None:
+        state = await self.get_state()
+        await self.set_state({"count": state.count + 1})
+
+    @store_action
+    async def set_label(self, label: str) -> None:
+        await self.set_state({"label": label})
+
+    @store_action
+    async def add_tag(self, tag: str) -> None:
+        state = await self.get_state()
+        await self.set_state({"tags": [*state.tags, tag]})
+
+    @store_action
+    async def record_batch(self) -> None:
+        async with self.transaction():
+            await self.increment()
+            await self.increment()
+            await self.set_label("batched")
+            await self.add_tag("first")
+            await self.add_tag("second")
+
+
+class BatchNode(Node[BatchStore]):
+    async def service(self, store: BatchStore) -> None:
+        await store.record_batch()
+
+
 class NoopNode(Node[Store]):
     async def service(self, store: Store) -> None:
         await store.record_noop()
@@ -254,3 +314,347 @@ async def test_workflow_store_portable_integer_limit_survives_otlp_encoding(
     assert json.loads(owner.attributes["junjo.workflow.state.end"])["value"] == (9_007_199_254_740_991)
     encoded = encode_spans(span_exporter.get_finished_spans())
     assert encoded.SerializeToString()
+
+
+class ConversationState(BaseState):
+    messages: list[dict[str, str]] = []
+    archived: list[dict[str, str]] = []
+    title: str = ""
+    turns: int = 0
+
+
+class ConversationStore(BaseStore[ConversationState]):
+    async def apply(self, update: dict) -> None:
+        await self.set_state(update)
+
+    async def append(self, messages: list[dict[str, str]], update: dict | None = None) -> None:
+        await self._append_state({"messages": messages}, update)
+
+
+class CheckedConversationState(BaseState):
+    messages: list[str] = []
+
+    @field_validator("messages")
+    @classmethod
+    def no_blank_messages(cls, messages: list[str]) -> list[str]:
+        if any(not message for message in messages):
+            raise ValueError("blank message")
+        return messages
+
+
+class CheckedConversationStore(BaseStore[CheckedConversationState]):
+    async def append(self, message: str) -> None:
+        await self._append_state({"messages": [message]})
+
+
+@pytest.mark.asyncio
+async def test_field_scoped_transition_patch_matches_complete_projection_diff(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    store = ConversationStore(
+        ConversationState(
+            messages=[{"role": "user", "text": f"m{index}"} for index in range(5)],
+            title="start",
+        )
+    )
+    updates = [
+        {"turns": 1},
+        {"messages": [*(await store.get_state()).messages, {"role": "assistant", "text": "reply"}]},
+        {"messages": [{"role": "user", "text": "m4"}], "archived": [{"role": "user", "text": "m0"}]},
+        {"title": "start"},
+        {"title": "renamed", "turns": 2},
+    ]
+
+    expected_patches = []
+    with trace.get_tracer("test").start_as_current_span("store-owner"):
+        for update in updates:
+            before = (await store.get_state()).model_dump(mode="json")
+            await store.apply(update)
+            after = (await store.get_state()).model_dump(mode="json")
+            expected_patches.append(jsonpatch.make_patch(before, after).patch)
+
+    (owner,) = span_exporter.get_finished_spans()
+    assert [json.loads(event.attributes["junjo.state_json_patch"]) for event in owner.events] == expected_patches
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.transition_count == len(updates)
+    assert evidence.revision_end == len(updates) - 1
+    assert evidence.reconstructable is True
+
+
+@pytest.mark.asyncio
+async def test_append_records_add_operations_without_dumping_the_list(
+    monkeypatch: pytest.MonkeyPatch,
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    store = ConversationStore(ConversationState(messages=[{"role": "user", "text": "m0"}]))
+
+    with trace.get_tracer("test").start_as_current_span("store-owner"):
+        await store.append([{"role": "assistant", "text": "m1"}], {"turns": 1})
+        before = (await store.get_state()).model_dump(mode="json")
+
+        dumped_fields: list[object] = []
+        model_dump = ConversationState.model_dump
+
+        def recording_dump(self: ConversationState, **kwargs: Any) -> dict[str, Any]:
+            dumped_fields.append(kwargs.get("include"))
+            return model_dump(self, **kwargs)
+
+        with monkeypatch.context() as patched:
+            patched.setattr(ConversationState, "model_dump", recording_dump)
+            await store.append([{"role": "user", "text": "m2"}, {"role": "assistant", "text": "m3"}])
+        after = (await store.get_state()).model_dump(mode="json")
+
+    (owner,) = span_exporter.get_finished_spans()
+    patches = [json.loads(event.attributes["junjo.state_json_patch"]) for event in owner.events]
+    assert patches[0] == [
+        {"op": "replace", "path": "/turns", "value": 1},
+        {"op": "add", "path": "/messages/1", "value": {"role": "assistant", "text": "m1"}},
+    ]
+    assert patches[1] == jsonpatch.make_patch(before, after).patch
+    # Neither the existing messages nor the complete state were serialized.
+    assert dumped_fields == [set()]
+    assert [message["text"] for message in after["messages"]] == ["m0", "m1", "m2", "m3"]
+    assert store._telemetry_evidence.current_projection() == after
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.revision_end == 2
+    assert evidence.reconstructable is True
+
+
+@pytest.mark.asyncio
+async def test_append_validates_new_items_and_falls_back_for_checked_fields() -> None:
+    store = ConversationStore(ConversationState())
+    with pytest.raises(ValueError, match="Invalid state update"):
+        await store.append([{"role": "user", "text": 1}])  # type: ignore[dict-item]
+    assert (await store.get_state()).messages == []
+    assert await store._get_store_revision() == 0
+
+    checked = CheckedConversationStore(CheckedConversationState())
+    await checked.append("hello")
+    with pytest.raises(ValueError, match="blank message"):
+        await checked.append("")
+
+    assert (await checked.get_state()).messages == ["hello"]
+    transition = checked._telemetry_evidence.retained_transitions[0]
+    assert transition.patch == ({"op": "add", "path": "/messages/0", "value": "hello"},)
+
+
+@pytest.mark.asyncio
+async def test_append_cost_benchmark(record_property: Callable[[str, object], None]) -> None:
+    async def commit_cost(length: int, *, append: bool) -> float:
+        messages = [{"role": "user", "text": f"m{index}"} for index in range(length)]
+        store = ConversationStore(ConversationState(messages=messages))
+        new_message = {"role": "assistant", "text": "reply"}
+        started = time.perf_counter()
+        for _ in range(20):
+            if append:
+                await store.append([new_message])
+            else:
+                state = await store.get_state(detached=False)
+                await store.apply({"messages": [*state.messages, new_message]})
+        return (time.perf_counter() - started) / 20
+
+    for length in (100, 5_000):
+        replaced = await commit_cost(length, append=False)
+        appended = await commit_cost(length, append=True)
+        # The append path still copies item references into a new list, so its
+        # cost is measured at both lengths rather than assumed constant.
+        record_property(f"commit_us_replace_{length}_messages", round(replaced * 1_000_000, 1))
+        record_property(f"commit_us_append_{length}_messages", round(appended * 1_000_000, 1))
+
+
+@pytest.mark.asyncio
+async def test_cached_projection_tracks_live_state_and_terminal_evidence() -> None:
+    store = ConversationStore(ConversationState(title="start"))
+    await store.apply({"messages": [{"role": "user", "text": "hello"}]})
+    await store.apply({"turns": 1, "title": "renamed"})
+    await store.apply({"turns": 1})
+
+    live_projection = (await store.get_state()).model_dump(mode="json")
+    assert store._telemetry_evidence.current_projection() == live_projection
+    assert store._telemetry_evidence.current_projection({"turns"}) == {"turns": 1}
+
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.state_end == live_projection
+    assert evidence.revision_end == 2
+    assert evidence.reconstructable is True
+
+
+@pytest.mark.parametrize("verification", ["incremental", "replay"])
+@pytest.mark.asyncio
+async def test_live_state_changed_outside_the_recorded_transitions_is_not_reconstructable(
+    verification: str,
+) -> None:
+    store = ConversationStore(ConversationState(), evidence_verification=verification)
+    await store.apply({"messages": [{"role": "user", "text": "hello"}]})
+
+    shared = await store.get_state(detached=False)
+    shared.messages.append({"role": "user", "text": "unrecorded"})
+
+    evidence = await store._get_store_owner_evidence()
+    assert len(evidence.state_end["messages"]) == 2
+    assert evidence.reconstructable is False
+
+
+@pytest.mark.parametrize("verification", ["incremental", "replay"])
+@pytest.mark.asyncio
+async def test_store_evidence_verification_modes_reconstruct_long_runs(verification: str) -> None:
+    store = ConversationStore(ConversationState(), evidence_verification=verification)
+    for turn in range(1, 201):
+        state = await store.get_state()
+        await store.apply(
+            {
+                "messages": [*state.messages[-5:], {"role": "user", "text": f"m{turn}"}],
+                "turns": turn,
+            }
+        )
+
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.transition_count == 200
+    assert evidence.revision_end == 200
+    assert evidence.reconstructable is True
+    assert len(store._telemetry_evidence.retained_transitions) == 200
+
+
+@pytest.mark.asyncio
+async def test_bounded_transition_retention_keeps_complete_evidence() -> None:
+    store = ConversationStore(ConversationState(), max_retained_transitions=3)
+    for turn in range(1, 11):
+        await store.apply({"turns": turn})
+
+    retained = store._telemetry_evidence.retained_transitions
+    assert [transition.sequence for transition in retained] == [8, 9, 10]
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.transition_count == 10
+    assert evidence.revision_end == 10
+    assert evidence.state_end["turns"] == 10
+    assert evidence.reconstructable is True
+
+
+def test_replay_verification_rejects_bounded_retention() -> None:
+    with pytest.raises(ValueError):
+        ConversationStore(
+            ConversationState(),
+            evidence_verification="replay",
+            max_retained_transitions=10,
+        )
+
+
+@pytest.mark.asyncio
+async def test_incremental_verification_detects_divergent_replica() -> None:
+    store = ConversationStore(ConversationState())
+    await store.apply({"turns": 1})
+    store._telemetry_evidence._replica["turns"] = 2
+
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.reconstructable is False
+
+
+@pytest.mark.asyncio
+async def test_declared_store_actions_name_transitions_and_events_have_sequence_ids(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    store = DeclaredActionStore(State())
+    other = Store(State())
+    tracer = trace.get_tracer("test")
+    with tracer.start_as_current_span("owner"):
+        await store.set_visible(1)
+        await store.increment_visible()
+        await store.copy_visible_to(other)
+
+    events = [event for span in span_exporter.get_finished_spans() for event in span.events]
+    assert [(event.attributes["junjo.store.id"], event.attributes["junjo.store.action"]) for event in events] == [
+        (store.id, "set_visible"),
+        (store.id, "reveal"),
+        (other.id, "copy_visible_to"),
+    ]
+    assert [event.attributes["id"] for event in events] == [
+        f"{store.id}:1",
+        f"{store.id}:2",
+        f"{other.id}:1",
+    ]
+    assert (await other.get_state()).visible == 2
+
+
+def test_store_action_rejects_sync_methods_and_empty_names() -> None:
+    with pytest.raises(TypeError):
+        store_action(lambda self: None)  # type: ignore[arg-type]
+    with pytest.raises(ValueError):
+        store_action(name="")
+
+
+@pytest.mark.asyncio
+async def test_transaction_commits_staged_updates_as_one_revision_patch_event_and_hook(
+    span_exporter: InMemorySpanExporter,
+) -> None:
+    hooks = Hooks()
+    state_events = []
+    hooks.on_state_changed(state_events.append)
+
+    def graph_factory() -> Graph:
+        node = BatchNode()
+        return Graph(source=node, sinks=[node], edges=[])
+
+    result = await Workflow(
+        name="Batch Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: BatchStore(BatchState()),
+        hooks=hooks,
+    ).execute()
+
+    spans = span_exporter.get_finished_spans()
+    owner = next(span for span in spans if span.attributes.get("junjo.span_type") == "workflow")
+    events = [event for span in spans for event in span.events if event.name == "set_state"]
+    assert result.state == BatchState(count=2, label="batched", tags=["first", "second"])
+    assert len(events) == 1
+    assert events[0].attributes["junjo.store.action"] == "record_batch"
+    assert events[0].attributes["junjo.store.revision.after"] == 1
+    assert owner.attributes["junjo.store.transition.count"] == 1
+    assert owner.attributes["junjo.store.reconstructable"] is True
+    patch = json.loads(events[0].attributes["junjo.state_json_patch"])
+    assert jsonpatch.apply_patch(json.loads(owner.attributes["junjo.workflow.state.start"]), patch) == json.loads(
+        owner.attributes["junjo.workflow.state.end"]
+    )
+    assert [event.action_name for event in state_events] == ["record_batch"]
+
+
+@pytest.mark.asyncio
+async def test_transaction_discards_staged_updates_on_error_or_invalid_result() -> None:
+    store = BatchStore(BatchState())
+
+    with pytest.raises(RuntimeError):
+        async with store.transaction():
+            await store.increment()
+            assert (await store.get_state()).count == 1
+            raise RuntimeError("abort")
+
+    with pytest.raises(ValueError):
+        async with store.transaction():
+            await store.set_label("valid")
+            await store.set_state({"count": "not a number"})
+
+    assert await store.get_state() == BatchState()
+    evidence = await store._get_store_owner_evidence()
+    assert evidence.transition_count == 0
+    assert evidence.revision_end == 0
+
+
+@pytest.mark.asyncio
+async def test_transaction_is_atomic_with_respect_to_concurrent_commits() -> None:
+    store = BatchStore(BatchState())
+    staged = asyncio.Event()
+
+    async def batch() -> None:
+        async with store.transaction():
+            await store.increment()
+            staged.set()
+            await asyncio.sleep(0)
+            await store.increment()
+
+    async def concurrent_increment() -> None:
+        await staged.wait()
+        await store.increment()
+
+    await asyncio.gather(batch(), concurrent_increment())
+
+    assert (await store.get_state()).count == 3
+    assert (await store._get_store_owner_evidence()).transition_count == 2
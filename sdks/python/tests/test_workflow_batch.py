@@ -0,0 +1,250 @@
+import asyncio
+from collections.abc import Callable
+
+import pytest
+
+from junjo import (
+    BaseState,
+    BaseStore,
+    Graph,
+    Hooks,
+    Node,
+    Workflow,
+    WorkflowBatchItem,
+    WorkflowCancelledError,
+    WorkflowExecutionError,
+)
+
+
+class EvalState(BaseState):
+    value: int = 0
+    doubled: int = 0
+
+
+class EvalStore(BaseStore[EvalState]):
+    async def set_doubled(self, doubled: int) -> None:
+        await self.set_state({"doubled": doubled})
+
+
+class ConcurrencyProbe:
+    def __init__(self) -> None:
+        self.running = 0
+        self.peak = 0
+
+
+class DoubleNode(Node[EvalStore]):
+    def __init__(self, probe: ConcurrencyProbe) -> None:
+        super().__init__()
+        self.probe = probe
+
+    async def service(self, store: EvalStore) -> None:
+        self.probe.running += 1
+        self.probe.peak = max(self.probe.peak, self.probe.running)
+        try:
+            state = await store.get_state()
+            # Larger values finish first, so completion order differs from
+            # input order.
+            for _ in range(10 - state.value):
+                await asyncio.sleep(0)
+            if state.value == -2:
+                raise asyncio.CancelledError("run cancelled itself")
+            if state.value < 0:
+                raise ValueError("negative input")
+            await store.set_doubled(state.value * 2)
+        finally:
+            self.probe.running -= 1
+
+
+def create_workflow(probe: ConcurrencyProbe, *, hooks: Hooks | None = None) -> Workflow[EvalState, EvalStore]:
+    def graph_factory() -> Graph:
+        node = DoubleNode(probe)
+        return Graph(source=node, sinks=[node], edges=[])
+
+    return Workflow[EvalState, EvalStore](
+        name="Eval Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: EvalStore(initial_state=EvalState()),
+        hooks=hooks,
+    )
+
+
+def store_for(value: int) -> EvalStore:
+    return EvalStore(initial_state=EvalState(value=value))
+
+
+async def collect(batch) -> list[WorkflowBatchItem[int, EvalState]]:
+    return [item async for item in batch]
+
+
+@pytest.mark.asyncio
+async def test_execute_many_streams_every_result_with_bounded_concurrency() -> None:
+    probe = ConcurrencyProbe()
+    batch = create_workflow(probe).execute_many(range(6), store_factory=store_for, max_concurrency=3)
+
+    assert batch.stats is None
+    items = await collect(batch)
+
+    assert sorted(item.index for item in items) == list(range(6))
+    assert [item.index for item in items] != list(range(6))
+    assert all(item.error is None for item in items)
+    assert {item.input: item.result.state.doubled for item in items if item.result is not None} == {
+        value: value * 2 for value in range(6)
+    }
+    assert probe.peak == 3
+    assert batch.stats is not None
+    assert (batch.stats.item_count, batch.stats.succeeded_count, batch.stats.failed_count) == (6, 6, 0)
+    assert batch.stats.items_per_second > 0
+
+
+@pytest.mark.asyncio
+async def test_execute_many_isolates_failures_per_input() -> None:
+    def failing_store_for(value: int) -> EvalStore:
+        if value == 99:
+            raise RuntimeError("store unavailable")
+        return store_for(value)
+
+    batch = create_workflow(ConcurrencyProbe()).execute_many(
+        [1, -1, 2, 99, 3],
+        store_factory=failing_store_for,
+        max_concurrency=2,
+    )
+    items = {item.input: item for item in await collect(batch)}
+
+    assert isinstance(items[-1].error, WorkflowExecutionError)
+    assert isinstance(items[-1].error.__cause__, ValueError)
+    assert items[-1].result is None
+    assert isinstance(items[99].error, RuntimeError)
+    assert [items[value].result.state.doubled for value in (1, 2, 3)] == [2, 4, 6]
+    assert batch.stats is not None
+    assert (batch.stats.succeeded_count, batch.stats.failed_count) == (3, 2)
+
+
+@pytest.mark.asyncio
+async def test_execute_many_reads_hooks_once_per_batch(monkeypatch: pytest.MonkeyPatch) -> None:
+    hooks = Hooks()
+    completed: list[str] = []
+    hooks.on_workflow_completed(lambda event: completed.append(event.run_id))
+    snapshots: list[object] = []
+    original_snapshot = Hooks._snapshot
+
+    def recording_snapshot(self):
+        snapshots.append(self)
+        return original_snapshot(self)
+
+    monkeypatch.setattr(Hooks, "_snapshot", recording_snapshot)
+
+    await collect(create_workflow(ConcurrencyProbe(), hooks=hooks).execute_many(range(4), store_factory=store_for))
+
+    assert len(snapshots) == 1
+    assert len(set(completed)) == 4
+
+
+@pytest.mark.asyncio
+async def test_leaving_the_batch_early_cancels_runs_in_flight() -> None:
+    probe = ConcurrencyProbe()
+    admitted: list[int] = []
+
+    def recording_store_for(value: int) -> EvalStore:
+        admitted.append(value)
+        return store_for(value)
+
+    batch = create_workflow(probe).execute_many(range(100), store_factory=recording_store_for, max_concurrency=4)
+    iterator = aiter(batch)
+    first = await anext(iterator)
+    await iterator.aclose()
+
+    assert first.error is None
+    assert probe.running == 0
+    assert len(admitted) <= 5
+    assert batch.stats is not None
+    assert batch.stats.item_count == 1
+
+
+@pytest.mark.asyncio
+async def test_async_with_cancels_runs_in_flight_when_the_loop_breaks() -> None:
+    probe = ConcurrencyProbe()
+
+    async with create_workflow(probe).execute_many(range(100), store_factory=store_for, max_concurrency=4) as batch:
+        async for item in batch:
+            assert item.error is None
+            break
+
+    assert probe.running == 0
+    assert batch.stats is not None
+    assert batch.stats.item_count == 1
+    with pytest.raises(RuntimeError, match="once"):
+        aiter(batch)
+
+
+@pytest.mark.asyncio
+async def test_closing_a_batch_before_iteration_reports_empty_stats() -> None:
+    batch = create_workflow(ConcurrencyProbe()).execute_many(range(3), store_factory=store_for)
+
+    await batch.aclose()
+
+    assert batch.stats is not None
+    assert (batch.stats.item_count, batch.stats.elapsed_seconds) == (0, 0.0)
+    with pytest.raises(RuntimeError, match="once"):
+        aiter(batch)
+
+
+@pytest.mark.asyncio
+async def test_a_run_that_cancels_itself_is_a_failed_item() -> None:
+    batch = create_workflow(ConcurrencyProbe()).execute_many([1, -2, 3], store_factory=store_for, max_concurrency=3)
+    items = {item.input: item for item in await collect(batch)}
+
+    assert isinstance(items[-2].error, WorkflowCancelledError)
+    assert items[-2].result is None
+    assert [items[value].result.state.doubled for value in (1, 3)] == [2, 6]
+    assert batch.stats is not None
+    assert (batch.stats.succeeded_count, batch.stats.failed_count) == (2, 1)
+
+
+@pytest.mark.asyncio
+async def test_cancelling_a_consumer_inside_async_with_cancels_runs_and_sets_stats() -> None:
+    probe = ConcurrencyProbe()
+    batch = create_workflow(probe).execute_many(range(100), store_factory=store_for, max_concurrency=4)
+    consumed: list[int] = []
+
+    async def consume() -> None:
+        async with batch:
+            async for item in batch:
+                consumed.append(item.index)
+                await asyncio.Event().wait()
+
+    consumer = asyncio.create_task(consume())
+    while not consumed:
+        await asyncio.sleep(0)
+    consumer.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await consumer
+
+    assert probe.running == 0
+    assert batch.stats is not None
+    assert batch.stats.item_count == 1
+
+
+def test_execute_many_rejects_invalid_options() -> None:
+    workflow = create_workflow(ConcurrencyProbe())
+
+    with pytest.raises(ValueError, match="max_concurrency"):
+        workflow.execute_many([], store_factory=store_for, max_concurrency=0)
+
+
+@pytest.mark.asyncio
+async def test_batch_can_only_be_iterated_once() -> None:
+    batch = create_workflow(ConcurrencyProbe()).execute_many([], store_factory=store_for)
+
+    assert await collect(batch) == []
+    with pytest.raises(RuntimeError, match="once"):
+        aiter(batch)
+
+
+@pytest.mark.asyncio
+async def test_execute_many_throughput(record_property: Callable[[str, object], None]) -> None:
+    batch = create_workflow(ConcurrencyProbe()).execute_many(range(200), store_factory=store_for, max_concurrency=32)
+    await collect(batch)
+
+    assert batch.stats is not None
+    assert batch.stats.succeeded_count == 200
+    record_property("execute_many_runs_per_second", round(batch.stats.items_per_second))
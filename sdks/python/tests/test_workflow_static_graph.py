@@ -0,0 +1,138 @@
+import time
+from collections.abc import Callable
+
+import pytest
+
+from junjo import BaseState, BaseStore, Edge, Graph, Node, Subflow, Workflow
+from junjo.graph import GraphValidationError
+
+
+class CounterState(BaseState):
+    count: int = 0
+
+
+class CounterStore(BaseStore[CounterState]):
+    async def increment(self) -> None:
+        state = await self.get_state(detached=False)
+        await self.set_state({"count": state.count + 1})
+
+
+class IncrementNode(Node[CounterStore]):
+    async def service(self, store: CounterStore) -> None:
+        await store.increment()
+
+
+class CountingSubflow(Subflow[CounterState, CounterStore, CounterState, CounterStore]):
+    async def pre_run_actions(self, parent_store: CounterStore, subflow_store: CounterStore) -> None:
+        return None
+
+    async def post_run_actions(self, parent_store: CounterStore, subflow_store: CounterStore) -> None:
+        await parent_store.increment()
+
+
+class GraphFactoryCounter:
+    def __init__(self, node_count: int = 3) -> None:
+        self.node_count = node_count
+        self.calls = 0
+
+    def __call__(self) -> Graph:
+        self.calls += 1
+        nodes = [IncrementNode() for _ in range(self.node_count)]
+        return Graph(
+            source=nodes[0],
+            sinks=[nodes[-1]],
+            edges=[Edge(tail=tail, head=head) for tail, head in zip(nodes, nodes[1:], strict=False)],
+        )
+
+
+def create_workflow(graph_factory: Callable[[], Graph], *, static_graph: bool) -> Workflow[CounterState, CounterStore]:
+    return Workflow[CounterState, CounterStore](
+        name="Counter Workflow",
+        graph_factory=graph_factory,
+        store_factory=lambda: CounterStore(initial_state=CounterState()),
+        static_graph=static_graph,
+    )
+
+
+@pytest.mark.asyncio
+async def test_static_graph_builds_and_compiles_once(monkeypatch: pytest.MonkeyPatch) -> None:
+    factory = GraphFactoryCounter()
+    workflow = create_workflow(factory, static_graph=True)
+    validations: list[Graph] = []
+    original_validate = Graph.validate
+
+    def recording_validate(self) -> None:
+        validations.append(self)
+        original_validate(self)
+
+    monkeypatch.setattr(Graph, "validate", recording_validate)
+
+    results = [await workflow.execute() for _ in range(3)]
+
+    assert workflow.static_graph
+    assert factory.calls == 1
+    assert len(validations) == 1
+    assert [result.state.count for result in results] == [3, 3, 3]
+
+
+@pytest.mark.asyncio
+async def test_default_workflow_builds_a_fresh_graph_per_run() -> None:
+    factory = GraphFactoryCounter()
+    workflow = create_workflow(factory, static_graph=False)
+
+    await workflow.execute()
+    await workflow.execute()
+
+    assert not workflow.static_graph
+    assert factory.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_static_graph_validates_later_runs_that_request_validation() -> None:
+    node = IncrementNode()
+    unreachable = IncrementNode()
+    workflow = create_workflow(
+        lambda: Graph(source=node, sinks=[node, unreachable], edges=[]),
+        static_graph=True,
+    )
+
+    await workflow.execute(validate_graph=False)
+    with pytest.raises(GraphValidationError):
+        await workflow.execute()
+
+
+@pytest.mark.asyncio
+async def test_static_subflow_graph_is_shared_with_parent_compilation() -> None:
+    subflow_factory = GraphFactoryCounter(node_count=2)
+    subflow = CountingSubflow(
+        graph_factory=subflow_factory,
+        store_factory=lambda: CounterStore(initial_state=CounterState()),
+        static_graph=True,
+    )
+    workflow = create_workflow(
+        lambda: Graph(source=subflow, sinks=[subflow], edges=[]),
+        static_graph=False,
+    )
+
+    for _ in range(3):
+        result = await workflow.execute()
+        assert result.state.count == 1
+
+    assert subflow_factory.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_static_graph_setup_benchmark(record_property: Callable[[str, object], None]) -> None:
+    async def best_run_seconds(workflow: Workflow[CounterState, CounterStore]) -> float:
+        await workflow.execute()
+        best = float("inf")
+        for _ in range(5):
+            started = time.perf_counter()
+            await workflow.execute()
+            best = min(best, time.perf_counter() - started)
+        return best
+
+    fresh = await best_run_seconds(create_workflow(GraphFactoryCounter(node_count=40), static_graph=False))
+    static = await best_run_seconds(create_workflow(GraphFactoryCounter(node_count=40), static_graph=True))
+    record_property("run_ms_fresh_graph", round(fresh * 1000, 3))
+    record_property("run_ms_static_graph", round(static * 1000, 3))